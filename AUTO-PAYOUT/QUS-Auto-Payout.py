@@ -7,13 +7,27 @@ import logging
 from datetime import datetime
 import threading
 from queue import Queue
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import psutil
 import os
 import json
 import random
+import sqlite3
+import uuid
+import argparse
+import functools
+import math
+import asyncio
+import tempfile
 import requests  # For API calls to get latest tick
+try:
+    import aiohttp  # Optional, async RPC calls for the asyncio engine
+except ImportError:
+    aiohttp = None
 import re  # For regex to extract hash from output
-import pandas as pd  # For Excel file handling (optional)
+import csv
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Configuration
 NODES = [
@@ -29,11 +43,102 @@ DEFAULT_SEED = "SEED"
 DEFAULT_ADDRESS = "WLT"
 
 # Tick advance - schedule transactions this many ticks ahead of current
+# (the starting value, and the fixed value when ADAPTIVE_TICK_ADVANCE is off)
 TICK_ADVANCE = 20
 
+# Adaptive tick advance - derive the offset from the measured tick interval and submit latency
+ADAPTIVE_TICK_ADVANCE = True
+TICK_ADVANCE_MIN = 3
+TICK_ADVANCE_MAX = 60
+
+# Adaptive tick advance - submit-to-ack latency percentile to cover, and ticks of margin on top
+TICK_ADVANCE_PERCENTILE = 0.95
+TICK_ADVANCE_MARGIN = 2
+
+# Adaptive tick advance - margin ticks added per missed tick, and confirmations needed to drop one again
+TICK_ADVANCE_MISS_STEP = 2
+TICK_ADVANCE_RECOVERY = 20
+
+# Batched mode - maximum destinations of one QUTIL SendMany transaction
+SEND_MANY_MAX_RECIPIENTS = 25
+
+# Batched mode - QU charged by QUTIL per SendMany transaction (check the current contract fee)
+SEND_MANY_FEE = 10
+
+# Pipelined mode - maximum number of transactions sent but not yet verified
+PIPELINE_WINDOW = 10
+
+# Pipelined mode - seconds between scheduler passes (tick check, submit, verify)
+PIPELINE_POLL_INTERVAL = 1
+
+# qubic-cli call timeout in seconds
+CLI_TIMEOUT = 30
+
+# Node pool - weight of the newest sample in latency/error moving averages
+NODE_EWMA_ALPHA = 0.3
+
+# Node pool - consecutive failures that open a node's circuit breaker
+NODE_FAILURE_THRESHOLD = 3
+
+# Node pool - seconds an open breaker waits before letting trial calls through
+NODE_PROBE_INTERVAL = 15
+
+# Transaction submission: "single" (one node, next node on failure), "broadcast" (the
+# BROADCAST_FANOUT fastest nodes at once) or "hedged" (a second copy to the next node if
+# the first hasn't acknowledged within its HEDGE_PERCENTILE latency)
+SUBMISSION_MODE = "single"
+BROADCAST_FANOUT = 2
+HEDGE_PERCENTILE = 0.9
+
+# Node pool - recent round-trip samples kept per node for latency percentiles
+NODE_LATENCY_SAMPLES = 50
+
+# Node pool - timeout in seconds for the startup probe of each node
+NODE_PROBE_TIMEOUT = 5
+
+# Async engine - concurrent CLI/RPC operations in total and per node
+ASYNC_MAX_CONCURRENCY = 64
+ASYNC_PER_NODE_CONCURRENCY = 8
+
+# Reverification - concurrent checks allowed per node, and in total
+REVERIFY_PER_NODE_CONCURRENCY = 2
+REVERIFY_MAX_WORKERS = 8
+
 # API endpoint for checking latest network tick
 QUBIC_API_ENDPOINT = "https://rpc.qubic.org/v1/latestTick"
 
+# Archive endpoint listing every transaction of a tick (used by the tick transaction index)
+QUBIC_TICK_TRANSACTIONS_ENDPOINT = "https://rpc.qubic.org/v2/ticks/{tick}/transactions"
+
+# Tick transaction index - ticks kept in memory, and seconds before refetching a tick that failed
+TICK_INDEX_CACHE_SIZE = 256
+TICK_INDEX_RETRY_AFTER = 2
+
+# Payout journal - SQLite file recording every payment state transition (for --resume)
+JOURNAL_FILE = "payout_journal.db"
+
+# Payout journal - commit after this many transitions or this many seconds, whichever comes first
+JOURNAL_COMMIT_EVERY = 50
+JOURNAL_COMMIT_INTERVAL = 2
+
+# Tick oracle - seconds between background polls of the latest network tick
+TICK_ORACLE_POLL_INTERVAL = 1
+
+# Tick oracle - number of tick changes kept for the tick rate estimate
+TICK_ORACLE_HISTORY = 30
+
+# Metrics - address of the local Prometheus /metrics endpoint (METRICS_PORT None = disabled)
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = None
+
+# Metrics - seconds of confirmations behind the payouts-per-minute gauge
+METRICS_RATE_WINDOW = 60
+
+# Daemon mode - address of the local job API, and payout jobs run at the same time
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8750
+DAEMON_MAX_JOBS = 4
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,22 +149,682 @@ logging.basicConfig(
     ]
 )
 
+# Instrumentation: counters, gauges and histograms rendered in the Prometheus text format
+def _format_labels(names, values, extra=()):
+    """Prometheus label set such as {node="a",le="0.5"}, empty without labels"""
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in pairs) + "}"
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labels, key)} {value}")
+        return lines
+
+class MetricCounter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+class MetricGauge(_Metric):
+    """Gauge set explicitly, or computed at scrape time by a function (unlabelled)"""
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), function=None):
+        super().__init__(name, help_text, labels)
+        self.function = function
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def render(self):
+        if self.function is not None:
+            return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}", f"{self.name} {self.function()}"]
+        return super().render()
+
+class MetricHistogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+        for key, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, [('le', bound)])} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Process-wide metrics, served as text on /metrics by serve()"""
+    def __init__(self):
+        self._metrics = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self._register(MetricCounter(name, help_text, labels))
+
+    def gauge(self, name, help_text, labels=(), function=None):
+        return self._register(MetricGauge(name, help_text, labels, function))
+
+    def histogram(self, name, help_text, labels=(), buckets=None):
+        if buckets is None:
+            return self._register(MetricHistogram(name, help_text, labels))
+        return self._register(MetricHistogram(name, help_text, labels, buckets))
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port, host=METRICS_HOST):
+        """Serve /metrics from a daemon thread; returns the HTTP server"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logging.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+        return server
+
+class ThroughputMeter:
+    """Events per minute over a sliding window"""
+    def __init__(self, window=METRICS_RATE_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._events = deque()
+
+    def mark(self, count=1):
+        with self._lock:
+            self._events.append((time.time(), count))
+
+    def per_minute(self):
+        cutoff = time.time() - self.window
+        with self._lock:
+            while self._events and self._events[0][0] < cutoff:
+                self._events.popleft()
+            total = sum(count for _, count in self._events)
+        return total * 60.0 / self.window
+
+METRICS = MetricsRegistry()
+PAYOUT_THROUGHPUT = ThroughputMeter()
+
+CLI_CALL_SECONDS = METRICS.histogram(
+    "qus_cli_call_duration_seconds", "qubic-cli subprocess duration", ("node", "command", "outcome"))
+TICK_WAIT_SECONDS = METRICS.histogram(
+    "qus_tick_wait_seconds", "Time spent waiting for the network to reach a tick", (),
+    (0.5, 1, 2, 5, 10, 20, 30, 60, 120))
+VERIFICATIONS = METRICS.counter(
+    "qus_verifications_total", "Transaction verification answers", ("result", "source"))
+RETRIES = METRICS.counter("qus_retries_total", "Retried CLI operations", ("operation",))
+FAILOVERS = METRICS.counter("qus_failovers_total", "Switches away from a node after a failed call", ("node",))
+RPC_SECONDS = METRICS.histogram(
+    "qus_rpc_request_duration_seconds", "RPC request latency", ("endpoint", "outcome"),
+    (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+PAYOUTS = METRICS.counter("qus_payouts_total", "Payments with a final outcome", ("result",))
+METRICS.gauge("qus_payouts_confirmed_per_minute", f"Payments confirmed over the last {METRICS_RATE_WINDOW}s, per minute",
+              function=PAYOUT_THROUGHPUT.per_minute)
+NODE_LATENCY = METRICS.gauge("qus_node_latency_seconds", "Moving average round trip per node", ("node",))
+NODE_ERROR_RATE = METRICS.gauge("qus_node_error_rate", "Moving average error rate per node", ("node",))
+NODE_CIRCUIT_OPEN = METRICS.gauge("qus_node_circuit_open", "1 while the node's circuit breaker is open", ("node",))
+
+def cli_command(args):
+    """qubic-cli command of an argument list, e.g. 'sendtoaddressintick'"""
+    for arg in args:
+        if arg.startswith('-') and arg not in ('-seed', '-nodeip', '-scheduletick'):
+            return arg[1:]
+    return "unknown"
+
+def observe_cli_call(node, args, stdout_text, elapsed, outcome):
+    """Record one qubic-cli call, and the verification answer if it was a -checktxontick"""
+    CLI_CALL_SECONDS.observe(elapsed, node=node, command=cli_command(args), outcome=outcome)
+    if outcome != "ok" or '-checktxontick' not in args:
+        return
+    if "Please wait a bit more" in stdout_text:
+        VERIFICATIONS.inc(result="pending", source="cli")
+    elif "Found tx" in stdout_text and "Received end response message" in stdout_text:
+        VERIFICATIONS.inc(result="confirmed", source="cli")
+    elif "Can NOT find tx" in stdout_text:
+        VERIFICATIONS.inc(result="not_found", source="cli")
+    else:
+        VERIFICATIONS.inc(result="unexpected", source="cli")
+
+# KangarooTwelve (Keccak-p[1600] with 12 rounds), used for identity checksums
+_KECCAK_ROUND_CONSTANTS = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008
+]
+_KECCAK_ROTATIONS = [
+    [0, 36, 3, 41, 18], [1, 44, 10, 45, 2], [62, 6, 43, 15, 61], [28, 55, 25, 21, 56], [27, 20, 39, 8, 14]
+]
+_MASK64 = (1 << 64) - 1
+
+# (source lane, destination lane, rotation) of the combined rho and pi steps
+_KECCAK_RHO_PI = [
+    (x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), _KECCAK_ROTATIONS[x][y]) for x in range(5) for y in range(5)
+]
+
+def _keccak_p1600(lanes, rounds):
+    """Keccak-p[1600] permutation on 25 little-endian 64-bit lanes, last `rounds` rounds"""
+    b = [0] * 25
+    for round_constant in _KECCAK_ROUND_CONSTANTS[24 - rounds:]:
+        # theta
+        c0 = lanes[0] ^ lanes[5] ^ lanes[10] ^ lanes[15] ^ lanes[20]
+        c1 = lanes[1] ^ lanes[6] ^ lanes[11] ^ lanes[16] ^ lanes[21]
+        c2 = lanes[2] ^ lanes[7] ^ lanes[12] ^ lanes[17] ^ lanes[22]
+        c3 = lanes[3] ^ lanes[8] ^ lanes[13] ^ lanes[18] ^ lanes[23]
+        c4 = lanes[4] ^ lanes[9] ^ lanes[14] ^ lanes[19] ^ lanes[24]
+        d = (
+            c4 ^ (((c1 << 1) | (c1 >> 63)) & _MASK64),
+            c0 ^ (((c2 << 1) | (c2 >> 63)) & _MASK64),
+            c1 ^ (((c3 << 1) | (c3 >> 63)) & _MASK64),
+            c2 ^ (((c4 << 1) | (c4 >> 63)) & _MASK64),
+            c3 ^ (((c0 << 1) | (c0 >> 63)) & _MASK64),
+        )
+        # rho and pi
+        for source, destination, rotation in _KECCAK_RHO_PI:
+            v = lanes[source] ^ d[source % 5]
+            b[destination] = ((v << rotation) | (v >> (64 - rotation))) & _MASK64 if rotation else v
+        # chi and iota
+        lanes = []
+        for row in range(0, 25, 5):
+            b0, b1, b2, b3, b4 = b[row:row + 5]
+            lanes += (b0 ^ (~b1 & b2), b1 ^ (~b2 & b3), b2 ^ (~b3 & b4), b3 ^ (~b4 & b0), b4 ^ (~b0 & b1))
+        lanes[0] ^= round_constant
+    return lanes
+
+def _sponge(message, suffix, output_length, rate, rounds):
+    """Keccak sponge with a domain suffix byte (TurboSHAKE128 for rate 168, 12 rounds)"""
+    data = bytearray(message)
+    data.append(suffix)
+    data.extend(b"\x00" * (-len(data) % rate))
+    data[-1] ^= 0x80
+    lanes = [0] * 25
+    for offset in range(0, len(data), rate):
+        for i in range(rate // 8):
+            lanes[i] ^= int.from_bytes(data[offset + 8 * i:offset + 8 * i + 8], 'little')
+        lanes = _keccak_p1600(lanes, rounds)
+    output = bytearray()
+    while True:
+        output += b"".join(lane.to_bytes(8, 'little') for lane in lanes[:rate // 8])
+        if len(output) >= output_length:
+            return bytes(output[:output_length])
+        lanes = _keccak_p1600(lanes, rounds)
+
+def _length_encode(x):
+    """KangarooTwelve length_encode: big-endian bytes of x followed by their count"""
+    encoded = x.to_bytes((x.bit_length() + 7) // 8, 'big') if x else b""
+    return encoded + bytes([len(encoded)])
+
+def kangaroo_twelve(message, output_length, customization=b""):
+    """KangarooTwelve hash, including tree hashing for inputs over 8 KiB"""
+    s = bytes(message) + customization + _length_encode(len(customization))
+    chunk = 8192
+    if len(s) <= chunk:
+        return _sponge(s, 0x07, output_length, 168, 12)
+    node = bytearray(s[:chunk]) + b"\x03" + b"\x00" * 7
+    count = 0
+    for offset in range(chunk, len(s), chunk):
+        node += _sponge(s[offset:offset + chunk], 0x0B, 32, 168, 12)
+        count += 1
+    node += _length_encode(count) + b"\xff\xff"
+    return _sponge(bytes(node), 0x06, output_length, 168, 12)
+
+def public_key_to_identity(public_key, lower=False):
+    """Encode a 32-byte public key as a 60-letter Qubic identity (56 letters + 4 checksum letters)"""
+    base = ord('a') if lower else ord('A')
+    chars = []
+    for i in range(4):
+        fragment = int.from_bytes(public_key[i * 8:i * 8 + 8], 'little')
+        for _ in range(14):
+            chars.append(chr(base + fragment % 26))
+            fragment //= 26
+    checksum = int.from_bytes(kangaroo_twelve(public_key, 3), 'little') & 0x3FFFF
+    for _ in range(4):
+        chars.append(chr(base + checksum % 26))
+        checksum //= 26
+    return "".join(chars)
+
+def identity_to_public_key(identity):
+    """Decode a Qubic identity to its 32-byte public key; None if it isn't 60 letters A-Z with a valid checksum"""
+    if not isinstance(identity, str) or len(identity) != 60 or not identity.isascii() or not identity.isalpha() or not identity.isupper():
+        return None
+    public_key = bytearray()
+    for i in range(4):
+        fragment = 0
+        for char in reversed(identity[i * 14:i * 14 + 14]):
+            fragment = fragment * 26 + (ord(char) - ord('A'))
+        if fragment >> 64:
+            return None
+        public_key += fragment.to_bytes(8, 'little')
+    if public_key_to_identity(bytes(public_key)) != identity:
+        return None
+    return bytes(public_key)
+
+@functools.lru_cache(maxsize=65536)
+def is_valid_identity(identity):
+    """True if identity is a well-formed Qubic identity with a correct checksum"""
+    return identity_to_public_key(identity) is not None
+
 def get_latest_network_tick():
     """Query the Qubic API to get the latest confirmed tick"""
+    started = time.time()
     try:
         response = requests.get(QUBIC_API_ENDPOINT, timeout=10)
         if response.status_code == 200:
             data = response.json()
+            RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="ok")
             return data.get("latestTick")
         else:
+            RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="http_error")
             logging.error(f"API request failed with status code {response.status_code}")
             return None
     except Exception as e:
+        RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="error")
         logging.error(f"Error querying latest tick: {str(e)}")
         return None
 
-def wait_for_tick_confirmation(target_tick, check_interval=5):
+class TickOracle:
+    """Poll the latest network tick in one background thread and share it with any number of waiters"""
+    def __init__(self, fetch=None, poll_interval=TICK_ORACLE_POLL_INTERVAL):
+        self.fetch = fetch or get_latest_network_tick
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._tick = None
+        self._updated_at = None
+        self._history = deque(maxlen=TICK_ORACLE_HISTORY)  # (timestamp, tick) at each tick change
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background poll (no-op if already running)"""
+        if self.is_running():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name="tick-oracle", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background poll and wake every waiter"""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.poll_interval + 1)
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _poll_loop(self):
+        while not self._stop_event.is_set():
+            tick = self.fetch()
+            if tick is not None:
+                self.update(tick)
+            self._stop_event.wait(self.poll_interval)
+
+    def update(self, tick):
+        """Record a tick observation and wake waiters if the tick advanced"""
+        now = time.time()
+        with self._condition:
+            self._updated_at = now
+            if self._tick is None or tick > self._tick:
+                self._tick = tick
+                self._history.append((now, tick))
+                self._condition.notify_all()
+
+    def snapshot(self):
+        """Return (latest tick, time it was last confirmed by a poll)"""
+        with self._condition:
+            return self._tick, self._updated_at
+
+    def age(self):
+        """Seconds since the cached tick was last confirmed, None if never"""
+        with self._condition:
+            return None if self._updated_at is None else time.time() - self._updated_at
+
+    def tick_rate(self):
+        """Estimated ticks per second from recent tick changes, None until two changes were seen"""
+        with self._condition:
+            if len(self._history) < 2:
+                return None
+            (first_time, first_tick), (last_time, last_tick) = self._history[0], self._history[-1]
+        if last_time <= first_time:
+            return None
+        return (last_tick - first_tick) / (last_time - first_time)
+
+    def tick_interval(self):
+        """Estimated seconds per tick, None if unknown"""
+        rate = self.tick_rate()
+        return 1.0 / rate if rate else None
+
+    def get_latest_tick(self, timeout=10):
+        """Latest tick from the shared cache, fetched directly if the background poll isn't running"""
+        if not self.is_running():
+            tick = self.fetch()
+            if tick is not None:
+                self.update(tick)
+            return tick
+        with self._condition:
+            self._condition.wait_for(lambda: self._tick is not None or self._stop_event.is_set(), timeout=timeout)
+            return self._tick
+
+    def wait_for_tick(self, target_tick, timeout=None):
+        """Block until the network reaches target_tick; returns False on timeout or stop"""
+        if not self.is_running():
+            self.start()
+        started = time.time()
+        with self._condition:
+            reached = self._condition.wait_for(
+                lambda: (self._tick is not None and self._tick >= target_tick) or self._stop_event.is_set(),
+                timeout=timeout
+            ) and self._tick is not None and self._tick >= target_tick
+        TICK_WAIT_SECONDS.observe(time.time() - started)
+        return reached
+
+def fetch_tick_transactions(tick):
+    """Query the archive for the hashes of all transactions included in a tick
+
+    Returns a set of lower-case hashes, or None if the tick isn't available (yet).
+    """
+    started = time.time()
+    try:
+        response = requests.get(QUBIC_TICK_TRANSACTIONS_ENDPOINT.format(tick=tick), timeout=5)
+        RPC_SECONDS.observe(time.time() - started, endpoint="tickTransactions",
+                            outcome="ok" if response.status_code == 200 else "http_error")
+        if response.status_code != 200:
+            logging.warning(f"Tick {tick} transactions request failed with status code {response.status_code}")
+            return None
+        data = response.json()
+        entries = data.get("transactions", data.get("approvedTransactions", [])) or []
+        hashes = set()
+        for entry in entries:
+            tx = entry.get("transaction", entry)
+            tx_hash = tx.get("txId") or tx.get("hash")
+            if tx_hash:
+                hashes.add(tx_hash.lower())
+        return hashes
+    except Exception as e:
+        RPC_SECONDS.observe(time.time() - started, endpoint="tickTransactions", outcome="error")
+        logging.error(f"Error querying transactions of tick {tick}: {str(e)}")
+        return None
+
+class TickTransactionIndex:
+    """LRU-bounded tick -> transaction hash set, filled with one fetch per tick"""
+    def __init__(self, fetch=None, max_ticks=TICK_INDEX_CACHE_SIZE, retry_after=TICK_INDEX_RETRY_AFTER):
+        self.fetch = fetch or fetch_tick_transactions
+        self.max_ticks = max_ticks
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._ticks = OrderedDict()  # tick -> frozenset of hashes
+        self._loading = {}  # tick -> Event set when an in-progress fetch finishes
+        self._failed_at = {}  # tick -> time of the last failed fetch
+        self.hits = 0
+        self.fetches = 0
+
+    def get(self, tick):
+        """Hash set of a tick, fetched once and shared by concurrent callers; None if unavailable"""
+        while True:
+            with self._lock:
+                if tick in self._ticks:
+                    self._ticks.move_to_end(tick)
+                    self.hits += 1
+                    return self._ticks[tick]
+                failed_at = self._failed_at.get(tick)
+                if failed_at is not None and time.time() - failed_at < self.retry_after:
+                    return None
+                loading = self._loading.get(tick)
+                if loading is None:
+                    loading = self._loading[tick] = threading.Event()
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                loading.wait()
+                continue  # Read the result (or the failure) left by the fetching thread
+
+            hashes = None
+            try:
+                self.fetches += 1
+                hashes = self.fetch(tick)
+            finally:
+                with self._lock:
+                    if hashes is None:
+                        self._failed_at[tick] = time.time()
+                    else:
+                        self._failed_at.pop(tick, None)
+                        self._ticks[tick] = frozenset(hashes)
+                        while len(self._ticks) > self.max_ticks:
+                            self._ticks.popitem(last=False)
+                    del self._loading[tick]
+                loading.set()
+            return None if hashes is None else frozenset(hashes)
+
+    def lookup(self, tx_hash, tick):
+        """True/False if the tick's contents are known, None if they couldn't be fetched"""
+        hashes = self.get(tick)
+        if hashes is None:
+            return None
+        found = tx_hash.lower() in hashes
+        if found:
+            VERIFICATIONS.inc(result="confirmed", source="tick_index")
+        return found
+
+class PayoutJournal:
+    """Write-ahead SQLite journal of every payment state transition
+
+    States: planned -> submitting(tick) -> submitted(hash, tick) -> confirmed | failed.
+    The submitting intent is committed before a transfer leaves, so a crash can never hide a
+    sent payment; other transitions are committed in batches. Seeds are never stored.
+    """
+    def __init__(self, path=JOURNAL_FILE, commit_every=JOURNAL_COMMIT_EVERY, commit_interval=JOURNAL_COMMIT_INTERVAL):
+        self.path = path
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._lock = threading.RLock()
+        self._uncommitted = 0
+        self._last_commit = time.time()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                source_address TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                finished_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS payments (
+                run_id TEXT NOT NULL,
+                journal_id INTEGER NOT NULL,
+                wallet_address TEXT NOT NULL,
+                amount INTEGER NOT NULL,
+                sols TEXT,
+                state TEXT NOT NULL,
+                tx_hash TEXT,
+                tick INTEGER,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, journal_id)
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                journal_id INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                tx_hash TEXT,
+                tick INTEGER,
+                at TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def start_run(self, source_address, mode, payment_data):
+        """Create a run and journal every payment as planned; payments get a 'journal_id'"""
+        run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO runs (run_id, source_address, mode, created_at) VALUES (?, ?, ?, ?)",
+                (run_id, source_address, mode, now)
+            )
+            self.add_payments(run_id, payment_data)
+        return run_id
+
+    def add_payments(self, run_id, payment_data, commit=True):
+        """Journal payments that don't have a journal_id yet as planned"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            next_id = self.conn.execute(
+                "SELECT COALESCE(MAX(journal_id) + 1, 0) FROM payments WHERE run_id = ?", (run_id,)
+            ).fetchone()[0]
+            rows = []
+            for payment in payment_data:
+                if payment.get('journal_id') is not None:
+                    continue
+                payment['journal_id'] = next_id
+                rows.append((run_id, next_id, payment['wallet_address'], payment['amount'], payment.get('sols'), "planned", now))
+                next_id += 1
+            self.conn.executemany(
+                "INSERT INTO payments (run_id, journal_id, wallet_address, amount, sols, state, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if commit:
+                self.flush()
+
+    def record(self, run_id, journal_id, state, tx_hash=None, tick=None, durable=False):
+        """Journal a state transition; durable=True commits before returning"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.execute(
+                "UPDATE payments SET state = ?, tx_hash = COALESCE(?, tx_hash), tick = COALESCE(?, tick), updated_at = ? "
+                "WHERE run_id = ? AND journal_id = ?",
+                (state, tx_hash, tick, now, run_id, journal_id)
+            )
+            self.conn.execute(
+                "INSERT INTO events (run_id, journal_id, state, tx_hash, tick, at) VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, journal_id, state, tx_hash, tick, now)
+            )
+            self._uncommitted += 1
+            if durable or self._uncommitted >= self.commit_every or time.time() - self._last_commit >= self.commit_interval:
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            self.conn.commit()
+            self._uncommitted = 0
+            self._last_commit = time.time()
+
+    def finish_run(self, run_id):
+        with self._lock:
+            self.conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (datetime.now().isoformat(), run_id))
+            self.flush()
+
+    def latest_unfinished_run(self):
+        """(run_id, source_address, mode) of the newest unfinished run, or None"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT run_id, source_address, mode FROM runs WHERE finished_at IS NULL ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+
+    def get_run(self, run_id):
+        """(run_id, source_address, mode) of a run, or None"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT run_id, source_address, mode FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+
+    def load_payments(self, run_id):
+        """All journaled payments of a run in their original order"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT journal_id, wallet_address, amount, sols, state, tx_hash, tick FROM payments "
+                "WHERE run_id = ? ORDER BY journal_id", (run_id,)
+            ).fetchall()
+        return [
+            {'journal_id': r[0], 'wallet_address': r[1], 'amount': r[2], 'sols': r[3], 'state': r[4], 'tx_hash': r[5], 'tick': r[6]}
+            for r in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+def wait_for_tick_confirmation(target_tick, check_interval=5, oracle=None):
     """Wait until the network has processed past the target tick"""
+    if oracle is not None:
+        while not oracle.wait_for_tick(target_tick, timeout=check_interval):
+            logging.info(f"Waiting for tick {target_tick} confirmation. Current network tick: {oracle.snapshot()[0]}")
+        logging.info(f"Tick {target_tick} has been confirmed by the network (latest: {oracle.snapshot()[0]})")
+        return True
+
     while True:
         latest_tick = get_latest_network_tick()
         if latest_tick is None:
@@ -74,54 +839,149 @@ def wait_for_tick_confirmation(target_tick, check_interval=5):
         logging.info(f"Waiting for tick {target_tick} confirmation. Current network tick: {latest_tick}. Checking again in {check_interval} seconds")
         time.sleep(check_interval)
 
+def _split_pasted_line(line):
+    """Split an 'AmountADDRESS' line into (amount text, address text); None if there's no address part"""
+    # Find where the numeric amount ends and the wallet address begins
+    for j, char in enumerate(line):
+        if char.isalpha():
+            if j == 0:
+                return None
+            return line[:j].strip(), line[j:].strip()
+    return None
+
+def _parse_amount(value):
+    """Amount as a positive int from int, integral float or digit string; None if invalid"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        amount = value
+    elif isinstance(value, float):
+        if not value.is_integer():
+            return None
+        amount = int(value)
+    else:
+        text = str(value).strip()
+        if not text.isdigit():
+            return None
+        amount = int(text)
+    return amount if amount > 0 else None
+
+def _validated_payments(rows, rejects=None):
+    """Validate (line number, address, amount, sols) rows and yield payment dicts
+
+    Bad rows are logged with their line number and, if given, appended to `rejects`
+    as (line number, reason, address, amount).
+    """
+    for line_no, wallet_address, amount_value, sols in rows:
+        unparseable = wallet_address is None and amount_value is None
+        wallet_address = str(wallet_address).strip() if wallet_address is not None else ""
+        amount = _parse_amount(amount_value)
+        if unparseable:
+            reason = "could not parse row"
+        elif amount is None:
+            reason = f"invalid amount {amount_value!r}"
+        elif not is_valid_identity(wallet_address):
+            reason = f"invalid Qubic identity {wallet_address!r} (expected 60 uppercase letters with a valid checksum)"
+        else:
+            yield {
+                'wallet_address': wallet_address,
+                'amount': amount,
+                'sols': str(sols) if sols not in (None, "") else None
+            }
+            continue
+        logging.warning(f"Rejected line {line_no}: {reason}")
+        if rejects is not None:
+            rejects.append((line_no, reason, wallet_address, amount_value))
+
+def _iter_pasted_rows(lines):
+    """(line number, address, amount, sols) rows from 'AmountADDRESS' lines, skipping a header line"""
+    first = True
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        # Skip the header if it exists (first line with "Amount" and "WLT ADDRESS")
+        if first and "amount" in line.lower() and "address" in line.lower():
+            first = False
+            continue
+        first = False
+        parts = _split_pasted_line(line)
+        if parts is None:
+            yield line_no, None, None, None
+            continue
+        yield line_no, parts[1], parts[0], None
+
+def _iter_text_rows(path):
+    """(line number, address, amount, sols) rows from a text file in the pasted format"""
+    with open(path) as f:
+        yield from _iter_pasted_rows(f)
+
+def _iter_csv_rows(path):
+    """(line number, address, amount, sols) rows from a CSV file with wallet_address/amount[/sols] headers"""
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row.get('wallet_address'), row.get('amount'), row.get('sols')
+
+def _iter_jsonl_rows(path):
+    """(line number, address, amount, sols) rows from a JSON-lines file"""
+    with open(path) as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_no, None, None, None
+                continue
+            if not isinstance(row, dict):
+                yield line_no, None, None, None
+                continue
+            yield line_no, row.get('wallet_address'), row.get('amount'), row.get('sols')
+
+def _iter_xlsx_rows(path):
+    """(row number, address, amount, sols) rows from the first sheet, read in openpyxl read-only mode"""
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("Streaming .xlsx files requires openpyxl (pip install openpyxl)")
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(cell).strip().lower() if cell is not None else "" for cell in next(rows, ())]
+        if 'wallet_address' not in header or 'amount' not in header:
+            raise ValueError(f"{path}: first row must contain 'wallet_address' and 'amount' columns")
+        address_col, amount_col = header.index('wallet_address'), header.index('amount')
+        sols_col = header.index('sols') if 'sols' in header else None
+        for row_no, row in enumerate(rows, start=2):
+            if row is None or all(cell is None for cell in row):
+                continue
+            cell = lambda col: row[col] if col is not None and col < len(row) else None
+            yield row_no, cell(address_col), cell(amount_col), cell(sols_col)
+    finally:
+        workbook.close()
+
+def iter_payment_file(path, rejects=None):
+    """Stream validated payments from a CSV, JSONL, XLSX or pasted-format text file
+
+    Rows are read, validated and yielded one at a time, so memory stays flat and
+    sending can start before a large file is fully parsed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.xlsx', '.xlsm'):
+        rows = _iter_xlsx_rows(path)
+    elif extension in ('.jsonl', '.ndjson'):
+        rows = _iter_jsonl_rows(path)
+    elif extension == '.csv':
+        rows = _iter_csv_rows(path)
+    else:
+        rows = _iter_text_rows(path)
+    return _validated_payments(rows, rejects)
+
 def parse_pasted_data(data_text):
     """Parse pasted data with columns Amount and WLT ADDRESS"""
     try:
-        lines = data_text.strip().split('\n')
-        payment_data = []
-        
-        # Skip the header if it exists (first line with "Amount" and "WLT ADDRESS")
-        start_idx = 0
-        if "amount" in lines[0].lower() and "address" in lines[0].lower():
-            start_idx = 1
-        
-        for i in range(start_idx, len(lines)):
-            line = lines[i].strip()
-            if not line:
-                continue
-                
-            # Find where the numeric amount ends and the wallet address begins
-            # Wallet addresses in Qubic are alphanumeric and typically uppercase
-            amount_end = 0
-            for j, char in enumerate(line):
-                if char.isalpha():
-                    amount_end = j
-                    break
-            
-            if amount_end > 0:
-                try:
-                    amount_str = line[:amount_end].strip()
-                    wallet_address = line[amount_end:].strip()
-                    
-                    # Validate data
-                    if not amount_str.isdigit():
-                        logging.warning(f"Invalid amount in line {i+1}: {amount_str}")
-                        continue
-                        
-                    if len(wallet_address) < 10:  # Arbitrary minimum length for a valid wallet address
-                        logging.warning(f"Invalid wallet address in line {i+1}: {wallet_address}")
-                        continue
-                    
-                    payment_data.append({
-                        'wallet_address': wallet_address,
-                        'amount': int(amount_str),
-                        'sols': None  # No sols info in this format
-                    })
-                except Exception as e:
-                    logging.warning(f"Error parsing line {i+1}: {str(e)}")
-            else:
-                logging.warning(f"Could not parse line {i+1}: {line}")
-        
+        payment_data = list(_validated_payments(_iter_pasted_rows(data_text.strip().split('\n'))))
         logging.info(f"Parsed {len(payment_data)} payment records from pasted data")
         return payment_data
     except Exception as e:
@@ -131,16 +991,16 @@ def parse_pasted_data(data_text):
 def load_excel_data(excel_file):
     """Load payment data from Excel file"""
     try:
-        df = pd.read_excel(excel_file)
-        payment_data = []
-        
-        # Assuming columns are: 'wallet_address', 'amount', and optionally 'sols'
-        for idx, row in df.iterrows():
-            payment_data.append({
-                'wallet_address': str(row['wallet_address']).strip(),
-                'amount': int(row['amount']),
-                'sols': str(row.get('sols', '')) if 'sols' in df.columns else None
-            })
+        if os.path.splitext(excel_file)[1].lower() in ('.xlsx', '.xlsm'):
+            payment_data = list(iter_payment_file(excel_file))
+        else:
+            import pandas as pd  # Only needed for legacy .xls files
+            df = pd.read_excel(excel_file)
+            rows = (
+                (idx + 2, row['wallet_address'], row['amount'], row.get('sols') if 'sols' in df.columns else None)
+                for idx, row in df.iterrows()
+            )
+            payment_data = list(_validated_payments(rows))
         
         logging.info(f"Loaded {len(payment_data)} payment records from Excel file")
         return payment_data
@@ -148,10 +1008,400 @@ def load_excel_data(excel_file):
         logging.error(f"Error loading Excel file: {str(e)}")
         raise
 
+def probe_node(node, timeout=NODE_PROBE_TIMEOUT):
+    """Ask a node for its current tick through qubic-cli; True if it answered"""
+    try:
+        result = subprocess.run(
+            [QUBIC_CLI_PATH, '-nodeip', node, '-getcurrenttick'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout
+        )
+        return "Tick:" in result.stdout.decode()
+    except Exception as e:
+        logging.warning(f"Probe of node {node} failed: {str(e)}")
+        return False
+
+class NodeHealth:
+    """Moving averages and circuit breaker state of one node"""
+    def __init__(self):
+        self.latency = None  # EWMA of round-trip seconds
+        self.error_rate = 0.0  # EWMA of failures (0..1)
+        self.consecutive_failures = 0
+        self.state = "closed"  # closed, open or half-open
+        self.opened_at = None
+        self.calls = 0
+        self.failures = 0
+        self.samples = deque(maxlen=NODE_LATENCY_SAMPLES)  # recent round trips of completed calls
+
+class NodePool:
+    """Route calls to the lowest-latency healthy node, with a circuit breaker per node
+
+    A node whose breaker is open is skipped until probe_interval has passed, then trial
+    calls are let through (half-open): a success closes the breaker, a failure reopens it.
+    """
+    def __init__(self, nodes, probe=None, alpha=NODE_EWMA_ALPHA, failure_threshold=NODE_FAILURE_THRESHOLD,
+                 probe_interval=NODE_PROBE_INTERVAL):
+        self.nodes = list(nodes)
+        self.probe = probe or probe_node
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._health = {node: NodeHealth() for node in self.nodes}
+
+    def probe_all(self):
+        """Probe every node in parallel, seeding latencies and opening breakers of dead nodes"""
+        def probe(node):
+            started = time.time()
+            ok = self.probe(node)
+            return node, ok, time.time() - started
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.nodes))) as executor:
+            for node, ok, elapsed in executor.map(probe, self.nodes):
+                if ok:
+                    self.record_success(node, elapsed)
+                else:
+                    with self._lock:
+                        self._open(node, self._health[node])
+                        self._publish(node, self._health[node])
+                    logging.warning(f"Node {node} did not answer the startup probe")
+
+    def _open(self, node, health):
+        health.state = "open"
+        health.opened_at = time.time()
+        logging.warning(f"Circuit breaker opened for node {node}, retrying in {self.probe_interval}s")
+
+    def record_success(self, node, latency):
+        with self._lock:
+            health = self._health.setdefault(node, NodeHealth())
+            health.calls += 1
+            health.samples.append(latency)
+            health.latency = latency if health.latency is None else self.alpha * latency + (1 - self.alpha) * health.latency
+            health.error_rate *= (1 - self.alpha)
+            health.consecutive_failures = 0
+            if health.state != "closed":
+                logging.info(f"Circuit breaker closed for node {node}")
+            health.state = "closed"
+            self._publish(node, health)
+
+    def record_failure(self, node, latency=None):
+        with self._lock:
+            health = self._health.setdefault(node, NodeHealth())
+            health.calls += 1
+            health.failures += 1
+            if latency is not None:
+                health.latency = latency if health.latency is None else self.alpha * latency + (1 - self.alpha) * health.latency
+            health.error_rate = self.alpha + (1 - self.alpha) * health.error_rate
+            health.consecutive_failures += 1
+            if health.state == "half-open" or (health.state == "closed" and health.consecutive_failures >= self.failure_threshold):
+                self._open(node, health)
+            self._publish(node, health)
+
+    @staticmethod
+    def _publish(node, health):
+        """Mirror a node's health into the metrics gauges"""
+        if health.latency is not None:
+            NODE_LATENCY.set(health.latency, node=node)
+        NODE_ERROR_RATE.set(health.error_rate, node=node)
+        NODE_CIRCUIT_OPEN.set(1 if health.state == "open" else 0, node=node)
+
+    def _available(self, health, now):
+        """Closed nodes are available; an open node becomes half-open once its wait is over"""
+        if health.state == "open" and now - health.opened_at >= self.probe_interval:
+            health.state = "half-open"
+            return True
+        return health.state in ("closed", "half-open")
+
+    def _score(self, health):
+        """Lower is better: latency inflated by the recent error rate, unknown latency ranks last"""
+        latency = health.latency if health.latency is not None else CLI_TIMEOUT
+        return latency * (1 + 4 * health.error_rate)
+
+    def ranked_nodes(self, exclude=()):
+        """Available nodes from best to worst"""
+        now = time.time()
+        with self._lock:
+            candidates = [n for n in self.nodes if n not in exclude and self._available(self._health[n], now)]
+            return sorted(candidates, key=lambda n: self._score(self._health[n]))
+
+    def healthy_nodes(self):
+        return self.ranked_nodes()
+
+    def best_node(self, exclude=()):
+        """Best available node; if every breaker is open, the one that reopens soonest"""
+        ranked = self.ranked_nodes(exclude)
+        if ranked:
+            return ranked[0]
+        ranked = self.ranked_nodes()
+        if ranked:
+            return ranked[0]
+        with self._lock:
+            return min(self.nodes, key=lambda n: self._health[n].opened_at or 0)
+
+    def latency_percentile(self, node, percentile):
+        """Round-trip latency percentile (0..1) over recent successful calls, None without samples"""
+        with self._lock:
+            samples = sorted(self._health[node].samples) if node in self._health else []
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+    def snapshot(self):
+        """Per-node {latency, error_rate, state, calls, failures} for reporting"""
+        with self._lock:
+            return {
+                node: {
+                    'latency': health.latency,
+                    'error_rate': health.error_rate,
+                    'state': health.state,
+                    'calls': health.calls,
+                    'failures': health.failures
+                }
+                for node, health in self._health.items()
+            }
+
+def pack_send_many(payment_data, max_recipients=SEND_MANY_MAX_RECIPIENTS):
+    """Merge payments to the same address and pack recipients into as few SendMany batches as possible
+
+    Each recipient keeps the original payments it was merged from, so results can be
+    reported per payment. Batches are evenly sized (they differ by at most one recipient).
+    """
+    merged = OrderedDict()
+    for payment in payment_data:
+        address = payment['wallet_address']
+        if address not in merged:
+            merged[address] = {'wallet_address': address, 'amount': 0, 'payments': []}
+        merged[address]['amount'] += payment['amount']
+        merged[address]['payments'].append(payment)
+
+    recipients = list(merged.values())
+    if not recipients:
+        return []
+    batch_count = -(-len(recipients) // max_recipients)
+    size, extra = divmod(len(recipients), batch_count)
+    batches = []
+    start = 0
+    for i in range(batch_count):
+        end = start + size + (1 if i < extra else 0)
+        batches.append(recipients[start:end])
+        start = end
+    return batches
+
+def iter_send_many_batches(payments, max_recipients=SEND_MANY_MAX_RECIPIENTS):
+    """Streaming packer: emit a SendMany batch as soon as it has max_recipients distinct addresses
+
+    Duplicate addresses are merged within the batch being filled, so a stream can be
+    packed without holding it in memory.
+    """
+    merged = OrderedDict()
+    for payment in payments:
+        address = payment['wallet_address']
+        if address not in merged and len(merged) == max_recipients:
+            yield list(merged.values())
+            merged = OrderedDict()
+        if address not in merged:
+            merged[address] = {'wallet_address': address, 'amount': 0, 'payments': []}
+        merged[address]['amount'] += payment['amount']
+        merged[address]['payments'].append(payment)
+    if merged:
+        yield list(merged.values())
+
+def shard_payments(payment_data, shard_count):
+    """Split payments into shard_count lists balanced by count and by total amount
+
+    Largest payments are placed first, each on the shard with the lowest total among
+    shards that still have room (at most ceil(n / shard_count) payments each).
+    Payments keep their original order within a shard.
+    """
+    capacity = -(-len(payment_data) // shard_count) if payment_data else 0
+    totals = [0] * shard_count
+    assigned = [[] for _ in range(shard_count)]
+    order = sorted(range(len(payment_data)), key=lambda i: payment_data[i]['amount'], reverse=True)
+    for i in order:
+        shard = min((s for s in range(shard_count) if len(assigned[s]) < capacity), key=lambda s: (totals[s], len(assigned[s])))
+        totals[shard] += payment_data[i]['amount']
+        assigned[shard].append(i)
+    return [[payment_data[i] for i in sorted(indexes)] for indexes in assigned]
+
+class SharedPaymentStream:
+    """Thread-safe iterator over a payment stream, each payment goes to whichever sender pulls first"""
+    def __init__(self, payments):
+        self._payments = iter(payments)
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            return next(self._payments)
+
+class TickSlotScheduler:
+    """Hand out future ticks so a source wallet never has two transfers in the same tick"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reserved = {}  # source address -> set of reserved ticks
+
+    def reserve(self, source_address, earliest_tick):
+        """Reserve the first free tick at or after earliest_tick for this source"""
+        with self._lock:
+            taken = self._reserved.setdefault(source_address, set())
+            tick = earliest_tick
+            while tick in taken:
+                tick += 1
+            taken.add(tick)
+            return tick
+
+    def release_passed(self, source_address, current_tick):
+        """Forget reservations for ticks the network has already moved past"""
+        with self._lock:
+            taken = self._reserved.get(source_address)
+            if taken:
+                taken.difference_update([tick for tick in taken if tick < current_tick])
+
+    def reserved_count(self, source_address):
+        """Number of ticks currently held by this source"""
+        with self._lock:
+            return len(self._reserved.get(source_address, ()))
+
+class TickAdvanceController:
+    """Pick the smallest safe tick offset from the live tick interval and submit-to-ack latency
+
+    The offset covers the TICK_ADVANCE_PERCENTILE submit latency of the slowest available
+    node plus the age of the cached tick, converted to ticks, plus a margin. Transfers not
+    found on their tick ("Can NOT find tx") widen the margin; after TICK_ADVANCE_RECOVERY
+    confirmations in a row it narrows again. Until there is data TICK_ADVANCE is used.
+    """
+    def __init__(self, tick_oracle, node_pool, adaptive=ADAPTIVE_TICK_ADVANCE, minimum=TICK_ADVANCE_MIN,
+                 maximum=TICK_ADVANCE_MAX, percentile=TICK_ADVANCE_PERCENTILE, margin=TICK_ADVANCE_MARGIN):
+        self.tick_oracle = tick_oracle
+        self.node_pool = node_pool
+        self.adaptive = adaptive
+        self.minimum = minimum
+        self.maximum = maximum
+        self.percentile = percentile
+        self.base_margin = margin
+        self._lock = threading.Lock()
+        self._margin = margin
+        self._streak = 0
+        self._submit_samples = {}  # node -> recent submit-to-ack round trips
+        self.misses = 0
+        self.confirmations = 0
+        self.last_advance = None
+
+    def record_submit(self, node, latency):
+        """Round trip of an acknowledged submission"""
+        with self._lock:
+            self._submit_samples.setdefault(node, deque(maxlen=NODE_LATENCY_SAMPLES)).append(latency)
+
+    def observe_cli(self, node, args, stdout_text, elapsed):
+        """Keep the latency of qubic-cli calls that submitted a transaction and got a hash back"""
+        if ('-sendtoaddressintick' in args or '-qutilsendtomanyv1' in args) and "TxHash: " in stdout_text:
+            self.record_submit(node, elapsed)
+
+    def record_outcome(self, confirmed):
+        """Feed back a verified (True) or missed (False) transaction"""
+        with self._lock:
+            if confirmed:
+                self.confirmations += 1
+                self._streak += 1
+                if self._streak >= TICK_ADVANCE_RECOVERY and self._margin > self.base_margin:
+                    self._margin -= 1
+                    self._streak = 0
+            else:
+                self.misses += 1
+                self._streak = 0
+                self._margin = min(self.maximum, self._margin + TICK_ADVANCE_MISS_STEP)
+
+    def submit_latency(self):
+        """Submit latency percentile of the slowest available node, None without samples"""
+        latencies = []
+        for node in self.node_pool.ranked_nodes():
+            with self._lock:
+                samples = sorted(self._submit_samples.get(node, ()))
+            if samples:
+                latencies.append(samples[min(len(samples) - 1, int(self.percentile * len(samples)))])
+            else:
+                latency = self.node_pool.latency_percentile(node, self.percentile)
+                if latency is not None:
+                    latencies.append(latency)
+        return max(latencies) if latencies else None
+
+    def advance(self):
+        """Ticks ahead of the current network tick to schedule the next transaction"""
+        if not self.adaptive:
+            return TICK_ADVANCE
+        interval = self.tick_oracle.tick_interval()
+        latency = self.submit_latency()
+        with self._lock:
+            margin = self._margin
+        if interval is None or latency is None:
+            advance = max(TICK_ADVANCE, self.minimum + margin)
+        else:
+            lag = latency + (self.tick_oracle.age() or 0)
+            advance = math.ceil(lag / interval) + 1 + margin
+        advance = max(self.minimum, min(self.maximum, advance))
+        with self._lock:
+            changed = advance != self.last_advance
+            self.last_advance = advance
+        if changed:
+            logging.info(f"Tick advance set to {advance} (tick interval {interval}, submit latency {latency}, margin {margin})")
+        return advance
+
+class BalanceLedger:
+    """Locally tracked balance of a source wallet
+
+    Seeded from a balance query. An amount is reserved before a transfer is submitted,
+    released if the transfer fails and settled (spent) once it is confirmed, so a sender
+    knows before spawning qubic-cli whether a payment can still be covered.
+    """
+    def __init__(self, balance):
+        self._lock = threading.Lock()
+        self.balance = balance  # queried balance minus confirmed spends
+        self.pending = 0  # reserved by transfers in flight
+
+    def available(self):
+        with self._lock:
+            return self.balance - self.pending
+
+    def reserve(self, amount):
+        """Reserve amount for a submission; False if it can't be covered"""
+        with self._lock:
+            if amount > self.balance - self.pending:
+                return False
+            self.pending += amount
+            return True
+
+    def release(self, amount):
+        """A reserved transfer failed or was never sent"""
+        with self._lock:
+            self.pending = max(0, self.pending - amount)
+
+    def settle(self, amount):
+        """A reserved transfer was confirmed"""
+        with self._lock:
+            self.pending = max(0, self.pending - amount)
+            self.balance -= amount
+
+    def spend(self, amount):
+        """A transfer that had been released turned out confirmed (reverification)"""
+        with self._lock:
+            self.balance -= amount
+
+    def refresh(self, balance):
+        """Replace the balance with a fresh query (only meaningful with nothing pending)"""
+        with self._lock:
+            self.balance = balance
+
 class QUSSender:
-    def __init__(self, source_wallet, payment_data):
+    def __init__(self, source_wallet, payment_data, mode="sequential", tick_slots=None, tick_oracle=None, tick_index=None,
+                 node_pool=None, submission_mode=SUBMISSION_MODE, journal=None, journal_run_id=None, tick_advance=None,
+                 balance_ledger=None):
         self.active_nodes = NODES.copy()
         self.current_node_index = 0
+        self._avoid_node = None
+
+        # Latency/health tracking and circuit breakers, can be shared between senders
+        self.node_pool = node_pool if node_pool is not None else NodePool(self.active_nodes)
         self.active_processes = set()
         
         # Source wallet information
@@ -172,25 +1422,105 @@ class QUSSender:
         # File to save failed transactions
         self.failed_tx_file = "failed_transactions.json"
 
+        # Processing mode: "sequential" (send-wait-verify) or "pipelined" (tick slots)
+        self.mode = mode
+
+        # Tick slot reservations, can be shared between senders using the same wallet
+        self.tick_slots = tick_slots if tick_slots is not None else TickSlotScheduler()
+
+        # Tick -> transaction hashes cache answering bulk verifications from memory
+        self.tick_index = tick_index if tick_index is not None else TickTransactionIndex()
+
+        # How transfers are submitted, and which nodes acknowledged each transaction hash
+        self.submission_mode = submission_mode
+        self.tx_acks = {}
+        self._ack_lock = threading.Lock()
+        # Copies of broadcast and hedged transfers, created on first use; late ones finish here after the first ack
+        self._broadcast_executor = None
+
+        # Write-ahead journal of payment states (optional) and the run being journaled
+        self.journal = journal
+        self.journal_run_id = journal_run_id
+
+        # Confirmed payments carried over from a resumed run, and sent payments whose
+        # outcome couldn't be determined (never resent automatically)
+        self.resumed_successful = []
+        self.unresolved_transactions = []
+
+        # Set to stop a running reverification
+        self.reverify_cancel_event = threading.Event()
+
+        # Shared latest-tick cache; a sender only stops an oracle it created itself
+        self._owns_tick_oracle = tick_oracle is None
+        self.tick_oracle = tick_oracle if tick_oracle is not None else TickOracle()
+
+        # How many ticks ahead new transactions are scheduled, adapted to tick rate and latency
+        self.tick_advance = tick_advance if tick_advance is not None else TickAdvanceController(self.tick_oracle, self.node_pool)
+
+        # Running balance of the source wallet (set up by the pre-flight check), payments left
+        # unsent because it ran out, and whether to fail the rest of the input once it does
+        # (off when other wallets share the input stream)
+        self.balance_ledger = balance_ledger
+        self.unfunded_payments = []
+        self.drain_unfunded = True
+
     def get_next_node(self) -> str:
-        """Get current node and switch to next if current is unavailable"""
+        """Get the best healthy node, avoiding the one just switched away from"""
         if not self.active_nodes:
             raise Exception("No active nodes available")
         
-        # Ensure index is within bounds
-        if self.current_node_index >= len(self.active_nodes):
-            self.current_node_index = 0
-        
-        return self.active_nodes[self.current_node_index]
+        avoid = self._avoid_node
+        node = self.node_pool.best_node(exclude={avoid} if avoid else ())
+        self._avoid_node = None
+        self.current_node_index = self.active_nodes.index(node)
+        return node
 
     def switch_to_next_node(self):
-        """Switch to the next available node"""
+        """Move the next call away from the current node"""
         if not self.active_nodes:
             raise Exception("No active nodes available")
         
-        # Move to next node in circular logic
-        self.current_node_index = (self.current_node_index + 1) % len(self.active_nodes)
-        logging.info(f"Switched to node: {self.active_nodes[self.current_node_index]}")
+        self._avoid_node = self.active_nodes[self.current_node_index]
+        FAILOVERS.inc(node=self._avoid_node)
+        next_node = self.node_pool.best_node(exclude={self._avoid_node})
+        logging.info(f"Switched to node: {next_node}")
+
+    def run_cli(self, node, args, timeout=CLI_TIMEOUT):
+        """Run qubic-cli against a node and record its round trip in the node pool
+
+        Returns (stdout_text, stderr_text). Timeouts, connection errors and spawn failures
+        count as node failures; on timeout the process is killed and TimeoutExpired re-raised.
+        """
+        cmd = [QUBIC_CLI_PATH, '-nodeip', node] + list(args)
+        started = time.time()
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except Exception:
+            self.node_pool.record_failure(node)
+            raise
+        self.active_processes.add(process.pid)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            self.node_pool.record_failure(node, time.time() - started)
+            observe_cli_call(node, args, "", time.time() - started, "timeout")
+            raise
+        finally:
+            self.active_processes.discard(process.pid)
+
+        elapsed = time.time() - started
+        stdout_text = stdout.decode()
+        stderr_text = stderr.decode()
+        if "Failed to connect" in stderr_text or "error -1" in stderr_text:
+            self.node_pool.record_failure(node, elapsed)
+            observe_cli_call(node, args, stdout_text, elapsed, "connect_error")
+        else:
+            observe_cli_call(node, args, stdout_text, elapsed, "ok")
+            self.node_pool.record_success(node, elapsed)
+            self.tick_advance.observe_cli(node, args, stdout_text, elapsed)
+        return stdout_text, stderr_text
 
     def extract_tx_hash(self, output_text):
         """Extract transaction hash from the transaction output"""
@@ -205,12 +1535,12 @@ class QUSSender:
 
     def send_transaction(self, target_address, amount, tick, retry_count=0, max_retries=3):
         """Send a transaction with the specified amount to the target address for the given tick"""
-        process = None
+        if retry_count:
+            RETRIES.inc(operation="send")
+        node = None
         try:
             node = self.get_next_node()
-            cmd = [
-                QUBIC_CLI_PATH,
-                '-nodeip', node,
+            args = [
                 '-seed', self.source_wallet['seed'],
                 '-sendtoaddressintick', target_address,
                 str(amount),
@@ -219,12 +1549,7 @@ class QUSSender:
             
             logging.info(f"Attempting transaction with node: {node}")
             
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            self.active_processes.add(process.pid)
-            
-            stdout, stderr = process.communicate(timeout=30)  # 30 second timeout
-            stdout_text = stdout.decode()
-            stderr_text = stderr.decode()
+            stdout_text, stderr_text = self.run_cli(node, args)
             
             # Print the full output for inspection
             print(stdout_text)
@@ -266,9 +1591,7 @@ class QUSSender:
             return False, None
             
         except subprocess.TimeoutExpired:
-            logging.error(f"Transaction timed out on node {self.active_nodes[self.current_node_index]}")
-            if process:
-                process.kill()
+            logging.error(f"Transaction timed out on node {node}")
             
             # Switch to next node on timeout
             self.switch_to_next_node()
@@ -289,31 +1612,191 @@ class QUSSender:
                 return self.send_transaction(target_address, amount, tick, retry_count + 1, max_retries)
             
             return False, None
-        finally:
-            if process and process.pid in self.active_processes:
-                self.active_processes.remove(process.pid)
+
+    def _submit_on_node(self, node, target_address, amount, tick):
+        """Single submission attempt on one node, returns (success, tx_hash)"""
+        args = [
+            '-seed', self.source_wallet['seed'],
+            '-sendtoaddressintick', target_address,
+            str(amount),
+            str(tick)
+        ]
+        try:
+            stdout_text, stderr_text = self.run_cli(node, args)
+        except Exception as e:
+            logging.warning(f"Submission to node {node} failed: {str(e)}")
+            return False, None
+        if "Transaction has been sent!" in stdout_text:
+            tx_hash = self.extract_tx_hash(stdout_text)
+            with self._ack_lock:
+                self.tx_acks.setdefault(tx_hash, set()).add(node)
+            return True, tx_hash
+        logging.warning(f"Submission to node {node} not acknowledged: {stderr_text.strip()}")
+        return False, None
+
+    def send_transaction_multi(self, target_address, amount, tick, hedged=False, fanout=BROADCAST_FANOUT):
+        """Submit the same transfer to several of the fastest nodes
+
+        qubic-cli signs deterministically (the SchnorrQ nonce is derived from the key and the
+        message), so every copy is the same transaction with the same hash and can't pay twice.
+        Broadcast sends to `fanout` nodes at once; hedged sends to the best node and only adds
+        the next one if no acknowledgement came within that node's HEDGE_PERCENTILE latency.
+        Acknowledgements are collapsed by hash. Falls back to send_transaction if none succeed.
+        """
+        nodes = self.node_pool.ranked_nodes()[:max(1, fanout)]
+        if len(nodes) < 2:
+            return self.send_transaction(target_address, amount, tick)
+
+        executor = self._broadcasts()
+        futures = {}
+        tx_hashes = set()
+        if hedged:
+            futures[executor.submit(self._submit_on_node, nodes[0], target_address, amount, tick)] = nodes[0]
+            for node, next_node in zip(nodes, nodes[1:]):
+                hedge_delay = self.node_pool.latency_percentile(node, HEDGE_PERCENTILE) or CLI_TIMEOUT / 10
+                in_flight = [f for f in futures if not f.done()]
+                if in_flight:
+                    wait(in_flight, timeout=hedge_delay, return_when=FIRST_COMPLETED)
+                if any(f.done() and f.result()[0] for f in futures):
+                    break
+                logging.info(f"No acknowledgement from {node} within {hedge_delay:.2f}s, hedging on {next_node}")
+                futures[executor.submit(self._submit_on_node, next_node, target_address, amount, tick)] = next_node
+        else:
+            for node in nodes:
+                futures[executor.submit(self._submit_on_node, node, target_address, amount, tick)] = node
+
+        # Late copies keep running on the shared executor, their acknowledgements land in tx_acks
+        for future in as_completed(futures):
+            success, tx_hash = future.result()
+            if success and tx_hash:
+                tx_hashes.add(tx_hash)
+                break
+
+        if not tx_hashes:
+            logging.warning(f"No node acknowledged the transfer to {target_address}, falling back to single submission")
+            return self.send_transaction(target_address, amount, tick)
+
+        tx_hash = tx_hashes.pop()
+        logging.info(f"Transaction successful: {self.source_wallet['address']} -> {target_address} for {amount} QUS, tick {tick}, hash: {tx_hash}")
+        return True, tx_hash
+
+    def _broadcasts(self):
+        """Executor of the broadcast and hedged copies, started on the first multi-node submission"""
+        with self._ack_lock:
+            if self._broadcast_executor is None:
+                self._broadcast_executor = ThreadPoolExecutor(
+                    max_workers=PIPELINE_WINDOW * max(1, BROADCAST_FANOUT), thread_name_prefix="broadcast")
+            return self._broadcast_executor
+
+    def close_broadcasts(self):
+        """Wait for the late copies of broadcast transfers and stop their threads"""
+        with self._ack_lock:
+            executor, self._broadcast_executor = self._broadcast_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def submit_transaction(self, target_address, amount, tick):
+        """Send a transfer using the configured submission mode"""
+        if self.submission_mode == "broadcast":
+            return self.send_transaction_multi(target_address, amount, tick)
+        if self.submission_mode == "hedged":
+            return self.send_transaction_multi(target_address, amount, tick, hedged=True)
+        return self.send_transaction(target_address, amount, tick)
+
+    def query_balance(self, address=None, max_retries=3):
+        """Balance of an identity (the source wallet by default) via qubic-cli -getbalance, None if unknown"""
+        address = address or self.source_wallet['address']
+        for attempt in range(max_retries + 1):
+            node = self.get_next_node()
+            try:
+                stdout_text, stderr_text = self.run_cli(node, ['-getbalance', address])
+                match = re.search(r'Balance: (\d+)', stdout_text)
+                if match:
+                    return int(match.group(1))
+                logging.warning(f"Unexpected balance response from node {node}: {stdout_text.strip()} {stderr_text.strip()}")
+            except Exception as e:
+                logging.error(f"Error querying balance of {address}: {str(e)}")
+            self.switch_to_next_node()
+        return None
+
+    def required_amount(self):
+        """QUS needed to pay every listed payment in the configured mode, None for a stream"""
+        if not isinstance(self.payment_data, list):
+            return None
+        needed = sum(payment['amount'] for payment in self.payment_data)
+        if self.mode == "batched":
+            needed += SEND_MANY_FEE * len(pack_send_many(self.payment_data))
+        return needed
+
+    def preflight_balance(self):
+        """Query the source balance into a ledger and warn if the payments can't all be covered"""
+        if self.balance_ledger is None:
+            balance = self.query_balance()
+            if balance is None:
+                logging.warning("Could not query the source balance, sending without a funding check")
+                return None
+            self.balance_ledger = BalanceLedger(balance)
+        available = self.balance_ledger.available()
+        needed = self.required_amount()
+        print(f"Source balance: {available} QUS available")
+        if needed is not None and needed > available:
+            print(f"WARNING: the payments need {needed} QUS, {needed - available} QUS more than available. "
+                  f"Sending stops as soon as the next payment can't be covered.")
+        return available
+
+    @staticmethod
+    def _unit_cost(unit):
+        """QUS a pipeline unit takes from the source: a payment, or a SendMany batch with its fee"""
+        if isinstance(unit, list):
+            return sum(recipient['amount'] for recipient in unit) + SEND_MANY_FEE
+        return unit['amount']
+
+    def _reserve_funds(self, unit):
+        """Reserve a unit's cost in the ledger; False if the wallet can't cover it"""
+        return self.balance_ledger is None or self.balance_ledger.reserve(self._unit_cost(unit))
+
+    def _settle_funds(self, unit, confirmed):
+        if self.balance_ledger is None:
+            return
+        if confirmed:
+            self.balance_ledger.settle(self._unit_cost(unit))
+        else:
+            self.balance_ledger.release(self._unit_cost(unit))
+
+    def _record_unfunded(self, payments):
+        """Fail payments that were never sent because the source balance can't cover them"""
+        payments = list(payments)
+        if not payments:
+            return
+        for payment in payments:
+            record = self._payment_record(payment, None, None)
+            record['error'] = "insufficient balance"
+            self.failed_transactions.append(record)
+            self.unfunded_payments.append(payment)
+        PAYOUTS.inc(len(payments), result="unfunded")
+        self._journal_payments(payments, "failed")
+        logging.warning(f"{len(payments)} payments not sent: source balance of {self.source_wallet['address']} can't cover them")
 
     def verify_transaction(self, retry_count=0, max_retries=3):
         """Verify if the current transaction was accepted on the network"""
         if not self.current_tx_hash or not self.current_tx_tick:
             logging.warning("No current transaction to verify")
             return False
+        if retry_count:
+            RETRIES.inc(operation="verify")
+
+        # A hit in the tick index is final; a miss is left to the node to confirm
+        if retry_count == 0 and self.tick_index is not None and self.tick_index.lookup(self.current_tx_hash, self.current_tx_tick):
+            logging.info(f"Transaction {self.current_tx_hash} confirmed on tick {self.current_tx_tick} (tick index)")
+            return True
             
         try:
             node = self.get_next_node()
-            cmd = [
-                QUBIC_CLI_PATH,
-                '-nodeip', node,
-                '-checktxontick', str(self.current_tx_tick),
-                self.current_tx_hash
-            ]
+            args = ['-checktxontick', str(self.current_tx_tick), self.current_tx_hash]
             
             logging.info(f"Verifying transaction with node: {node}")
             
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = process.communicate(timeout=30)
-            stdout_text = stdout.decode()
-            stderr_text = stderr.decode()
+            stdout_text, stderr_text = self.run_cli(node, args)
             
             # Print the full verification output
             print(stdout_text)
@@ -361,28 +1844,97 @@ class QUSSender:
                 
             return False  # Consider as failed after max retries
 
-    def verify_specific_transaction(self, tx_hash, tick, retry_count=0, max_retries=3):
-        """Verify a specific transaction by hash and tick"""
+    def send_many_transaction(self, recipients, tick, max_retries=3):
+        """Send one QUTIL SendMany transaction paying up to SEND_MANY_MAX_RECIPIENTS recipients
+
+        qubic-cli schedules SendMany relative to the node's current tick, so the offset is
+        derived from the reserved tick and the tick actually used is read back from the receipt.
+        Returns (success, tx_hash, tick).
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            for recipient in recipients:
+                f.write(f"{recipient['wallet_address']} {recipient['amount']}\n")
+            batch_file = f.name
+
+        try:
+            for attempt in range(max_retries + 1):
+                node = self.get_next_node()
+                current_network_tick = self.tick_oracle.get_latest_tick()
+                offset = max(1, tick - current_network_tick) if current_network_tick is not None else self.tick_advance.advance()
+                args = [
+                    '-seed', self.source_wallet['seed'],
+                    '-scheduletick', str(offset),
+                    '-qutilsendtomanyv1', batch_file
+                ]
+
+                logging.info(f"Attempting SendMany to {len(recipients)} recipients with node: {node}")
+                try:
+                    stdout_text, stderr_text = self.run_cli(node, args)
+                    print(stdout_text)
+
+                    if "Transaction has been sent!" in stdout_text:
+                        tx_hash = self.extract_tx_hash(stdout_text)
+                        match = re.search(r'Tick: (\d+)', stdout_text)
+                        sent_tick = int(match.group(1)) if match else tick
+                        logging.info(f"SendMany successful: {self.source_wallet['address']} -> {len(recipients)} recipients, tick {sent_tick}, hash: {tx_hash}")
+                        return True, tx_hash, sent_tick
+
+                    logging.error(f"SendMany failed on node {node}: {stderr_text}")
+                except subprocess.TimeoutExpired:
+                    logging.error(f"SendMany timed out on node {node}")
+                except Exception as e:
+                    logging.error(f"Error processing SendMany: {str(e)}")
+
+                self.switch_to_next_node()
+                if attempt < max_retries:
+                    RETRIES.inc(operation="send_many")
+                    logging.info(f"Retrying SendMany (Attempt {attempt + 2}/{max_retries + 1})")
+
+            return False, None, tick
+        finally:
+            os.remove(batch_file)
+
+    def node_after(self, node):
+        """Return the best healthy node other than the given one"""
+        if not self.active_nodes:
+            raise Exception("No active nodes available")
+        return self.node_pool.best_node(exclude={node})
+
+    def verify_specific_transaction(self, tx_hash, tick, retry_count=0, max_retries=3, node=None):
+        """Verify a specific transaction by hash and tick
+
+        The tick transaction index is consulted first, so transactions sharing a tick
+        cost one fetch between them. When a node is given the check is pinned to it and retries move to the following
+        nodes without touching the shared current node, so concurrent checks don't interfere.
+        """
         if not tx_hash or not tick:
             logging.warning("Invalid transaction hash or tick for verification")
             return False
+        if retry_count:
+            RETRIES.inc(operation="verify")
+
+        # A hit in the tick index is final; a miss is left to the node to confirm
+        if retry_count == 0 and self.tick_index is not None and self.tick_index.lookup(tx_hash, tick):
+            logging.info(f"Transaction {tx_hash} confirmed on tick {tick} (tick index)")
+            return True
+
+        pinned = node is not None
+        if not pinned:
+            node = self.get_next_node()
+        next_node = self.node_after(node) if pinned else None
             
         try:
-            node = self.get_next_node()
-            cmd = [
-                QUBIC_CLI_PATH,
-                '-nodeip', node,
-                '-checktxontick', str(tick),
-                tx_hash
-            ]
+            args = ['-checktxontick', str(tick), tx_hash]
             
             logging.info(f"Verifying transaction {tx_hash} on tick {tick} with node: {node}")
             
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = process.communicate(timeout=30)
-            stdout_text = stdout.decode()
-            stderr_text = stderr.decode()
-            
+            stdout_text, stderr_text = self.run_cli(node, args)
+
+            # Check if tick hasn't passed yet
+            if "Please wait a bit more" in stdout_text:
+                logging.info(f"Tick {tick} not processed yet for transaction {tx_hash}")
+                return None  # Not yet confirmed
+
             # Check if transaction was accepted
             if "Found tx" in stdout_text and "Received end response message" in stdout_text:
                 logging.info(f"Transaction {tx_hash} confirmed on tick {tick}")
@@ -396,29 +1948,48 @@ class QUSSender:
             # Handle connection failures during verification
             if "Failed to connect" in stderr_text or "error -1" in stderr_text:
                 logging.warning(f"Node connection failed during verification")
-                self.switch_to_next_node()
+                if not pinned:
+                    self.switch_to_next_node()
                 
                 if retry_count < max_retries:
-                    return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries)
+                    return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries, node=next_node)
             
             # Handle other responses
             if retry_count < max_retries:
-                self.switch_to_next_node()
-                return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries)
+                if not pinned:
+                    self.switch_to_next_node()
+                return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries, node=next_node)
                 
             return False
             
         except Exception as e:
             logging.error(f"Error verifying transaction {tx_hash}: {str(e)}")
-            self.switch_to_next_node()
+            if not pinned:
+                self.switch_to_next_node()
             
             if retry_count < max_retries:
-                return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries)
+                return self.verify_specific_transaction(tx_hash, tick, retry_count + 1, max_retries, node=next_node)
                 
             return False
 
-    def reverify_failed_transactions(self, successful_transactions):
-        """Reverify all failed transactions to catch any that actually succeeded"""
+    def _reverify_one(self, failed_tx, node, node_limits, cancel_event):
+        """Reverify one failed transaction on the given node; None means cancelled before it ran"""
+        if cancel_event.is_set():
+            return None
+        with node_limits[node]:
+            if cancel_event.is_set():
+                return None
+            return bool(self.verify_specific_transaction(failed_tx['tx_hash'], failed_tx.get('tick'), node=node))
+
+    def reverify_failed_transactions(self, successful_transactions, progress_callback=None, cancel_event=None,
+                                     per_node_concurrency=REVERIFY_PER_NODE_CONCURRENCY, max_workers=REVERIFY_MAX_WORKERS):
+        """Reverify all failed transactions to catch any that actually succeeded
+
+        Checks run concurrently, spread round-robin over the active nodes with at most
+        per_node_concurrency checks per node. progress_callback(done, total, failed_tx, confirmed)
+        is called as each check finishes. Setting cancel_event stops checks that haven't
+        started yet; those transactions stay failed.
+        """
         if not self.failed_transactions:
             return
         
@@ -427,37 +1998,69 @@ class QUSSender:
         print("="*60)
         print(f"Reverifying {len(self.failed_transactions)} failed transactions...")
         print("This may take a few moments...\n")
+
+        if cancel_event is None:
+            cancel_event = self.reverify_cancel_event
+        cancel_event.clear()
+
+        nodes = self.node_pool.healthy_nodes() or list(self.active_nodes)
+        node_limits = {node: threading.Semaphore(per_node_concurrency) for node in nodes}
+        total = len(self.failed_transactions)
+        confirmed = [False] * total
+        done = 0
+
+        def report(failed_tx, is_confirmed):
+            if progress_callback:
+                progress_callback(done, total, failed_tx, is_confirmed)
+                return
+            status = "✓ Transaction actually succeeded!" if is_confirmed else "✗ Transaction still failed"
+            if not failed_tx.get('tx_hash'):
+                status = "✗ No transaction hash - transaction never sent"
+            print(f"Reverified {done}/{total}: {failed_tx['wallet_address'][:20]}...  {status}")
+
+        workers = max(1, min(max_workers, per_node_concurrency * len(nodes)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {}
+        try:
+            for idx, failed_tx in enumerate(self.failed_transactions):
+                # Skip transactions without hash (they never made it to the network)
+                if not failed_tx.get('tx_hash'):
+                    done += 1
+                    report(failed_tx, False)
+                    continue
+                node = nodes[idx % len(nodes)]
+                futures[executor.submit(self._reverify_one, failed_tx, node, node_limits, cancel_event)] = idx
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                failed_tx = self.failed_transactions[idx]
+                is_confirmed = future.result()
+                if is_confirmed is None:
+                    continue  # Cancelled before it ran
+                confirmed[idx] = is_confirmed
+                done += 1
+                if is_confirmed:
+                    logging.info(f"Reverification: Transaction {failed_tx['tx_hash']} to {failed_tx['wallet_address']} was actually successful")
+                report(failed_tx, is_confirmed)
+        except KeyboardInterrupt:
+            cancel_event.set()
+            raise
+        finally:
+            if cancel_event.is_set():
+                for future in futures:
+                    future.cancel()
+                logging.warning(f"Reverification cancelled after {done}/{total} checks")
+            executor.shutdown(wait=True)
+
+        # Keep the original order in both lists
+        actually_successful = [tx for idx, tx in enumerate(self.failed_transactions) if confirmed[idx]]
+        still_failed = [tx for idx, tx in enumerate(self.failed_transactions) if not confirmed[idx]]
         
-        actually_successful = []
-        still_failed = []
-        
-        for idx, failed_tx in enumerate(self.failed_transactions):
-            tx_hash = failed_tx.get('tx_hash')
-            tick = failed_tx.get('tick')
-            wallet_address = failed_tx['wallet_address']
-            amount = failed_tx['amount']
-            
-            print(f"Reverifying {idx+1}/{len(self.failed_transactions)}: {wallet_address[:20]}...")
-            
-            # Skip transactions without hash (they never made it to the network)
-            if not tx_hash:
-                print(f"  ✗ No transaction hash - transaction never sent")
-                still_failed.append(failed_tx)
-                continue
-            
-            # Verify the transaction
-            is_confirmed = self.verify_specific_transaction(tx_hash, tick)
-            
-            if is_confirmed:
-                print(f"  ✓ Transaction actually succeeded!")
-                logging.info(f"Reverification: Transaction {tx_hash} to {wallet_address} was actually successful")
-                actually_successful.append(failed_tx)
-            else:
-                print(f"  ✗ Transaction still failed")
-                still_failed.append(failed_tx)
-            
-            time.sleep(1)  # Brief pause between verifications
-        
+        self._journal_payments(actually_successful, "confirmed")
+        if self.balance_ledger is not None:
+            for tx in actually_successful:
+                self.balance_ledger.spend(tx['amount'])
+
         # Update the lists
         if actually_successful:
             print(f"\n{len(actually_successful)} transaction(s) were actually successful!")
@@ -469,6 +2072,10 @@ class QUSSender:
         
         print(f"After reverification: {len(successful_transactions)} successful, {len(still_failed)} failed\n")
 
+    def cancel_reverification(self):
+        """Stop a running reverification; unchecked transactions stay failed"""
+        self.reverify_cancel_event.set()
+
     def save_failed_transactions(self):
         """Save failed transaction data to a file"""
         try:
@@ -478,20 +2085,25 @@ class QUSSender:
         except Exception as e:
             logging.error(f"Error saving failed transactions: {str(e)}")
 
-    def create_transaction_report(self, successful_transactions):
+    def create_transaction_report(self, successful_transactions, failed_transactions=None):
         """Create a detailed report of all successful transactions"""
         report_file = "transaction_report.txt"
+        if failed_transactions is None:
+            failed_transactions = self.failed_transactions
+        sources = sorted({tx['source_address'] for tx in successful_transactions if tx.get('source_address')})
         try:
             with open(report_file, 'w') as f:
                 f.write("QUBIC TRANSACTION REPORT\n")
                 f.write("=======================\n\n")
                 f.write(f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Source wallet: {self.source_wallet['address']}\n\n")
+                f.write(f"Source wallet: {', '.join(sources) or self.source_wallet['address']}\n\n")
                 f.write("TRANSACTION DETAILS:\n")
                 f.write("-----------------\n\n")
                 
                 for idx, tx in enumerate(successful_transactions):
                     f.write(f"Transaction #{idx+1}:\n")
+                    if tx.get('source_address'):
+                        f.write(f"  Source Wallet: {tx['source_address']}\n")
                     f.write(f"  Recipient Address: {tx['wallet_address']}\n")
                     f.write(f"  Amount: {tx['amount']} QUS\n")
                     if tx.get('sols'):
@@ -501,8 +2113,8 @@ class QUSSender:
                     f.write(f"  Transaction Link: https://explorer.qubic.org/network/tx/{tx['tx_hash']}\n\n")
                 
                 f.write(f"\nTotal successful transactions: {len(successful_transactions)}\n")
-                if self.failed_transactions:
-                    f.write(f"Failed transactions: {len(self.failed_transactions)} (see failed_transactions.json for details)\n")
+                if failed_transactions:
+                    f.write(f"Failed transactions: {len(failed_transactions)} (see {self.failed_tx_file} for details)\n")
             
             print(f"\nTransaction report created: {report_file}")
             return True
@@ -510,124 +2122,406 @@ class QUSSender:
             logging.error(f"Error creating transaction report: {str(e)}")
             return False
 
+    def process_sequential(self, successful_transactions):
+        """Send, wait for the target tick and verify each payment before moving to the next"""
+        # Process transactions one by one
+        payments = iter(self.payment_data)
+        for idx, payment in enumerate(payments):
+            # Stop before spending a CLI call and a tick wait on a payment the wallet can't cover
+            if not self._reserve_funds(payment):
+                print(f"\nSource balance can't cover {payment['amount']} QUS to {payment['wallet_address']}, stopping")
+                self._record_unfunded([payment])
+                if self.drain_unfunded:
+                    self._record_unfunded(payments)
+                break
+
+            # Get current network tick for scheduling
+            current_network_tick = self.tick_oracle.get_latest_tick()
+            if current_network_tick is None:
+                logging.warning("Failed to get current network tick, retrying in 5 seconds")
+                time.sleep(5)
+                continue
+            
+            # Calculate target tick (current + adaptive tick advance)
+            advance = self.tick_advance.advance()
+            target_tick = current_network_tick + advance
+            
+            # Get payment details
+            target_address = payment['wallet_address']
+            amount = payment['amount']
+            sols_info = payment['sols']
+            
+            print(f"\nTransaction {idx+1}/{len(self.payment_data) if isinstance(self.payment_data, list) else '?'}")
+            print(f"--------------------------------------------------")
+            print(f"Target Address: {target_address}")
+            print(f"Amount: {amount} QUS")
+            if sols_info:
+                print(f"Sols Info: {sols_info}")
+            print(f"Current Network Tick: {current_network_tick}")
+            print(f"Target Tick: {target_tick} ({advance} ticks ahead)")
+            
+            # Send transaction
+            print(f"Sending transaction...")
+            self._journal_payments([payment], "submitting", tick=target_tick)
+            success, tx_hash = self.submit_transaction(target_address, amount, target_tick)
+            
+            if success and tx_hash:
+                self._journal_payments([payment], "submitted", tx_hash, target_tick)
+                # Store current transaction info for verification
+                self.current_tx_hash = tx_hash
+                self.current_tx_target = target_address
+                self.current_tx_tick = target_tick
+                self.current_tx_amount = amount
+                
+                # Wait for tick to be confirmed
+                print(f"Waiting for tick {target_tick} to be confirmed by the network...")
+                wait_for_tick_confirmation(target_tick, oracle=self.tick_oracle)
+                
+                # Verify transaction
+                print(f"Verifying transaction {tx_hash}...")
+                verification_result = self.verify_transaction()
+                
+                # If transaction is still pending, keep checking
+                while verification_result is None:
+                    print(f"Transaction still pending. Checking again on the next tick...")
+                    latest_tick, _ = self.tick_oracle.snapshot()
+                    self.tick_oracle.wait_for_tick((latest_tick or target_tick) + 1, timeout=5)
+                    verification_result = self.verify_transaction()
+                
+                self.tick_advance.record_outcome(verification_result)
+                self._settle_funds(payment, verification_result)
+                if verification_result:
+                    print(f"Transaction verified successfully!")
+                else:
+                    print(f"Transaction verification failed!")
+                self._record_result(payment, tx_hash, target_tick, verification_result, successful_transactions)
+            else:
+                print(f"Failed to send transaction to {target_address}")
+                self._settle_funds(payment, False)
+                self._record_result(payment, None, target_tick, False, successful_transactions)
+            
+            # Brief pause between transactions
+            time.sleep(2)
+
+    def _payment_record(self, payment, tx_hash, tick):
+        """Build the result entry stored in the successful/failed transaction lists"""
+        record = {
+            'wallet_address': payment['wallet_address'],
+            'amount': payment['amount'],
+            'sols': payment['sols'],
+            'tx_hash': tx_hash,
+            'tick': tick
+        }
+        if payment.get('journal_id') is not None:
+            record['journal_id'] = payment['journal_id']
+        return record
+
+    def _journal_payments(self, payments, state, tx_hash=None, tick=None):
+        """Journal a state transition for payments; the submitting intent is committed at once"""
+        if self.journal is None or self.journal_run_id is None:
+            return
+        for payment in payments:
+            if payment.get('journal_id') is not None:
+                self.journal.record(self.journal_run_id, payment['journal_id'], state, tx_hash, tick)
+        if state == "submitting":
+            self.journal.flush()
+
+    def _record_result(self, payment, tx_hash, tick, confirmed, successful_transactions):
+        """Store and journal the final outcome of one payment"""
+        record = self._payment_record(payment, tx_hash, tick)
+        PAYOUTS.inc(result="confirmed" if confirmed else "failed")
+        if confirmed:
+            PAYOUT_THROUGHPUT.mark()
+            successful_transactions.append(record)
+        else:
+            self.failed_transactions.append(record)
+        self._journal_payments([payment], "confirmed" if confirmed else "failed", tx_hash, tick)
+
+    def _journal_stream(self, payments):
+        """Journal streamed payments as planned while they are pulled (committed with the next submit)"""
+        for payment in payments:
+            self.journal.add_payments(self.journal_run_id, [payment], commit=False)
+            yield payment
+
+    @staticmethod
+    def _unit_payments(unit):
+        """Original payments behind a pipeline unit (a payment, or a SendMany batch of recipients)"""
+        if isinstance(unit, list):
+            return [payment for recipient in unit for payment in recipient['payments']]
+        return [unit]
+
+    def _pipeline(self, units, send_unit, describe_unit, on_decided, window=PIPELINE_WINDOW):
+        """Tick-slot pipeline shared by the pipelined and batched modes
+
+        Each unit gets the next free tick of the source wallet and is submitted with
+        send_unit(unit, tick) -> (success, tx_hash, tick). Up to `window` units are in
+        flight; on_decided(unit, tx_hash, tick, confirmed) is called once per unit.
+        """
+        source_address = self.source_wallet['address']
+        pending = enumerate(units)  # pulled lazily, so units may be a stream
+        next_unit = next(pending, None)
+        submitting = {}  # future -> (index, unit, tick)
+        awaiting = []  # (unit, tx_hash, tick) sent and waiting for their tick to pass
+        verifying = {}  # future -> awaiting entry being checked on its passed tick
+        total = len(units) if hasattr(units, '__len__') else "?"
+
+        def in_flight():
+            return len(submitting) + len(awaiting) + len(verifying)
+
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            while next_unit is not None or in_flight():
+                current_network_tick = self.tick_oracle.get_latest_tick()
+                if current_network_tick is None:
+                    logging.warning("Failed to get current network tick, retrying in 5 seconds")
+                    time.sleep(5)
+                    continue
+                self.tick_slots.release_passed(source_address, current_network_tick)
+
+                # Fill the window, every unit gets the next free tick of this source
+                while next_unit is not None and in_flight() < window:
+                    idx, unit = next_unit
+                    if not self._reserve_funds(unit):
+                        # The wallet can't cover this unit: stop submitting instead of burning ticks on it
+                        print(f"Source balance can't cover transaction {idx+1}: {describe_unit(unit)}, stopping")
+                        self._record_unfunded(self._unit_payments(unit))
+                        if self.drain_unfunded:
+                            self._record_unfunded(p for _, rest in pending for p in self._unit_payments(rest))
+                        next_unit = None
+                        break
+                    next_unit = next(pending, None)
+                    target_tick = self.tick_slots.reserve(source_address, current_network_tick + self.tick_advance.advance())
+                    print(f"Transaction {idx+1}/{total}: {describe_unit(unit)} on tick {target_tick}")
+                    self._journal_payments(self._unit_payments(unit), "submitting", tick=target_tick)
+                    future = executor.submit(send_unit, unit, target_tick)
+                    submitting[future] = (idx, unit, target_tick)
+
+                # Collect finished submissions
+                for future in [f for f in submitting if f.done()]:
+                    idx, unit, target_tick = submitting.pop(future)
+                    try:
+                        success, tx_hash, sent_tick = future.result()
+                    except Exception as e:
+                        logging.error(f"Error sending transaction {idx+1}: {str(e)}")
+                        success, tx_hash, sent_tick = False, None, target_tick
+
+                    if success and tx_hash:
+                        self._journal_payments(self._unit_payments(unit), "submitted", tx_hash, sent_tick)
+                        awaiting.append((unit, tx_hash, sent_tick))
+                    else:
+                        print(f"Failed to send transaction {idx+1}: {describe_unit(unit)}")
+                        self._settle_funds(unit, False)
+                        on_decided(unit, None, target_tick, False)
+
+                # Verify transactions whose tick the network has moved past, off the scheduling thread
+                for entry in [e for e in awaiting if e[2] < current_network_tick]:
+                    awaiting.remove(entry)
+                    verifying[executor.submit(self.verify_specific_transaction, entry[1], entry[2])] = entry
+
+                for future in [f for f in verifying if f.done()]:
+                    entry = verifying.pop(future)
+                    unit, tx_hash, tick = entry
+                    try:
+                        verification_result = future.result()
+                    except Exception as e:
+                        logging.error(f"Error verifying transaction {tx_hash}: {str(e)}")
+                        verification_result = None
+                    if verification_result is None:
+                        awaiting.append(entry)  # Node has not processed the tick yet, check on the next pass
+                        continue
+
+                    self.tick_advance.record_outcome(verification_result)
+                    self._settle_funds(unit, verification_result)
+                    if verification_result:
+                        print(f"Transaction {tx_hash} verified on tick {tick}")
+                    else:
+                        print(f"Transaction {tx_hash} verification failed on tick {tick}")
+                    on_decided(unit, tx_hash, tick, verification_result)
+
+                # Wake up on the next tick, or after the poll interval to collect submissions and checks
+                self.tick_oracle.wait_for_tick(current_network_tick + 1, timeout=PIPELINE_POLL_INTERVAL)
+
+    def process_pipelined(self, successful_transactions, window=PIPELINE_WINDOW):
+        """Keep up to `window` payments in flight, each on its own tick slot, verifying as ticks pass"""
+        def send_unit(payment, tick):
+            success, tx_hash = self.submit_transaction(payment['wallet_address'], payment['amount'], tick)
+            return success, tx_hash, tick
+
+        def on_decided(payment, tx_hash, tick, confirmed):
+            self._record_result(payment, tx_hash, tick, confirmed, successful_transactions)
+
+        self._pipeline(
+            self.payment_data, send_unit,
+            lambda payment: f"{payment['amount']} QUS -> {payment['wallet_address']}",
+            on_decided, window
+        )
+
+    def process_batched(self, successful_transactions, window=PIPELINE_WINDOW):
+        """Pack payments into QUTIL SendMany transactions and pipeline those like single transfers
+
+        Every original payment of a batch is reported with the batch transaction hash and tick.
+        """
+        if isinstance(self.payment_data, list):
+            batches = pack_send_many(self.payment_data)
+            print(f"Packed {len(self.payment_data)} payments into {len(batches)} SendMany transactions")
+        else:
+            batches = iter_send_many_batches(self.payment_data)
+
+        def on_decided(batch, tx_hash, tick, confirmed):
+            for payment in self._unit_payments(batch):
+                self._record_result(payment, tx_hash, tick, confirmed, successful_transactions)
+
+        self._pipeline(
+            batches, self.send_many_transaction,
+            lambda batch: f"SendMany to {len(batch)} recipients, {sum(r['amount'] for r in batch)} QUS",
+            on_decided, window
+        )
+
+    def process_async(self, successful_transactions, window=PIPELINE_WINDOW):
+        """Process payments with the asyncio engine (concurrent CLI subprocesses, one event loop)"""
+        asyncio.run(AsyncQubicEngine(self).process_payments(self.payment_data, successful_transactions, window))
+
+    def process(self, successful_transactions):
+        """Send every payment in the configured mode"""
+        if self.mode == "pipelined":
+            print(f"Processing transactions pipelined, up to {PIPELINE_WINDOW} in flight, one tick slot each\n")
+            self.process_pipelined(successful_transactions)
+        elif self.mode == "batched":
+            print(f"Processing transactions as SendMany batches of up to {SEND_MANY_MAX_RECIPIENTS} recipients\n")
+            self.process_batched(successful_transactions)
+        elif self.mode == "async":
+            print(f"Processing transactions with the asyncio engine, up to {PIPELINE_WINDOW} in flight\n")
+            self.process_async(successful_transactions)
+        else:
+            print(f"Processing transactions one at a time, waiting for each tick to complete\n")
+            self.process_sequential(successful_transactions)
+
+    def run_unattended(self, successful_transactions):
+        """Headless run for the daemon: journal, send, reverify; no prompts, probing or report files
+
+        The node pool and tick oracle are expected to be warm and shared. Confirmed payments
+        are appended to successful_transactions as they are decided, so progress can be read
+        while the run is going. Failures are left in failed_transactions for the caller.
+        """
+        streaming = not isinstance(self.payment_data, list)
+        try:
+            if self.balance_ledger is None:
+                self.preflight_balance()
+            if self.journal is not None:
+                if self.journal_run_id is None:
+                    self.journal_run_id = self.journal.start_run(
+                        self.source_wallet['address'], self.mode, [] if streaming else self.payment_data)
+                if streaming:
+                    self.payment_data = self._journal_stream(self.payment_data)
+
+            self.process(successful_transactions)
+            if self.failed_transactions:
+                self.reverify_failed_transactions(successful_transactions)
+
+            if self.journal is not None:
+                self.journal.finish_run(self.journal_run_id)
+        finally:
+            if self.journal is not None:
+                self.journal.flush()
+
+    def resume_from_journal(self):
+        """Reconcile the journaled run and keep only the payments that still have to be sent
+
+        Confirmed payments are carried over to the report. Submitted ones are verified on
+        their tick: confirmed ones are kept, missing ones are sent again. Payments that were
+        being submitted when the run stopped have no known hash and are never resent
+        automatically; they are listed in unresolved_transactions for a manual check.
+        """
+        rows = self.journal.load_payments(self.journal_run_id)
+        pending = []
+        for row in rows:
+            state = row.pop('state')
+            if state == "confirmed":
+                self.resumed_successful.append(self._payment_record(row, row['tx_hash'], row['tick']))
+            elif state == "submitted":
+                wait_for_tick_confirmation(row['tick'] + 1, oracle=self.tick_oracle)
+                is_confirmed = self.verify_specific_transaction(row['tx_hash'], row['tick'])
+                if is_confirmed:
+                    self._record_result(row, row['tx_hash'], row['tick'], True, self.resumed_successful)
+                elif is_confirmed is None:
+                    self.unresolved_transactions.append(row)
+                else:
+                    self._journal_payments([row], "failed", row['tx_hash'], row['tick'])
+                    pending.append(row)
+            elif state == "submitting":
+                self.unresolved_transactions.append(row)
+            else:
+                pending.append(row)
+
+        self.journal.flush()
+        self.payment_data = pending
+        print(f"Resumed run {self.journal_run_id}: {len(self.resumed_successful)} already confirmed, "
+              f"{len(pending)} to send, {len(self.unresolved_transactions)} unresolved")
+        for row in self.unresolved_transactions:
+            print(f"  Unresolved (check manually, not resent): {row['wallet_address']}, {row['amount']} QUS, tick {row['tick']}")
+        return pending
+
     def run(self):
-        """Run the sender processing one transaction at a time"""
+        """Run the sender in the configured mode, then reverify, report and offer retries"""
         try:
-            print("\nQubic Excel-based QUS Sender - Sequential Mode")
+            print(f"\nQubic Excel-based QUS Sender - {self.mode.capitalize()} Mode")
             print("=============================================")
             
-            # Display all transactions for review before starting
-            print("\nREVIEW ALL PLANNED TRANSACTIONS:")
-            print("--------------------------------")
-            total_amount = 0
-            print(f"{'#':<5} {'Wallet Address':<50} {'Amount (QUS)':<15} {'Sols Info':<20}")
-            print("-" * 90)
-            for idx, payment in enumerate(self.payment_data):
-                address = payment['wallet_address']
-                amount = payment['amount']
-                sols = payment['sols'] if payment['sols'] else "N/A"
-                print(f"{idx+1:<5} {address:<50} {amount:<15} {sols:<20}")
-                total_amount += amount
-            
-            print("-" * 90)
-            print(f"Total transactions: {len(self.payment_data)}")
-            print(f"Total QUS to be sent: {total_amount}")
+            streaming = not isinstance(self.payment_data, list)
+            if streaming:
+                # A stream can't be listed up front; rows are validated as they are read
+                print("\nPayments are streamed from the input file and validated as they are read.")
+                print("Invalid rows are skipped and logged with their line number.")
+            else:
+                # Display all transactions for review before starting
+                print("\nREVIEW ALL PLANNED TRANSACTIONS:")
+                print("--------------------------------")
+                total_amount = 0
+                print(f"{'#':<5} {'Wallet Address':<50} {'Amount (QUS)':<15} {'Sols Info':<20}")
+                print("-" * 90)
+                for idx, payment in enumerate(self.payment_data):
+                    address = payment['wallet_address']
+                    amount = payment['amount']
+                    sols = payment['sols'] if payment['sols'] else "N/A"
+                    print(f"{idx+1:<5} {address:<50} {amount:<15} {sols:<20}")
+                    total_amount += amount
+                
+                print("-" * 90)
+                print(f"Total transactions: {len(self.payment_data)}")
+                print(f"Total QUS to be sent: {total_amount}")
             
+            # Pre-flight funding check, the ledger then tracks the balance while sending
+            self.preflight_balance()
+
             # Confirm before proceeding
             proceed = input("\nPlease review the above transactions. Proceed with sending? (y/n): ")
             if proceed.lower() != 'y':
                 print("Operation cancelled by user")
                 return
             
-            print(f"\nProcessing transactions one at a time, waiting for each tick to complete")
-            print(f"Available nodes: {', '.join(self.active_nodes)}")
-            print(f"Starting with node: {self.active_nodes[self.current_node_index]}\n")
+            # Probe every node in parallel so dead ones are skipped from the first call
+            self.node_pool.probe_all()
+            print(f"Available nodes: {', '.join(self.node_pool.healthy_nodes()) or 'none responding'}")
+            print(f"Starting with node: {self.get_next_node()}\n")
+            
+            # One background poll serves every tick lookup and wait of this run
+            self.tick_oracle.start()
+
+            # Journal the plan before anything is sent (streamed payments as they are read)
+            if self.journal is not None:
+                planned = [] if streaming else self.payment_data
+                if self.journal_run_id is None:
+                    self.journal_run_id = self.journal.start_run(self.source_wallet['address'], self.mode, planned)
+                    print(f"Journaling run {self.journal_run_id} to {self.journal.path}")
+                else:
+                    self.journal.add_payments(self.journal_run_id, planned)
+                if streaming:
+                    self.payment_data = self._journal_stream(self.payment_data)
             
             # List to track successful transactions
-            successful_transactions = []
+            successful_transactions = list(self.resumed_successful)
+            self.resumed_successful = []
             
-            # Process transactions one by one
-            for idx, payment in enumerate(self.payment_data):
-                # Get current network tick for scheduling
-                current_network_tick = get_latest_network_tick()
-                if current_network_tick is None:
-                    logging.warning("Failed to get current network tick, retrying in 5 seconds")
-                    time.sleep(5)
-                    continue
-                
-                # Calculate target tick (current + TICK_ADVANCE)
-                target_tick = current_network_tick + TICK_ADVANCE
-                
-                # Get payment details
-                target_address = payment['wallet_address']
-                amount = payment['amount']
-                sols_info = payment['sols']
-                
-                print(f"\nTransaction {idx+1}/{len(self.payment_data)}")
-                print(f"--------------------------------------------------")
-                print(f"Target Address: {target_address}")
-                print(f"Amount: {amount} QUS")
-                if sols_info:
-                    print(f"Sols Info: {sols_info}")
-                print(f"Current Network Tick: {current_network_tick}")
-                print(f"Target Tick: {target_tick} ({TICK_ADVANCE} ticks ahead)")
-                
-                # Send transaction
-                print(f"Sending transaction...")
-                success, tx_hash = self.send_transaction(target_address, amount, target_tick)
-                
-                if success and tx_hash:
-                    # Store current transaction info for verification
-                    self.current_tx_hash = tx_hash
-                    self.current_tx_target = target_address
-                    self.current_tx_tick = target_tick
-                    self.current_tx_amount = amount
-                    
-                    # Wait for tick to be confirmed
-                    print(f"Waiting for tick {target_tick} to be confirmed by the network...")
-                    wait_for_tick_confirmation(target_tick)
-                    
-                    # Verify transaction
-                    print(f"Verifying transaction {tx_hash}...")
-                    verification_result = self.verify_transaction()
-                    
-                    # If transaction is still pending, keep checking
-                    while verification_result is None:
-                        print(f"Transaction still pending. Checking again in 5 seconds...")
-                        time.sleep(5)
-                        verification_result = self.verify_transaction()
-                    
-                    if verification_result:
-                        print(f"Transaction verified successfully!")
-                        # Add to successful transactions list
-                        successful_transactions.append({
-                            'wallet_address': target_address,
-                            'amount': amount,
-                            'sols': sols_info,
-                            'tx_hash': tx_hash,
-                            'tick': target_tick
-                        })
-                    else:
-                        print(f"Transaction verification failed!")
-                        self.failed_transactions.append({
-                            'wallet_address': target_address,
-                            'amount': amount,
-                            'sols': sols_info,
-                            'tx_hash': tx_hash,
-                            'tick': target_tick
-                        })
-                else:
-                    print(f"Failed to send transaction to {target_address}")
-                    self.failed_transactions.append({
-                        'wallet_address': target_address,
-                        'amount': amount,
-                        'sols': sols_info,
-                        'tx_hash': None,
-                        'tick': target_tick
-                    })
-                
-                # Brief pause between transactions
-                time.sleep(2)
+            self.process(successful_transactions)
             
             # Before finalizing results, reverify all failed transactions
             if self.failed_transactions:
@@ -644,6 +2538,9 @@ class QUSSender:
                 print("\nFailed transactions:")
                 for failed in self.failed_transactions:
                     print(f"  Address: {failed['wallet_address']}, Amount: {failed['amount']} QUS")
+                if self.unfunded_payments:
+                    print(f"\n{len(self.unfunded_payments)} payments ({sum(p['amount'] for p in self.unfunded_payments)} QUS) "
+                          f"were not sent because the source balance ran out")
                 
                 self.save_failed_transactions()
                 
@@ -654,6 +2551,12 @@ class QUSSender:
                     # Copy failed transactions and clear the list
                     retry_payments = self.failed_transactions.copy()
                     self.failed_transactions = []
+                    self.unfunded_payments = []
+                    if self.balance_ledger is not None and self.balance_ledger.pending == 0:
+                        # Pick up a top-up made in the meantime
+                        balance = self.query_balance()
+                        if balance is not None:
+                            self.balance_ledger.refresh(balance)
                     
                     # Update payment data to retry only failed ones
                     self.payment_data = retry_payments
@@ -663,6 +2566,9 @@ class QUSSender:
                     self.run()
             else:
                 print("\nAll transactions completed successfully!")
+
+            if self.journal is not None and self.journal_run_id is not None:
+                self.journal.finish_run(self.journal_run_id)
         
         except KeyboardInterrupt:
             print("\nOperation interrupted by user")
@@ -670,16 +2576,722 @@ class QUSSender:
         except Exception as e:
             logging.error(f"Error in operation: {str(e)}")
             raise
+        finally:
+            self.close_broadcasts()
+            if self.journal is not None:
+                self.journal.flush()
+            if self._owns_tick_oracle:
+                self.tick_oracle.stop()
+
+class AsyncQubicEngine:
+    """asyncio execution engine for a QUSSender: CLI calls and RPC polls without a thread per operation
+
+    qubic-cli runs through asyncio.create_subprocess_exec under a global and a per-node
+    semaphore, retries are iterative, and cancelled or timed-out CLI processes are killed.
+    The tick is polled by a single task (aiohttp if installed, else the blocking request
+    in the default executor) and shared with the sender's tick oracle.
+    """
+    def __init__(self, sender, max_concurrency=ASYNC_MAX_CONCURRENCY, per_node_concurrency=ASYNC_PER_NODE_CONCURRENCY):
+        self.sender = sender
+        self.max_concurrency = max_concurrency
+        self.per_node_concurrency = per_node_concurrency
+        self._global_limit = None
+        self._node_limits = {}
+        self._tick = None
+        self._tick_changed = None
+        self._http = None
+
+    async def run_cli(self, node, args, timeout=CLI_TIMEOUT):
+        """Async counterpart of QUSSender.run_cli, returns (stdout_text, stderr_text)"""
+        if node not in self._node_limits:
+            self._node_limits[node] = asyncio.Semaphore(self.per_node_concurrency)
+        async with self._global_limit, self._node_limits[node]:
+            started = time.time()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    QUBIC_CLI_PATH, '-nodeip', node, *args,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+            except Exception:
+                self.sender.node_pool.record_failure(node)
+                raise
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                if isinstance(e, asyncio.TimeoutError):
+                    self.sender.node_pool.record_failure(node, time.time() - started)
+                    observe_cli_call(node, args, "", time.time() - started, "timeout")
+                    raise subprocess.TimeoutExpired(QUBIC_CLI_PATH, timeout)
+                raise
+
+        elapsed = time.time() - started
+        stdout_text = stdout.decode()
+        stderr_text = stderr.decode()
+        if "Failed to connect" in stderr_text or "error -1" in stderr_text:
+            self.sender.node_pool.record_failure(node, elapsed)
+            observe_cli_call(node, args, stdout_text, elapsed, "connect_error")
+        else:
+            observe_cli_call(node, args, stdout_text, elapsed, "ok")
+            self.sender.node_pool.record_success(node, elapsed)
+            self.sender.tick_advance.observe_cli(node, args, stdout_text, elapsed)
+        return stdout_text, stderr_text
+
+    async def fetch_latest_tick(self):
+        """Latest network tick over async HTTP, None on failure"""
+        if self._http is None:
+            return await asyncio.get_running_loop().run_in_executor(None, get_latest_network_tick)
+        started = time.time()
+        try:
+            async with self._global_limit:
+                async with self._http.get(QUBIC_API_ENDPOINT) as response:
+                    if response.status != 200:
+                        RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="http_error")
+                        logging.error(f"API request failed with status code {response.status}")
+                        return None
+                    data = await response.json()
+                    RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="ok")
+                    return data.get("latestTick")
+        except Exception as e:
+            RPC_SECONDS.observe(time.time() - started, endpoint="latestTick", outcome="error")
+            logging.error(f"Error querying latest tick: {str(e)}")
+            return None
+
+    async def _watch_ticks(self):
+        """Single poll loop feeding every waiter of this engine"""
+        while True:
+            tick = await self.fetch_latest_tick()
+            if tick is not None:
+                self.sender.tick_oracle.update(tick)
+                if self._tick is None or tick > self._tick:
+                    async with self._tick_changed:
+                        self._tick = tick
+                        self._tick_changed.notify_all()
+            await asyncio.sleep(TICK_ORACLE_POLL_INTERVAL)
+
+    async def wait_for_tick(self, target_tick):
+        started = time.time()
+        async with self._tick_changed:
+            await self._tick_changed.wait_for(lambda: self._tick is not None and self._tick >= target_tick)
+        TICK_WAIT_SECONDS.observe(time.time() - started)
+        return self._tick
+
+    async def send_transaction(self, target_address, amount, tick, max_retries=3):
+        """Submit a transfer, moving to the next node on failure; returns (success, tx_hash)"""
+        args = [
+            '-seed', self.sender.source_wallet['seed'],
+            '-sendtoaddressintick', target_address,
+            str(amount),
+            str(tick)
+        ]
+        for attempt in range(max_retries + 1):
+            node = self.sender.get_next_node()
+            try:
+                stdout_text, stderr_text = await self.run_cli(node, args)
+                if "Transaction has been sent!" in stdout_text:
+                    tx_hash = self.sender.extract_tx_hash(stdout_text)
+                    logging.info(f"Transaction successful: {self.sender.source_wallet['address']} -> {target_address} for {amount} QUS, tick {tick}, hash: {tx_hash}")
+                    return True, tx_hash
+                logging.error(f"Transaction failed on node {node}: {stderr_text}")
+            except subprocess.TimeoutExpired:
+                logging.error(f"Transaction timed out on node {node}")
+            except Exception as e:
+                logging.error(f"Error processing transaction: {str(e)}")
+
+            self.sender.switch_to_next_node()
+            if attempt < max_retries:
+                RETRIES.inc(operation="send")
+                logging.info(f"Retrying transaction to {target_address} (Attempt {attempt + 2}/{max_retries + 1})")
+        return False, None
+
+    async def verify_transaction(self, tx_hash, tick, max_retries=3):
+        """True/False once the node answered, None while the tick isn't processed yet"""
+        loop = asyncio.get_running_loop()
+        if self.sender.tick_index is not None and await loop.run_in_executor(None, self.sender.tick_index.lookup, tx_hash, tick):
+            logging.info(f"Transaction {tx_hash} confirmed on tick {tick} (tick index)")
+            return True
+
+        for attempt in range(max_retries + 1):
+            if attempt:
+                RETRIES.inc(operation="verify")
+            node = self.sender.get_next_node()
+            try:
+                stdout_text, stderr_text = await self.run_cli(node, ['-checktxontick', str(tick), tx_hash])
+                if "Please wait a bit more" in stdout_text:
+                    return None
+                if "Found tx" in stdout_text and "Received end response message" in stdout_text:
+                    logging.info(f"Transaction {tx_hash} confirmed on tick {tick}")
+                    return True
+                if "Can NOT find tx" in stdout_text:
+                    logging.info(f"Transaction {tx_hash} not found on tick {tick}")
+                    return False
+                logging.warning(f"Unexpected response for tx verification on node {node}: {stdout_text}")
+            except Exception as e:
+                logging.error(f"Error verifying transaction {tx_hash}: {str(e)}")
+            self.sender.switch_to_next_node()
+        return False
+
+    async def _pay(self, payment, successful_transactions):
+        """Schedule, submit and verify one payment on its own tick slot"""
+        source_address = self.sender.source_wallet['address']
+        current_tick = await self.wait_for_tick(0)
+        self.sender.tick_slots.release_passed(source_address, current_tick)
+        target_tick = self.sender.tick_slots.reserve(source_address, current_tick + self.sender.tick_advance.advance())
+        self.sender._journal_payments([payment], "submitting", tick=target_tick)
+        success, tx_hash = await self.send_transaction(payment['wallet_address'], payment['amount'], target_tick)
+        if not (success and tx_hash):
+            print(f"Failed to send transaction to {payment['wallet_address']}")
+            self.sender._settle_funds(payment, False)
+            self.sender._record_result(payment, None, target_tick, False, successful_transactions)
+            return
+        self.sender._journal_payments([payment], "submitted", tx_hash, target_tick)
+
+        latest_tick = await self.wait_for_tick(target_tick + 1)
+        verification_result = await self.verify_transaction(tx_hash, target_tick)
+        while verification_result is None:
+            latest_tick = await self.wait_for_tick(latest_tick + 1)
+            verification_result = await self.verify_transaction(tx_hash, target_tick)
+
+        self.sender.tick_advance.record_outcome(verification_result)
+        self.sender._settle_funds(payment, verification_result)
+        print(f"Transaction {tx_hash} {'verified' if verification_result else 'verification failed'} on tick {target_tick}")
+        self.sender._record_result(payment, tx_hash, target_tick, verification_result, successful_transactions)
+
+    async def process_payments(self, payments, successful_transactions, window=PIPELINE_WINDOW):
+        """Drive up to `window` payments concurrently; payments may be a stream"""
+        self._global_limit = asyncio.Semaphore(self.max_concurrency)
+        self._tick_changed = asyncio.Condition()
+        if aiohttp is not None:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        watcher = asyncio.create_task(self._watch_ticks())
+        in_flight = set()
+        try:
+            payments = iter(payments)
+            for payment in payments:
+                if not self.sender._reserve_funds(payment):
+                    print(f"Source balance can't cover {payment['amount']} QUS to {payment['wallet_address']}, stopping")
+                    self.sender._record_unfunded([payment])
+                    if self.sender.drain_unfunded:
+                        self.sender._record_unfunded(payments)
+                    break
+                while len(in_flight) >= window:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    self._raise_failures(done)
+                in_flight.add(asyncio.create_task(self._pay(payment, successful_transactions)))
+            if in_flight:
+                done, in_flight = await asyncio.wait(in_flight)
+                self._raise_failures(done)
+        finally:
+            # On cancellation every pending task is cancelled, which kills its CLI process
+            for task in in_flight:
+                task.cancel()
+            watcher.cancel()
+            await asyncio.gather(watcher, *in_flight, return_exceptions=True)
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
+
+    @staticmethod
+    def _raise_failures(done):
+        for task in done:
+            if task.exception() is not None:
+                logging.error(f"Error processing payment: {task.exception()}")
+
+def load_wallet_file(path):
+    """Read a source wallet file: seed on the first line, address on the second"""
+    with open(path, 'r') as f:
+        lines = f.read().strip().split('\n')
+    return {
+        'seed': lines[0].strip(),
+        'address': lines[1].strip()
+    }
+
+class MultiWalletSender:
+    """Pay out from several source wallets at once, one QUSSender per wallet
+
+    A payment list is sharded across the wallets balanced by count and amount; a stream is
+    shared, each wallet pulling the next payment when it has room. Every wallet has its own
+    tick slots (TickSlotScheduler is keyed by source address) and its own journal run, while
+    the node pool, tick oracle, tick index and adaptive tick advance are shared. Results are
+    merged into one report. Payments a wallet's balance can't cover are handed to wallets
+    that still have funds.
+    """
+    def __init__(self, source_wallets, payment_data, mode="pipelined", journal=None, node_pool=None, tick_oracle=None):
+        if not source_wallets:
+            raise ValueError("At least one source wallet is needed")
+        addresses = [wallet['address'] for wallet in source_wallets]
+        if len(set(addresses)) != len(addresses):
+            raise ValueError("Source wallets must be distinct")
+        self.source_wallets = source_wallets
+        self.payment_data = payment_data
+        self.mode = mode
+        self.journal = journal
+        self.node_pool = node_pool if node_pool is not None else NodePool(NODES.copy())
+        self._owns_tick_oracle = tick_oracle is None
+        self.tick_oracle = tick_oracle if tick_oracle is not None else TickOracle()
+        self.tick_index = TickTransactionIndex()
+        self.tick_slots = TickSlotScheduler()
+        self.tick_advance = TickAdvanceController(self.tick_oracle, self.node_pool)
+        self.failed_tx_file = "failed_transactions.json"
+        self.senders = []
+        self.failed_transactions = []
+        self.ledgers = {}  # source address -> BalanceLedger, for wallets whose balance could be queried
+
+    def _sender(self, wallet, payments):
+        sender = QUSSender(
+            wallet, payments, mode=self.mode, tick_slots=self.tick_slots, tick_oracle=self.tick_oracle,
+            tick_index=self.tick_index, node_pool=self.node_pool, journal=self.journal, tick_advance=self.tick_advance,
+            balance_ledger=self.ledgers.get(wallet['address'])
+        )
+        # A wallet that runs dry leaves the rest of a shared stream to the others
+        sender.drain_unfunded = isinstance(payments, list)
+        return sender
+
+    def preflight_balances(self):
+        """Query every source wallet's balance into its ledger"""
+        for wallet in self.source_wallets:
+            balance = self._sender(wallet, []).query_balance()
+            if balance is None:
+                logging.warning(f"Could not query the balance of {wallet['address']}, sending from it without a funding check")
+                self.ledgers.pop(wallet['address'], None)
+            else:
+                self.ledgers[wallet['address']] = BalanceLedger(balance)
+
+    def _available(self, wallet):
+        ledger = self.ledgers.get(wallet['address'])
+        return ledger.available() if ledger is not None else None
+
+    def _process_pass(self, wallets, payments, successful_transactions):
+        """Run one sender per wallet in parallel, merge results and return the unfunded payments"""
+        if isinstance(payments, list):
+            shards = shard_payments(payments, len(wallets))
+            plan = [(wallet, shard) for wallet, shard in zip(wallets, shards) if shard]
+        else:
+            stream = SharedPaymentStream(payments)
+            plan = [(wallet, stream) for wallet in wallets]
+
+        senders = [self._sender(wallet, shard) for wallet, shard in plan]
+        self.senders.extend(senders)
+        results = [[] for _ in senders]
+        with ThreadPoolExecutor(max_workers=max(1, len(senders))) as executor:
+            futures = [executor.submit(sender.run_unattended, result) for sender, result in zip(senders, results)]
+            for sender, future in zip(senders, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Payouts from {sender.source_wallet['address']} stopped: {str(e)}")
+
+        unfunded = []
+        for sender, result in zip(senders, results):
+            address = sender.source_wallet['address']
+            for record in result:
+                record['source_address'] = address
+                successful_transactions.append(record)
+            for record in sender.failed_transactions:
+                if record.get('error') == "insufficient balance":
+                    continue
+                record['source_address'] = address
+                self.failed_transactions.append(record)
+            unfunded.extend(sender.unfunded_payments)
+        if not isinstance(payments, list):
+            # Every wallet ran dry before the stream did
+            unfunded.extend(stream)
+        return unfunded
+
+    def process(self, payments, successful_transactions):
+        """Pay from every wallet, then hand payments a wallet couldn't cover to wallets with funds left"""
+        self.senders = []
+        wallets = self.source_wallets
+        while True:
+            unfunded = self._process_pass(wallets, payments, successful_transactions)
+            if not unfunded:
+                return
+            smallest = min(payment['amount'] for payment in unfunded)
+            wallets = [
+                wallet for wallet in self.source_wallets
+                if self._available(wallet) is None or self._available(wallet) >= smallest
+            ]
+            if not wallets or (isinstance(payments, list) and len(unfunded) >= len(payments)):
+                break
+            print(f"\nRedistributing {len(unfunded)} payments to {len(wallets)} wallets with funds left...")
+            payments = unfunded
+
+        for payment in unfunded:
+            record = {
+                'wallet_address': payment['wallet_address'], 'amount': payment['amount'], 'sols': payment['sols'],
+                'tx_hash': None, 'tick': None, 'source_address': None, 'error': "insufficient balance"
+            }
+            self.failed_transactions.append(record)
+        print(f"\n{len(unfunded)} payments ({sum(p['amount'] for p in unfunded)} QUS) could not be covered by any source wallet")
+
+    def run(self):
+        """Review, confirm, pay from every wallet in parallel, then report and offer retries"""
+        try:
+            print(f"\nQubic QUS Sender - {self.mode.capitalize()} Mode, {len(self.source_wallets)} source wallets")
+            print("=============================================")
+            self.preflight_balances()
+            if isinstance(self.payment_data, list):
+                shards = shard_payments(self.payment_data, len(self.source_wallets))
+                print(f"\n{'Source Wallet':<62} {'Payments':>9} {'Total (QUS)':>15} {'Balance (QUS)':>15}")
+                print("-" * 104)
+                for wallet, shard in zip(self.source_wallets, shards):
+                    available = self._available(wallet)
+                    print(f"{wallet['address']:<62} {len(shard):>9} {sum(p['amount'] for p in shard):>15} "
+                          f"{'unknown' if available is None else available:>15}")
+                print("-" * 104)
+                print(f"Total transactions: {len(self.payment_data)}")
+                print(f"Total QUS to be sent: {sum(p['amount'] for p in self.payment_data)}")
+                known = [self._available(wallet) for wallet in self.source_wallets if self._available(wallet) is not None]
+                if len(known) == len(self.source_wallets) and sum(known) < sum(p['amount'] for p in self.payment_data):
+                    print(f"WARNING: the wallets hold {sum(known)} QUS in total, less than the payments need")
+            else:
+                print("\nPayments are streamed from the input file; each wallet takes the next one when it has room.")
+
+            proceed = input("\nProceed with sending from these wallets? (y/n): ")
+            if proceed.lower() != 'y':
+                print("Operation cancelled by user")
+                return
+
+            self.node_pool.probe_all()
+            print(f"Available nodes: {', '.join(self.node_pool.healthy_nodes()) or 'none responding'}\n")
+            self.tick_oracle.start()
+
+            successful_transactions = []
+            payments = self.payment_data
+            while True:
+                self.failed_transactions = []
+                self.process(payments, successful_transactions)
+
+                if successful_transactions:
+                    print(f"\nCreating transaction report for {len(successful_transactions)} successful transactions...")
+                    self.senders[0].create_transaction_report(successful_transactions, self.failed_transactions)
+
+                if not self.failed_transactions:
+                    print("\nAll transactions completed successfully!")
+                    break
+
+                print(f"\nCompleted with {len(successful_transactions)} successful and {len(self.failed_transactions)} failed transactions")
+                print("\nFailed transactions:")
+                for failed in self.failed_transactions:
+                    print(f"  Address: {failed['wallet_address']}, Amount: {failed['amount']} QUS, from {failed['source_address']}")
+                with open(self.failed_tx_file, 'w') as f:
+                    json.dump(self.failed_transactions, f, indent=4)
+
+                if input("\nDo you want to retry these failed transactions? (y/n): ").lower() != 'y':
+                    break
+                # Retries are resharded and journaled as new payments of the wallets that take them
+                payments = [
+                    {'wallet_address': failed['wallet_address'], 'amount': failed['amount'], 'sols': failed['sols']}
+                    for failed in self.failed_transactions
+                ]
+                print("\nRetrying failed transactions...")
+        except KeyboardInterrupt:
+            print("\nOperation interrupted by user")
+            logging.info("Shutting down...")
+        finally:
+            if self.journal is not None:
+                self.journal.flush()
+            if self._owns_tick_oracle:
+                self.tick_oracle.stop()
+
+def load_wallets_file(path):
+    """Read several source wallets: seed and address line pairs, blank lines ignored"""
+    with open(path, 'r') as f:
+        lines = [line.strip() for line in f if line.strip()]
+    if not lines or len(lines) % 2:
+        raise ValueError(f"{path} must contain seed and address line pairs")
+    return [{'seed': lines[i], 'address': lines[i + 1]} for i in range(0, len(lines), 2)]
+
+class PayoutJob:
+    """One payout submitted to the daemon, and its progress"""
+    def __init__(self, job_id, payments, mode, rejected):
+        self.job_id = job_id
+        self.payments = payments  # list, or a stream of validated payments for file jobs
+        self.mode = mode
+        self.rejected = rejected  # (line, reason, address, amount), grows while a file is read
+        self.state = "queued"  # queued, running, done, failed or cancelled
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.sender = None
+        self.successful = []
+        self.future = None
+
+    def to_dict(self, details=False):
+        sender = self.sender
+        status = {
+            'job_id': self.job_id,
+            'mode': self.mode,
+            'state': self.state,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'planned': len(self.payments) if isinstance(self.payments, list) else None,
+            'confirmed': len(self.successful),
+            'failed': len(sender.failed_transactions) if sender else 0,
+            'unresolved': len(sender.unresolved_transactions) if sender else 0,
+            'unfunded': len(sender.unfunded_payments) if sender else 0,
+            'rejected': len(self.rejected),
+            'journal_run_id': sender.journal_run_id if sender else None
+        }
+        if details:
+            status['successful_transactions'] = list(self.successful)
+            status['failed_transactions'] = list(sender.failed_transactions) if sender else []
+            status['rejected_rows'] = [
+                {'line': line, 'reason': reason, 'wallet_address': address, 'amount': str(amount)}
+                for line, reason, address, amount in self.rejected
+            ]
+        return status
+
+class PayoutDaemon:
+    """Headless payout service taking jobs over a local HTTP API
+
+    The node pool, tick oracle, tick index, tick slots, adaptive tick advance and journal
+    live as long as the daemon, so jobs start warm, and up to max_jobs jobs run at once
+    without two transfers of the wallet ever sharing a tick.
+
+    POST /jobs        {"payments": [{"wallet_address", "amount", "sols"}], "mode": "pipelined"}
+                      or {"file": "/path/payments.csv", "mode": ...} to stream a file
+    GET  /jobs        status of every job
+    GET  /jobs/<id>   status and results of one job
+    GET  /health      node health, latest tick and running jobs
+    GET  /metrics     Prometheus metrics
+    """
+    MODES = ("pipelined", "batched", "async")  # the modes that reserve tick slots
+
+    def __init__(self, source_wallet, journal=None, max_jobs=DAEMON_MAX_JOBS):
+        self.source_wallet = source_wallet
+        self.journal = journal
+        self.node_pool = NodePool(NODES.copy())
+        self.tick_oracle = TickOracle()
+        self.tick_index = TickTransactionIndex()
+        self.tick_slots = TickSlotScheduler()
+        self.tick_advance = TickAdvanceController(self.tick_oracle, self.node_pool)
+        # One running balance for every job, since they all spend from the same wallet
+        self.balance_ledger = None
+        self._ledger_lock = threading.Lock()
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs)
+        self._lock = threading.Lock()
+        self.jobs = OrderedDict()
+        self.server = None
+
+    def start(self, port=DAEMON_PORT, host=DAEMON_HOST):
+        """Warm up the shared state and bind the API (serve with serve_forever)"""
+        self.node_pool.probe_all()
+        print(f"Available nodes: {', '.join(self.node_pool.healthy_nodes()) or 'none responding'}")
+        self.tick_oracle.start()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        print(f"Payout daemon for {self.source_wallet['address']} listening on http://{host}:{self.server.server_address[1]}")
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        """Stop taking jobs, cancel queued ones and wait for running ones to finish"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        with self._lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            if job.future is not None and job.future.cancel():
+                job.state = "cancelled"
+        running = sum(1 for job in jobs if job.state == "running")
+        if running:
+            print(f"Waiting for {running} running jobs to finish...")
+        self._executor.shutdown(wait=True)
+        self.tick_oracle.stop()
+        if self.journal is not None:
+            self.journal.flush()
+
+    def submit(self, request):
+        """Create and queue a job from an API request body; raises ValueError if it is invalid"""
+        mode = request.get('mode', 'pipelined')
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+        rejected = []
+        if request.get('file'):
+            path = request['file']
+            if not os.path.isfile(path):
+                raise ValueError(f"File not found: {path}")
+            payments = iter_payment_file(path, rejected)
+        else:
+            entries = request.get('payments')
+            if not isinstance(entries, list) or not entries:
+                raise ValueError("payments must be a non-empty list")
+            rows = (
+                (line_no, entry.get('wallet_address'), entry.get('amount'), entry.get('sols'))
+                if isinstance(entry, dict) else (line_no, None, None, None)
+                for line_no, entry in enumerate(entries, start=1)
+            )
+            payments = list(_validated_payments(rows, rejected))
+            if not payments:
+                raise ValueError("no valid payments")
+
+        job = PayoutJob(uuid.uuid4().hex[:12], payments, mode, rejected)
+        with self._lock:
+            self.jobs[job.job_id] = job
+        job.future = self._executor.submit(self._run_job, job)
+        logging.info(f"Queued job {job.job_id}: {len(payments) if isinstance(payments, list) else 'streamed'} payments, {mode} mode")
+        return job
+
+    def _run_job(self, job):
+        job.state = "running"
+        job.started_at = time.time()
+        job.sender = QUSSender(
+            self.source_wallet, job.payments, mode=job.mode, tick_slots=self.tick_slots,
+            tick_oracle=self.tick_oracle, tick_index=self.tick_index, node_pool=self.node_pool,
+            journal=self.journal, tick_advance=self.tick_advance
+        )
+        job.sender.failed_tx_file = f"failed_transactions_{job.job_id}.json"
+        try:
+            with self._ledger_lock:
+                # Re-query while nothing is in flight, which also picks up top-ups between jobs
+                if self.balance_ledger is None or self.balance_ledger.pending == 0:
+                    balance = job.sender.query_balance()
+                    if balance is not None:
+                        if self.balance_ledger is None:
+                            self.balance_ledger = BalanceLedger(balance)
+                        else:
+                            self.balance_ledger.refresh(balance)
+                job.sender.balance_ledger = self.balance_ledger
+            job.sender.run_unattended(job.successful)
+            if job.sender.failed_transactions:
+                job.sender.save_failed_transactions()
+            job.state = "done"
+        except Exception as e:
+            logging.error(f"Job {job.job_id} failed: {str(e)}")
+            job.state = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            logging.info(f"Job {job.job_id} {job.state}: {len(job.successful)} confirmed, {len(job.sender.failed_transactions)} failed")
+
+    def job(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def health(self):
+        tick, updated_at = self.tick_oracle.snapshot()
+        with self._lock:
+            states = [job.state for job in self.jobs.values()]
+        return {
+            'source_address': self.source_wallet['address'],
+            'latest_tick': tick,
+            'tick_age': self.tick_oracle.age(),
+            'tick_interval': self.tick_oracle.tick_interval(),
+            'tick_advance': self.tick_advance.last_advance,
+            'balance': self.balance_ledger.available() if self.balance_ledger is not None else None,
+            'nodes': self.node_pool.snapshot(),
+            'jobs': {state: states.count(state) for state in set(states)}
+        }
+
+    def _handler(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body, content_type="application/json"):
+                data = body.encode() if isinstance(body, str) else json.dumps(body, default=str).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = self.path.split("?")[0].rstrip("/")
+                if path == "/jobs":
+                    with daemon._lock:
+                        jobs = list(daemon.jobs.values())
+                    self._reply(200, [job.to_dict() for job in jobs])
+                elif path.startswith("/jobs/"):
+                    job = daemon.job(path[len("/jobs/"):])
+                    if job is None:
+                        self._reply(404, {'error': "unknown job"})
+                    else:
+                        self._reply(200, job.to_dict(details=True))
+                elif path == "/health":
+                    self._reply(200, daemon.health())
+                elif path == "/metrics":
+                    self._reply(200, METRICS.render(), "text/plain; version=0.0.4; charset=utf-8")
+                else:
+                    self._reply(404, {'error': "not found"})
+
+            def do_POST(self):
+                if self.path.split("?")[0].rstrip("/") != "/jobs":
+                    self._reply(404, {'error': "not found"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                    if not isinstance(request, dict):
+                        raise ValueError("request body must be a JSON object")
+                    job = daemon.submit(request)
+                except ValueError as e:
+                    self._reply(400, {'error': str(e)})
+                    return
+                self._reply(202, job.to_dict(details=True))
+
+            def log_message(self, format, *args):
+                logging.info(f"API {self.address_string()} {format % args}")
+
+        return Handler
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Qubic QUS Sender Tool")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="RUN_ID",
+                        help="resume an unfinished journaled run (the latest one if no id is given)")
+    parser.add_argument("--journal", default=JOURNAL_FILE, help=f"payout journal file (default: {JOURNAL_FILE})")
+    parser.add_argument("--no-journal", action="store_true", help="don't journal payment states")
+    parser.add_argument("--daemon", action="store_true",
+                        help=f"run headless and take payout jobs over a local HTTP API (http://{DAEMON_HOST}:{DAEMON_PORT})")
+    parser.add_argument("--port", type=int, default=DAEMON_PORT, help=f"daemon API port (default: {DAEMON_PORT})")
+    parser.add_argument("--wallet-file", metavar="PATH",
+                        help="source wallet file (seed, then address) for the daemon; the default wallet if omitted")
+    parser.add_argument("--wallets", metavar="PATH",
+                        help="file with several source wallets (seed and address line pairs) to pay out from in parallel")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT, metavar="PORT",
+                        help=f"serve Prometheus metrics on http://{METRICS_HOST}:PORT/metrics")
+    cli_args = parser.parse_args()
+    if cli_args.metrics_port is not None:
+        METRICS.serve(cli_args.metrics_port)
+
+    if cli_args.daemon:
+        if cli_args.wallet_file:
+            daemon_wallet = load_wallet_file(cli_args.wallet_file)
+        else:
+            daemon_wallet = {'seed': DEFAULT_SEED, 'address': DEFAULT_ADDRESS}
+        daemon_journal = None if cli_args.no_journal else PayoutJournal(cli_args.journal)
+        daemon = PayoutDaemon(daemon_wallet, journal=daemon_journal)
+        daemon.start(cli_args.port)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down daemon...")
+        finally:
+            daemon.stop()
+            if daemon_journal is not None:
+                daemon_journal.close()
+        exit()
+
     try:
         print("Qubic QUS Sender Tool")
         print("====================")
         
-        # Ask if user wants to use default wallet or provide their own
-        use_default = input("Use default wallet from code? (y/n): ").lower() == 'y'
+        # Several source wallets given on the command line, or ask for a single one
+        source_wallets = load_wallets_file(cli_args.wallets) if cli_args.wallets else None
+        use_default = False if source_wallets else input("Use default wallet from code? (y/n): ").lower() == 'y'
         
-        if use_default:
+        if source_wallets:
+            source_wallet = source_wallets[0]
+            print(f"Loaded {len(source_wallets)} source wallets: {', '.join(w['address'] for w in source_wallets)}")
+        elif use_default:
             source_wallet = {
                 'seed': DEFAULT_SEED,
                 'address': DEFAULT_ADDRESS
@@ -688,16 +3300,31 @@ if __name__ == "__main__":
         else:
             # Load source wallet
             wallet_file = input("Enter the path to your source wallet file (containing seed and address): ")
-            with open(wallet_file, 'r') as f:
-                lines = f.read().strip().split('\n')
-                source_wallet = {
-                    'seed': lines[0].strip(),
-                    'address': lines[1].strip()
-                }
+            source_wallet = load_wallet_file(wallet_file)
             print(f"Loaded source wallet: {source_wallet['address']}")
+
+        journal = None if cli_args.no_journal else PayoutJournal(cli_args.journal)
+
+        if cli_args.resume:
+            if journal is None:
+                raise ValueError("--resume needs the payout journal")
+            run_info = journal.latest_unfinished_run() if cli_args.resume == "latest" else journal.get_run(cli_args.resume)
+            if run_info is None:
+                raise ValueError(f"No run to resume in {cli_args.journal}")
+            run_id, run_source_address, run_mode = run_info
+            matching = [w for w in (source_wallets or [source_wallet]) if w['address'] == run_source_address]
+            if not matching:
+                raise ValueError(f"Run {run_id} was sent from {run_source_address}, not {source_wallet['address']}")
+            source_wallet = matching[0]
+
+            sender = QUSSender(source_wallet, [], mode=run_mode, journal=journal, journal_run_id=run_id)
+            sender.resume_from_journal()
+            sender.run()
+            journal.close()
+            exit()
         
         # Ask user for input method
-        input_method = input("Choose input method:\n1. Paste data directly\n2. Load from Excel file\nEnter choice (1 or 2): ")
+        input_method = input("Choose input method:\n1. Paste data directly\n2. Load from Excel file\n3. Stream from file (CSV, JSONL, XLSX or text, validated while sending)\nEnter choice (1, 2 or 3): ")
         
         if input_method == "1":
             print("\nPaste your data below (format: Amount followed by WLT ADDRESS).")
@@ -716,26 +3343,52 @@ if __name__ == "__main__":
             pasted_data = "\n".join(lines)
             payment_data = parse_pasted_data(pasted_data)
             print(f"Parsed {len(payment_data)} payment records from pasted data")
+        elif input_method == "3":
+            # Payments are read lazily, the sender starts before the file is fully parsed
+            stream_file = input("Enter the path to your payment file: ")
+            if not os.path.isfile(stream_file):
+                raise ValueError(f"File not found: {stream_file}")
+            payment_data = iter_payment_file(stream_file)
+            print(f"Streaming payment records from {stream_file}")
         else:
             # Load Excel file with payment data
             excel_file = input("Enter the path to your Excel file containing payment data: ")
             payment_data = load_excel_data(excel_file)
             print(f"Loaded {len(payment_data)} payment records")
         
+        # Ask user for processing mode
+        mode_choice = input("Choose sending mode:\n1. Sequential (wait for each transaction)\n2. Pipelined (one tick slot per transaction)\n3. Batched (QUTIL SendMany, up to 25 recipients per transaction, fees apply)\n4. Async (asyncio engine, one tick slot per transaction)\nEnter choice (1-4): ")
+        mode = {"2": "pipelined", "3": "batched", "4": "async"}.get(mode_choice, "sequential")
+        
         # Show configuration summary
         print("\nProgram Configuration:")
-        print(f"Source Wallet: {source_wallet['address']}")
-        print(f"Payment records: {len(payment_data)}")
-        print(f"Each transaction will be scheduled {TICK_ADVANCE} ticks ahead of current network tick")
-        print(f"The program will wait for each transaction to be confirmed before proceeding to the next one")
+        if source_wallets:
+            print(f"Source Wallets: {len(source_wallets)}, each with its own tick slots, sending in parallel")
+        else:
+            print(f"Source Wallet: {source_wallet['address']}")
+        streaming = not isinstance(payment_data, list)
+        print(f"Payment records: {'streamed from file' if streaming else len(payment_data)}")
+        if ADAPTIVE_TICK_ADVANCE:
+            print(f"Each transaction will be scheduled {TICK_ADVANCE_MIN}-{TICK_ADVANCE_MAX} ticks ahead of current network tick, adapted to tick rate and node latency")
+        else:
+            print(f"Each transaction will be scheduled {TICK_ADVANCE} ticks ahead of current network tick")
+        if mode in ("pipelined", "async"):
+            print(f"Up to {PIPELINE_WINDOW} transactions will be in flight, each on its own tick, verified as ticks pass")
+        elif mode == "batched" and streaming:
+            print(f"Payments will be packed into SendMany transactions of up to {SEND_MANY_MAX_RECIPIENTS} recipients as they are read")
+        elif mode == "batched":
+            print(f"Payments will be merged per address and packed into {len(pack_send_many(payment_data))} SendMany transactions")
+        else:
+            print(f"The program will wait for each transaction to be confirmed before proceeding to the next one")
         
         # Show sample of payments
-        print("\nSample of payments to be processed:")
-        for i, payment in enumerate(payment_data[:5]):
-            print(f"  {i+1}. Address: {payment['wallet_address']}, Amount: {payment['amount']} QUS")
-        
-        if len(payment_data) > 5:
-            print(f"  ...and {len(payment_data) - 5} more")
+        if not streaming:
+            print("\nSample of payments to be processed:")
+            for i, payment in enumerate(payment_data[:5]):
+                print(f"  {i+1}. Address: {payment['wallet_address']}, Amount: {payment['amount']} QUS")
+            
+            if len(payment_data) > 5:
+                print(f"  ...and {len(payment_data) - 5} more")
         
         proceed = input("\nProceed with these settings? (y/n): ")
         if proceed.lower() != 'y':
@@ -743,8 +3396,16 @@ if __name__ == "__main__":
             exit()
         
         # Create and run the sender
-        sender = QUSSender(source_wallet, payment_data)
+        if source_wallets:
+            if mode == "sequential":
+                print("Sequential mode doesn't reserve tick slots, using pipelined mode for several wallets")
+                mode = "pipelined"
+            sender = MultiWalletSender(source_wallets, payment_data, mode=mode, journal=journal)
+        else:
+            sender = QUSSender(source_wallet, payment_data, mode=mode, journal=journal)
         sender.run()
+        if journal is not None:
+            journal.close()
         
     except ValueError as e:
         print(f"Error: {e}")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Scriptable stand-in for qubic-cli, used by qus_benchmark.py
+
+Speaks the subset of the qubic-cli command line the payout script uses and prints the
+same output strings. Behaviour comes from the state directory named by the
+FAKE_QUBIC_CLI_STATE environment variable:
+
+  config.json   tick clock, per-node latency/failure settings, the random seed and
+                optionally the source balances ("identities": seed -> address,
+                "balances": address -> QU)
+  calls.log     one JSON line appended per invocation (read by the benchmark)
+  txs/          one file per submitted transaction hash, recording its tick, source,
+                amount and whether it made it into that tick
+
+The network tick is derived from the clock in config.json, so the fake CLI and the fake
+tick RPC always agree. Random draws are seeded from (seed, node, arguments, tick), so a
+run with the same settings takes the same decisions.
+"""
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+
+STATE_ENV = "FAKE_QUBIC_CLI_STATE"
+
+COMMANDS = ("-sendtoaddressintick", "-qutilsendtomanyv1", "-checktxontick", "-getcurrenttick", "-getbalance")
+
+SEND_MANY_FEE = 10
+UNLIMITED_BALANCE = 10 ** 15  # identities without a configured balance
+
+def load_config(state_dir):
+    with open(os.path.join(state_dir, "config.json")) as f:
+        return json.load(f)
+
+def current_tick(config, now=None):
+    """Network tick at `now`, from the start tick and the configured tick interval"""
+    now = time.time() if now is None else now
+    return config["start_tick"] + int(max(0.0, now - config["start_time"]) / config["tick_interval"])
+
+def transaction_hash(seed, destination, amount, tick):
+    """Deterministic 60 lower-case letter hash, like a deterministically signed transfer"""
+    digest = b""
+    block = f"{seed}|{destination}|{amount}|{tick}".encode()
+    while len(digest) < 60:
+        block = hashlib.sha256(block).digest()
+        digest += block
+    return "".join(chr(ord('a') + b % 26) for b in digest[:60])
+
+def read_transaction(state_dir, tx_hash):
+    try:
+        with open(os.path.join(state_dir, "txs", tx_hash)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def included_transactions(state_dir):
+    txs_dir = os.path.join(state_dir, "txs")
+    for name in os.listdir(txs_dir):
+        tx = read_transaction(state_dir, name)
+        if tx and tx["included"]:
+            yield tx
+
+def balance(config, state_dir, address, before_tick=None):
+    """Configured balance minus included transfers (only those before before_tick if given)"""
+    initial = config.get("balances", {}).get(address, UNLIMITED_BALANCE)
+    spent = sum(
+        tx["amount"] for tx in included_transactions(state_dir)
+        if tx.get("source") == address and (before_tick is None or tx["tick"] < before_tick)
+    )
+    return initial - spent
+
+def _record_transaction(state_dir, tx_hash, tick, included, source, amount):
+    """First submission of a hash decides its fate, later copies (hedged/broadcast) don't"""
+    path = os.path.join(state_dir, "txs", tx_hash)
+    try:
+        with open(path, "x") as f:
+            json.dump({"tick": tick, "included": included, "source": source, "amount": amount}, f)
+    except FileExistsError:
+        pass
+
+def _log_call(state_dir, entry):
+    with open(os.path.join(state_dir, "calls.log"), "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+def _option(args, name, count=1):
+    """Values following an option, None if the option is absent"""
+    if name not in args:
+        return None
+    index = args.index(name)
+    values = args[index + 1:index + 1 + count]
+    return values if len(values) == count else None
+
+def main(argv):
+    state_dir = os.environ.get(STATE_ENV)
+    if not state_dir:
+        print(f"{STATE_ENV} is not set", file=sys.stderr)
+        return 2
+    config = load_config(state_dir)
+    started = time.time()
+
+    node = (_option(argv, "-nodeip") or ["?"])[0]
+    node_config = config["nodes"].get(node, config["default_node"])
+    rng = random.Random(f"{config['seed']}|{node}|{' '.join(argv)}|{current_tick(config, started)}")
+
+    # Round trip of the node: lognormal around the median, so it has a realistic tail
+    latency = node_config["median"] * math.exp(node_config["sigma"] * rng.gauss(0, 1))
+    time.sleep(min(latency, config.get("max_latency", 30)))
+    now = time.time()
+    tick = current_tick(config, now)
+    command = next((name[1:] for name in COMMANDS if name in argv), "unsupported")
+    entry = {"t": started, "done": now, "node": node, "cmd": command, "ok": True}
+
+    if rng.random() < node_config["failure_rate"]:
+        entry["ok"] = False
+        _log_call(state_dir, entry)
+        print("Failed to connect to node, error -1", file=sys.stderr)
+        return 1
+
+    seed = (_option(argv, "-seed") or [""])[0]
+    source = config.get("identities", {}).get(seed, seed)
+    send = _option(argv, "-sendtoaddressintick", 3)
+    send_many = _option(argv, "-qutilsendtomanyv1")
+    check = _option(argv, "-checktxontick", 2)
+    get_balance = _option(argv, "-getbalance")
+
+    if send or send_many:
+        if send:
+            destination, amount, target_tick = send[0], send[1], int(send[2])
+            cost = int(amount)
+        else:
+            with open(send_many[0]) as f:
+                destination = f.read()
+            amount = "many"
+            cost = sum(int(line.split()[1]) for line in destination.splitlines() if line.strip()) + SEND_MANY_FEE
+            target_tick = tick + int((_option(argv, "-scheduletick") or ["5"])[0])
+        tx_hash = transaction_hash(seed, destination, amount, target_tick)
+        # Only a funded transaction that reached the node before its tick can be included
+        included = (tick < target_tick and rng.random() >= config["drop_rate"]
+                    and cost <= balance(config, state_dir, source))
+        _record_transaction(state_dir, tx_hash, target_tick, included, source, cost)
+        entry.update(hash=tx_hash, tick=target_tick)
+        _log_call(state_dir, entry)
+        print("Transaction has been sent!")
+        print("~~~~~RECEIPT~~~~~")
+        print(f"TxHash: {tx_hash}")
+        print(f"Amount: {amount}")
+        print(f"Tick: {target_tick}")
+        print("~~~~~END-RECEIPT~~~~~")
+        return 0
+
+    if check:
+        check_tick, tx_hash = int(check[0]), check[1]
+        entry.update(hash=tx_hash, tick=check_tick)
+        if tick <= check_tick:
+            entry["found"] = None
+            _log_call(state_dir, entry)
+            print(f"Requested tick {check_tick}, current tick {tick}")
+            print("Please wait a bit more")
+            return 0
+        tx = read_transaction(state_dir, tx_hash)
+        entry["found"] = bool(tx and tx["included"] and tx["tick"] == check_tick)
+        _log_call(state_dir, entry)
+        if entry["found"]:
+            print(f"Found tx {tx_hash} on tick {check_tick}")
+            print("Received end response message")
+        else:
+            print(f"Can NOT find tx {tx_hash} on tick {check_tick}")
+        return 0
+
+    if get_balance:
+        _log_call(state_dir, entry)
+        print(f"Identity: {get_balance[0]}")
+        print(f"Balance: {balance(config, state_dir, get_balance[0], before_tick=tick)}")
+        return 0
+
+    if "-getcurrenttick" in argv:
+        _log_call(state_dir, entry)
+        print(f"Tick: {tick}")
+        return 0
+
+    entry["ok"] = False
+    _log_call(state_dir, entry)
+    print(f"Unsupported command: {' '.join(argv[2:])}", file=sys.stderr)
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
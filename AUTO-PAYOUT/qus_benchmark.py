@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Deterministic load benchmark for QUS-Auto-Payout.py, without funds or network
+
+Runs QUSSender.run end to end against fake_qubic_cli.py and a local HTTP server that
+mimics the /v1/latestTick and /v2/ticks/{tick}/transactions RPC endpoints. Tick rate,
+node latency distributions, node failure rates and dropped transactions are
+configurable; the random seed makes the payments and every fake decision repeatable.
+
+Reports payouts/minute, qubic-cli spawns, RPC calls and end-to-end latency percentiles
+(first submission to recorded outcome, per payment) for each run and across runs.
+
+Example:
+    python qus_benchmark.py --payments 200 --mode pipelined --runs 3 \\
+        --node fast:0.05:0.3:0.01 --node slow:0.4:0.5:0.05 --tick-interval 1.0
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fake_qubic_cli
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PAYOUT_SCRIPT = os.path.join(HERE, "QUS-Auto-Payout.py")
+FAKE_CLI = os.path.join(HERE, "fake_qubic_cli.py")
+
+DEFAULT_NODES = ["fast:0.05:0.3:0.01", "medium:0.15:0.4:0.02", "slow:0.5:0.5:0.05"]
+
+def load_payout_module():
+    """Import QUS-Auto-Payout.py (not importable by name because of the dashes)"""
+    spec = importlib.util.spec_from_file_location("qus_auto_payout", PAYOUT_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_node(spec):
+    """NAME:MEDIAN_SECONDS:SIGMA:FAILURE_RATE -> (name, settings)"""
+    try:
+        name, median, sigma, failure_rate = spec.split(":")
+        return name, {"median": float(median), "sigma": float(sigma), "failure_rate": float(failure_rate)}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"node must be NAME:MEDIAN:SIGMA:FAILURE_RATE, got {spec!r}")
+
+def percentile(values, p):
+    """Nearest-rank percentile (0..1), None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+class FakeTickRPC:
+    """Local HTTP server answering the tick RPC endpoints from the fake CLI's state directory"""
+    def __init__(self, state_dir):
+        self.state_dir = state_dir
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        rpc = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                rpc.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+
+    def handle(self, request):
+        config = fake_qubic_cli.load_config(self.state_dir)
+        tick = fake_qubic_cli.current_tick(config)
+        match = re.fullmatch(r"/v2/ticks/(\d+)/transactions", request.path)
+        if request.path == "/v1/latestTick":
+            self._count("latestTick")
+            self._reply(request, 200, {"latestTick": tick})
+        elif match:
+            self._count("tickTransactions")
+            requested = int(match.group(1))
+            if requested >= tick:
+                self._reply(request, 404, {"message": "tick not processed yet"})
+                return
+            hashes = self._included(requested)
+            self._reply(request, 200, {"transactions": [{"transaction": {"txId": h}} for h in hashes]})
+        else:
+            self._count("other")
+            self._reply(request, 404, {"message": "not found"})
+
+    def _count(self, endpoint):
+        with self._lock:
+            self.calls[endpoint] += 1
+
+    def _included(self, tick):
+        hashes = []
+        tx_dir = os.path.join(self.state_dir, "txs")
+        for tx_hash in os.listdir(tx_dir):
+            tx = fake_qubic_cli.read_transaction(self.state_dir, tx_hash)
+            if tx and tx["included"] and tx["tick"] == tick:
+                hashes.append(tx_hash)
+        return hashes
+
+    @staticmethod
+    def _reply(request, status, body):
+        data = json.dumps(body).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+def make_cli_launcher(directory):
+    """Executable that runs the fake CLI with this interpreter (run_cli spawns a single path)"""
+    if os.name == "nt":
+        path = os.path.join(directory, "qubic-cli.cmd")
+        with open(path, "w") as f:
+            f.write(f'@"{sys.executable}" "{FAKE_CLI}" %*\n')
+    else:
+        path = os.path.join(directory, "qubic-cli")
+        with open(path, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_CLI}" "$@"\n')
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+def make_payments(module, count, rng):
+    """Valid identities with random amounts"""
+    payments = []
+    for _ in range(count):
+        public_key = bytes(rng.getrandbits(8) for _ in range(32))
+        payments.append({
+            'wallet_address': module.public_key_to_identity(public_key),
+            'amount': rng.randint(1, 1000),
+            'sols': None
+        })
+    return payments
+
+def read_calls(state_dir):
+    calls = []
+    with contextlib.suppress(FileNotFoundError):
+        with open(os.path.join(state_dir, "calls.log")) as f:
+            calls = [json.loads(line) for line in f if line.strip()]
+    return calls
+
+def run_once(module, args, nodes, state_dir, rpc, run_seed):
+    """One QUSSender.run over a fresh fake network; returns the run's measurements"""
+    shutil.rmtree(state_dir, ignore_errors=True)
+    os.makedirs(os.path.join(state_dir, "txs"))
+    wallets = [
+        {'seed': chr(ord('a') + i) * 55, 'address': module.public_key_to_identity(bytes([i]) * 32)}
+        for i in range(args.wallets)
+    ]
+    config = {
+        "seed": run_seed,
+        "start_time": time.time(),
+        "start_tick": 1000000,
+        "tick_interval": args.tick_interval,
+        "drop_rate": args.drop_rate,
+        "nodes": nodes,
+        "default_node": {"median": 0.1, "sigma": 0.3, "failure_rate": 0.0},
+        "identities": {wallet['seed']: wallet['address'] for wallet in wallets}
+    }
+    if args.balance is not None:
+        config["balances"] = {wallet['address']: args.balance for wallet in wallets}
+    with open(os.path.join(state_dir, "config.json"), "w") as f:
+        json.dump(config, f)
+    rpc.reset()
+
+    rng = random.Random(run_seed)
+    payments = make_payments(module, args.payments, rng)
+    if args.wallets > 1:
+        sender = module.MultiWalletSender(wallets, payments, mode=args.mode)
+    else:
+        sender = module.QUSSender(wallets[0], payments, mode=args.mode, submission_mode=args.submission_mode)
+    if args.tick_advance is not None:
+        sender.tick_advance.adaptive = False
+
+    # Time each payment from its first submission to its recorded outcome (every sender of the run)
+    submitted_at, decided_at = {}, {}
+    sender_class = module.QUSSender
+    journal_payments, record_result = sender_class._journal_payments, sender_class._record_result
+
+    def timed_journal(self, payments, state, *rest, **kwargs):
+        if state == "submitting":
+            now = time.time()
+            for payment in payments:
+                submitted_at.setdefault(id(payment), now)
+        return journal_payments(self, payments, state, *rest, **kwargs)
+
+    def timed_result(self, payment, *rest, **kwargs):
+        decided_at[id(payment)] = time.time()
+        return record_result(self, payment, *rest, **kwargs)
+
+    answers = iter(["y"])
+    module.input = lambda prompt="": next(answers, "n")  # proceed once, never retry
+    output = io.StringIO()
+    sender_class._journal_payments, sender_class._record_result = timed_journal, timed_result
+    started = time.time()
+    try:
+        with contextlib.redirect_stdout(output if not args.verbose else sys.stdout):
+            sender.run()
+    finally:
+        sender_class._journal_payments, sender_class._record_result = journal_payments, record_result
+    elapsed = time.time() - started
+
+    calls = read_calls(state_dir)
+    failed = len(sender.failed_transactions)
+    unfunded = sum(1 for record in sender.failed_transactions if record.get('error') == "insufficient balance")
+    paid = len(payments) - failed
+    latencies = [decided_at[key] - submitted_at[key] for key in decided_at if key in submitted_at]
+    return {
+        "seed": run_seed,
+        "payments": len(payments),
+        "paid": paid,
+        "failed": failed,
+        "unfunded": unfunded,
+        "seconds": elapsed,
+        "payouts_per_minute": paid / elapsed * 60 if elapsed else 0.0,
+        "cli_spawns": len(calls),
+        "cli_by_command": dict(Counter(call["cmd"] for call in calls)),
+        "cli_failures": sum(1 for call in calls if not call["ok"]),
+        "rpc_calls": sum(rpc.calls.values()),
+        "rpc_by_endpoint": dict(rpc.calls),
+        "latencies": latencies
+    }
+
+def summarize(results):
+    latencies = [latency for result in results for latency in result["latencies"]]
+    rates = [result["payouts_per_minute"] for result in results]
+    paid = sum(result["paid"] for result in results)
+    return {
+        "runs": len(results),
+        "payouts_per_minute": {"mean": sum(rates) / len(rates), "min": min(rates), "max": max(rates)},
+        "paid": paid,
+        "failed": sum(result["failed"] for result in results),
+        "unfunded": sum(result["unfunded"] for result in results),
+        "cli_spawns_per_payout": sum(r["cli_spawns"] for r in results) / paid if paid else None,
+        "rpc_calls_per_payout": sum(r["rpc_calls"] for r in results) / paid if paid else None,
+        "latency": {f"p{int(p * 100)}": percentile(latencies, p) for p in (0.5, 0.9, 0.95, 0.99)}
+    }
+
+def print_report(results, summary):
+    print(f"\n{'Run':<5} {'Seed':<8} {'Paid':>6} {'Failed':>7} {'Seconds':>9} {'Payouts/min':>12} {'CLI spawns':>11} {'RPC calls':>10} {'p50 s':>7} {'p95 s':>7}")
+    print("-" * 90)
+    for idx, result in enumerate(results):
+        p50, p95 = percentile(result["latencies"], 0.5), percentile(result["latencies"], 0.95)
+        print(f"{idx+1:<5} {result['seed']:<8} {result['paid']:>6} {result['failed']:>7} {result['seconds']:>9.1f} "
+              f"{result['payouts_per_minute']:>12.1f} {result['cli_spawns']:>11} {result['rpc_calls']:>10} "
+              f"{p50 if p50 is not None else float('nan'):>7.2f} {p95 if p95 is not None else float('nan'):>7.2f}")
+        print(f"      CLI: {result['cli_by_command']}, RPC: {result['rpc_by_endpoint']}")
+    print("-" * 90)
+    rate = summary["payouts_per_minute"]
+    print(f"Payouts/minute: mean {rate['mean']:.1f}, min {rate['min']:.1f}, max {rate['max']:.1f} over {summary['runs']} runs")
+    print(f"Paid {summary['paid']}, failed {summary['failed']} ({summary['unfunded']} for lack of balance)")
+    if summary["cli_spawns_per_payout"] is not None:
+        print(f"CLI spawns per payout: {summary['cli_spawns_per_payout']:.2f}, RPC calls per payout: {summary['rpc_calls_per_payout']:.2f}")
+    latency = ", ".join(f"{name} {value:.2f}s" for name, value in summary["latency"].items() if value is not None)
+    print(f"End-to-end latency (first submission to outcome): {latency or 'n/a'}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark QUS payouts against a fake qubic-cli and tick RPC")
+    parser.add_argument("--payments", type=int, default=50, help="payments per run")
+    parser.add_argument("--runs", type=int, default=1, help="number of runs (seed, seed+1, ...)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the first run")
+    parser.add_argument("--mode", choices=["sequential", "pipelined", "batched", "async"], default="pipelined")
+    parser.add_argument("--wallets", type=int, default=1, help="source wallets to shard the payments across")
+    parser.add_argument("--submission-mode", choices=["single", "broadcast", "hedged"], default="single")
+    parser.add_argument("--tick-interval", type=float, default=1.0, help="seconds per network tick")
+    parser.add_argument("--node", action="append", type=parse_node, metavar="NAME:MEDIAN:SIGMA:FAILURE_RATE",
+                        help="fake node with a lognormal latency (median seconds, sigma) and failure rate; repeatable")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of timely transactions not included in their tick")
+    parser.add_argument("--balance", type=int, help="QU balance of every source wallet (unlimited by default)")
+    parser.add_argument("--tick-advance", type=int, help="fixed tick advance instead of the adaptive one")
+    parser.add_argument("--json", metavar="PATH", help="also write per-run results and the summary as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show the payout script's output")
+    args = parser.parse_args()
+
+    nodes = dict(args.node or [parse_node(spec) for spec in DEFAULT_NODES])
+    work_dir = tempfile.mkdtemp(prefix="qus-bench-")
+    state_dir = os.path.join(work_dir, "state")
+    os.environ[fake_qubic_cli.STATE_ENV] = state_dir
+    os.makedirs(os.path.join(state_dir, "txs"))
+    rpc = FakeTickRPC(state_dir)
+    rpc.start()
+
+    # The payout script writes its log and reports to the working directory
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        module = load_payout_module()
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+        module.QUBIC_CLI_PATH = make_cli_launcher(work_dir)
+        module.NODES = list(nodes)
+        module.QUBIC_API_ENDPOINT = f"{rpc.url}/v1/latestTick"
+        module.QUBIC_TICK_TRANSACTIONS_ENDPOINT = rpc.url + "/v2/ticks/{tick}/transactions"
+        if args.tick_advance is not None:
+            module.TICK_ADVANCE = args.tick_advance
+
+        results = []
+        for run in range(args.runs):
+            print(f"Run {run + 1}/{args.runs}: {args.payments} payments, {args.mode} mode, {args.wallets} wallets, seed {args.seed + run}", file=sys.stderr)
+            results.append(run_once(module, args, nodes, state_dir, rpc, args.seed + run))
+    finally:
+        os.chdir(previous_dir)
+        rpc.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary = summarize(results)
+    print_report(results, summary)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": results, "summary": summary}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
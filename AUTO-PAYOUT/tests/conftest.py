@@ -0,0 +1,75 @@
+import importlib.util
+import json
+import os
+import sys
+import time
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+
+import fake_qubic_cli  # noqa: E402
+import qus_benchmark  # noqa: E402
+
+PAYOUT_SCRIPT = os.path.join(ROOT, "QUS-Auto-Payout.py")
+
+
+@pytest.fixture(scope="session")
+def qap(tmp_path_factory):
+    """QUS-Auto-Payout.py as a module (not importable by name because of the dashes)
+
+    Loaded from a scratch directory, since the script opens qus_sender.log in the working directory.
+    """
+    previous_dir = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("log"))
+    try:
+        spec = importlib.util.spec_from_file_location("qus_auto_payout", PAYOUT_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(previous_dir)
+    return module
+
+
+@pytest.fixture
+def identities(qap):
+    """Factory of valid, distinct Qubic identities"""
+    return lambda count, start=1: [qap.public_key_to_identity(bytes([i % 256, i // 256]) * 16) for i in range(start, start + count)]
+
+
+@pytest.fixture
+def fake_network(qap, tmp_path, monkeypatch):
+    """fake_qubic_cli.py and the fake tick RPC wired into the payout module, run from tmp_path"""
+    state_dir = tmp_path / "state"
+    os.makedirs(state_dir / "txs")
+    wallet = {'seed': "a" * 55, 'address': qap.public_key_to_identity(bytes([1]) * 32)}
+    config = {
+        "seed": 7,
+        "start_time": time.time(),
+        "start_tick": 1000000,
+        "tick_interval": 0.3,
+        "drop_rate": 0.0,
+        "nodes": {"fast": {"median": 0.02, "sigma": 0.1, "failure_rate": 0.0},
+                  "flaky": {"median": 0.05, "sigma": 0.1, "failure_rate": 0.3}},
+        "default_node": {"median": 0.02, "sigma": 0.1, "failure_rate": 0.0},
+        "identities": {wallet['seed']: wallet['address']},
+        "balances": {wallet['address']: 1000}
+    }
+    with open(state_dir / "config.json", "w") as f:
+        json.dump(config, f)
+    monkeypatch.setenv(fake_qubic_cli.STATE_ENV, str(state_dir))
+    rpc = qus_benchmark.FakeTickRPC(str(state_dir))
+    rpc.start()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(qap, "QUBIC_CLI_PATH", qus_benchmark.make_cli_launcher(str(tmp_path)))
+    monkeypatch.setattr(qap, "NODES", list(config["nodes"]))
+    monkeypatch.setattr(qap, "QUBIC_API_ENDPOINT", f"{rpc.url}/v1/latestTick")
+    monkeypatch.setattr(qap, "QUBIC_TICK_TRANSACTIONS_ENDPOINT", rpc.url + "/v2/ticks/{tick}/transactions")
+    monkeypatch.setattr(qap, "PIPELINE_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(qap, "input", lambda prompt="": "y", raising=False)
+    try:
+        yield wallet, state_dir
+    finally:
+        rpc.stop()
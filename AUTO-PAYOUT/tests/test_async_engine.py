@@ -0,0 +1,84 @@
+import asyncio
+import itertools
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+STUB_CLI = '''#!{python}
+import sys, time
+args = sys.argv[1:]
+with open({log!r}, "a") as log:
+    log.write(" ".join(args) + "\\n")
+if "-sleep" in args:
+    time.sleep(30)
+elif "-sendtoaddressintick" in args:
+    target = args[args.index("-sendtoaddressintick") + 1]
+    print("Transaction has been sent!")
+    print("TxHash: hash" + target)
+elif "-checktxontick" in args:
+    if args[-1] == "hashMISSING":
+        print("Can NOT find tx")
+    else:
+        print("Found tx")
+        print("Received end response message")
+'''
+
+
+@pytest.fixture
+def stub_cli(qap, tmp_path, monkeypatch):
+    """A qubic-cli stand-in that acknowledges every transfer and finds every hash but hashMISSING"""
+    path = tmp_path / "qubic-cli"
+    log = tmp_path / "calls.log"
+    path.write_text(STUB_CLI.format(python=sys.executable, log=str(log)))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(qap, "QUBIC_CLI_PATH", str(path))
+    monkeypatch.setattr(qap, "NODES", ["a", "b"])
+    return log
+
+
+def make_engine(qap, payments=()):
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, list(payments), mode="async",
+                           node_pool=qap.NodePool(["a", "b"], probe=lambda node: True),
+                           tick_index=qap.TickTransactionIndex(fetch=lambda tick: None))
+    engine = qap.AsyncQubicEngine(sender, max_concurrency=4, per_node_concurrency=2)
+    ticks = itertools.count(1000, 5)
+
+    async def fetch_latest_tick():
+        return next(ticks)
+
+    engine.fetch_latest_tick = fetch_latest_tick
+    return sender, engine
+
+
+def test_async_engine_pays_and_verifies_each_payment(qap, stub_cli, monkeypatch):
+    monkeypatch.setattr(qap, "TICK_ORACLE_POLL_INTERVAL", 0.01)
+    payments = [{'wallet_address': name, 'amount': 1, 'sols': None} for name in ("A", "B", "MISSING", "C")]
+    sender, engine = make_engine(qap, payments)
+    successful = []
+    asyncio.run(engine.process_payments(payments, successful, window=2))
+
+    assert sorted(r['wallet_address'] for r in successful) == ["A", "B", "C"]
+    assert [r['wallet_address'] for r in sender.failed_transactions] == ["MISSING"]
+    ticks = [r['tick'] for r in successful + sender.failed_transactions]
+    assert len(set(ticks)) == len(ticks)
+    assert sender.tick_slots.reserved_count("SOURCE") < len(payments)  # passed slots were released
+    calls = stub_cli.read_text().splitlines()
+    assert sum("-sendtoaddressintick" in call for call in calls) == 4
+    assert sum("-checktxontick" in call for call in calls) == 4
+
+
+def test_async_cli_timeout_kills_the_process(qap, stub_cli):
+    sender, engine = make_engine(qap)
+
+    async def call():
+        engine._global_limit = asyncio.Semaphore(1)
+        started = time.time()
+        with pytest.raises(qap.subprocess.TimeoutExpired):
+            await engine.run_cli("a", ["-sleep"], timeout=0.3)
+        return time.time() - started
+
+    assert asyncio.run(call()) < 5
+    assert sender.node_pool.snapshot()["a"]['failures'] == 1
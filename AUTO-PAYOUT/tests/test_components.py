@@ -0,0 +1,379 @@
+import threading
+import time
+
+
+def payment(address, amount):
+    return {'wallet_address': address, 'amount': amount, 'sols': None}
+
+
+def addresses(count):
+    return [f"ADDRESS{i:03d}" for i in range(count)]
+
+
+# pack_send_many / shard_payments
+
+def test_pack_send_many_merges_duplicate_addresses(qap):
+    a, b = addresses(2)
+    payments = [payment(a, 10), payment(b, 5), payment(a, 7)]
+    batches = qap.pack_send_many(payments)
+    assert len(batches) == 1
+    merged = {recipient['wallet_address']: recipient for recipient in batches[0]}
+    assert merged[a]['amount'] == 17
+    assert merged[a]['payments'] == [payments[0], payments[2]]
+    assert merged[b]['amount'] == 5
+
+
+def test_pack_send_many_caps_recipients_and_evens_batches(qap):
+    batches = qap.pack_send_many([payment(address, 1) for address in addresses(60)])
+    assert qap.SEND_MANY_MAX_RECIPIENTS == 25
+    assert [len(batch) for batch in batches] == [20, 20, 20]
+    assert [r['wallet_address'] for batch in batches for r in batch] == addresses(60)
+
+
+def test_pack_send_many_exactly_full_batch(qap):
+    batches = qap.pack_send_many([payment(address, 1) for address in addresses(26)])
+    assert sorted(len(batch) for batch in batches) == [13, 13]
+    assert qap.pack_send_many([]) == []
+
+
+def test_shard_payments_balances_count_and_amount(qap):
+    amounts = [100, 90, 80, 70, 60, 50, 40, 30, 20, 10]
+    payments = [payment(address, amount) for address, amount in zip(addresses(10), amounts)]
+    shards = qap.shard_payments(payments, 3)
+    assert sorted(len(shard) for shard in shards) == [3, 3, 4]
+    totals = [sum(p['amount'] for p in shard) for shard in shards]
+    assert max(totals) - min(totals) <= 100
+    assert sorted(p['wallet_address'] for shard in shards for p in shard) == addresses(10)
+    for shard in shards:
+        positions = [payments.index(p) for p in shard]
+        assert positions == sorted(positions)
+
+
+def test_shard_payments_more_shards_than_payments(qap):
+    shards = qap.shard_payments([payment(address, 5) for address in addresses(2)], 4)
+    assert sorted(len(shard) for shard in shards) == [0, 0, 1, 1]
+
+
+def test_shared_payment_stream_hands_out_each_payment_once(qap):
+    stream = qap.SharedPaymentStream(payment(address, 1) for address in addresses(200))
+    taken = [[] for _ in range(4)]
+    threads = [threading.Thread(target=lambda out=out: out.extend(p['wallet_address'] for p in stream)) for out in taken]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(address for out in taken for address in out) == addresses(200)
+
+
+# TickSlotScheduler
+
+def test_tick_slots_never_share_a_tick_per_source(qap):
+    slots = qap.TickSlotScheduler()
+    assert [slots.reserve("A", 100) for _ in range(3)] == [100, 101, 102]
+    assert slots.reserve("B", 100) == 100
+    assert slots.reserve("A", 101) == 103
+    assert slots.reserved_count("A") == 4
+
+
+def test_tick_slots_release_passed(qap):
+    slots = qap.TickSlotScheduler()
+    for tick in (100, 101, 102):
+        slots.reserve("A", tick)
+    slots.reserve("B", 100)
+    slots.release_passed("A", 102)
+    assert slots.reserved_count("A") == 1
+    assert slots.reserved_count("B") == 1
+    assert slots.reserve("A", 100) == 100
+
+
+# BalanceLedger
+
+def test_balance_ledger_reserve_release_settle(qap):
+    ledger = qap.BalanceLedger(100)
+    assert ledger.reserve(60)
+    assert not ledger.reserve(50)
+    assert ledger.available() == 40
+    ledger.release(60)
+    assert ledger.available() == 100
+    assert ledger.reserve(70)
+    ledger.settle(70)
+    assert (ledger.balance, ledger.pending, ledger.available()) == (30, 0, 30)
+
+
+def test_balance_ledger_refresh_and_spend(qap):
+    ledger = qap.BalanceLedger(30)
+    ledger.refresh(500)
+    assert ledger.available() == 500
+    assert ledger.reserve(100)
+    ledger.release(100)
+    ledger.spend(100)  # a released transfer confirmed on reverification
+    assert (ledger.balance, ledger.pending) == (400, 0)
+
+
+# TickOracle
+
+def test_tick_oracle_fetches_directly_until_started(qap):
+    ticks = iter([100, None, 105])
+    oracle = qap.TickOracle(fetch=lambda: next(ticks))
+    assert oracle.snapshot() == (None, None)
+    assert oracle.get_latest_tick() == 100
+    assert oracle.get_latest_tick() is None
+    assert oracle.snapshot()[0] == 100  # a failed fetch keeps the last tick
+    assert oracle.get_latest_tick() == 105
+    assert oracle.age() < 1
+
+
+def test_tick_oracle_never_moves_backwards_and_estimates_the_rate(qap):
+    oracle = qap.TickOracle(fetch=lambda: None)
+    assert oracle.tick_rate() is None and oracle.tick_interval() is None
+    oracle.update(100)
+    oracle.update(99)
+    assert oracle.snapshot()[0] == 100
+    oracle._history.clear()
+    oracle._history.extend([(10.0, 100), (12.0, 101), (14.0, 102)])
+    assert oracle.tick_rate() == 0.5
+    assert oracle.tick_interval() == 2.0
+
+
+def test_tick_oracle_wakes_waiters_on_the_target_tick(qap):
+    ticks = iter(range(100, 10000))
+    oracle = qap.TickOracle(fetch=lambda: next(ticks), poll_interval=0.01)
+    try:
+        assert oracle.wait_for_tick(105, timeout=5)
+        assert oracle.is_running()
+        assert oracle.get_latest_tick() >= 105
+        assert qap.wait_for_tick_confirmation(110, check_interval=0.1, oracle=oracle)
+    finally:
+        oracle.stop()
+    assert not oracle.is_running()
+
+
+def test_tick_oracle_stop_releases_a_waiter(qap):
+    oracle = qap.TickOracle(fetch=lambda: 100, poll_interval=0.01)
+    oracle.start()
+    assert not oracle.wait_for_tick(101, timeout=0.05)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(oracle.wait_for_tick(200)))
+    waiter.start()
+    time.sleep(0.05)
+    oracle.stop()
+    waiter.join(timeout=2)
+    assert result == [False]
+
+
+# Reverification
+
+def failed_transaction(address, tx_hash, tick=100):
+    return {'wallet_address': address, 'amount': 1, 'sols': None, 'tx_hash': tx_hash, 'tick': tick}
+
+
+def test_reverify_runs_concurrently_within_the_per_node_limit(qap, monkeypatch):
+    monkeypatch.setattr(qap, "NODES", ["a", "b"])
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, [])
+    lock = threading.Lock()
+    active = {"a": 0, "b": 0}
+    most = {"a": 0, "b": 0}
+
+    def verify_specific_transaction(tx_hash, tick, node=None):
+        with lock:
+            active[node] += 1
+            most[node] = max(most[node], active[node])
+        time.sleep(0.05)
+        with lock:
+            active[node] -= 1
+        return int(tx_hash[1:]) % 2 == 0
+
+    monkeypatch.setattr(sender, "verify_specific_transaction", verify_specific_transaction)
+    sender.failed_transactions = [failed_transaction(f"ADDRESS{i}", f"h{i}") for i in range(8)]
+    sender.failed_transactions.insert(3, failed_transaction("NEVERSENT", None))
+    progress = []
+    successful = []
+    started = time.time()
+    sender.reverify_failed_transactions(successful, progress_callback=lambda done, total, tx, ok: progress.append((done, total)),
+                                        per_node_concurrency=2)
+
+    assert time.time() - started < 0.05 * 8
+    assert most == {"a": 2, "b": 2}
+    assert [tx['tx_hash'] for tx in successful] == ["h0", "h2", "h4", "h6"]
+    assert [tx['tx_hash'] for tx in sender.failed_transactions] == ["h1", None, "h3", "h5", "h7"]
+    assert sorted(progress) == [(done, 9) for done in range(1, 10)]
+
+
+def test_reverify_cancel_leaves_unchecked_transactions_failed(qap, monkeypatch):
+    monkeypatch.setattr(qap, "NODES", ["a"])
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, [])
+
+    def verify_specific_transaction(tx_hash, tick, node=None):
+        sender.cancel_reverification()  # e.g. Ctrl-C while the first check runs
+        return True
+
+    monkeypatch.setattr(sender, "verify_specific_transaction", verify_specific_transaction)
+    sender.failed_transactions = [failed_transaction(f"ADDRESS{i}", f"h{i}") for i in range(6)]
+    successful = []
+    sender.reverify_failed_transactions(successful, per_node_concurrency=1, max_workers=1)
+
+    assert [tx['tx_hash'] for tx in successful] == ["h0"]
+    assert [tx['tx_hash'] for tx in sender.failed_transactions] == ["h1", "h2", "h3", "h4", "h5"]
+
+
+# TickTransactionIndex
+
+def test_tick_index_fetches_each_tick_once_and_evicts_the_oldest(qap):
+    fetched = []
+
+    def fetch(tick):
+        fetched.append(tick)
+        return {f"hash{tick}"}
+
+    index = qap.TickTransactionIndex(fetch=fetch, max_ticks=2)
+    assert index.lookup("hash100", 100) is True
+    assert index.lookup("other", 100) is False
+    assert index.lookup("hash101", 101) is True
+    assert index.get(100) == {"hash100"}  # 100 is now the most recent
+    index.get(102)
+    index.get(100)
+    index.get(101)
+    assert fetched == [100, 101, 102, 101]
+    assert (index.fetches, index.hits) == (4, 3)
+
+
+def test_tick_index_shares_one_fetch_between_concurrent_lookups(qap):
+    release = threading.Event()
+    fetched = []
+
+    def fetch(tick):
+        fetched.append(tick)
+        release.wait(2)
+        return {"abc"}
+
+    index = qap.TickTransactionIndex(fetch=fetch)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(index.lookup("ABC", 7))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert results == [True] * 5
+    assert fetched == [7]
+
+
+def test_tick_index_waits_before_refetching_a_failed_tick(qap):
+    answers = [None, {"abc"}]
+    index = qap.TickTransactionIndex(fetch=lambda tick: answers.pop(0), retry_after=0.05)
+    assert index.lookup("abc", 5) is None
+    assert index.lookup("abc", 5) is None  # still inside retry_after, not fetched again
+    assert index.fetches == 1
+    time.sleep(0.06)
+    assert index.lookup("abc", 5) is True
+
+
+def test_verify_accepts_a_tick_index_hit_without_qubic_cli(qap, monkeypatch):
+    index = qap.TickTransactionIndex(fetch=lambda tick: {"abc"})
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, [], tick_index=index)
+
+    def no_cli(*args, **kwargs):
+        raise AssertionError("qubic-cli spawned for an index hit")
+
+    monkeypatch.setattr(qap.subprocess, "Popen", no_cli)
+    assert sender.verify_specific_transaction("ABC", 5) is True
+
+
+# NodePool circuit breaker
+
+def test_node_pool_breaker_opens_and_half_opens(qap):
+    pool = qap.NodePool(["a", "b"], probe=lambda node: True, failure_threshold=2, probe_interval=0.05)
+    pool.record_success("a", 0.1)
+    pool.record_success("b", 0.2)
+    assert pool.ranked_nodes() == ["a", "b"]
+
+    pool.record_failure("a")
+    assert pool.snapshot()["a"]['state'] == "closed"
+    pool.record_failure("a")
+    assert pool.snapshot()["a"]['state'] == "open"
+    assert pool.ranked_nodes() == ["b"]
+
+    time.sleep(0.06)
+    assert "a" in pool.ranked_nodes()
+    assert pool.snapshot()["a"]['state'] == "half-open"
+    pool.record_failure("a")  # a failed trial call reopens at once
+    assert pool.snapshot()["a"]['state'] == "open"
+
+    time.sleep(0.06)
+    pool.ranked_nodes()
+    pool.record_success("a", 0.1)
+    assert pool.snapshot()["a"]['state'] == "closed"
+
+
+def test_node_pool_best_node_when_every_breaker_is_open(qap):
+    pool = qap.NodePool(["a", "b"], probe=lambda node: True, failure_threshold=1, probe_interval=60)
+    pool.record_failure("b")
+    time.sleep(0.01)
+    pool.record_failure("a")
+    assert pool.ranked_nodes() == []
+    assert pool.best_node() == "b"
+
+
+def test_node_pool_probe_ranks_by_latency_and_opens_dead_nodes(qap):
+    delays = {"slow": 0.05, "fast": 0.0, "dead": None}
+
+    def probe(node):
+        if delays[node] is None:
+            return False
+        time.sleep(delays[node])
+        return True
+
+    pool = qap.NodePool(["slow", "fast", "dead"], probe=probe)
+    pool.probe_all()
+    assert pool.ranked_nodes() == ["fast", "slow"]
+    assert pool.snapshot()["dead"]['state'] == "open"
+    assert pool.best_node(exclude=("fast",)) == "slow"
+
+
+# TickAdvanceController
+
+def tick_advance(qap, interval=None, age=0.0, latencies=()):
+    oracle = qap.TickOracle(fetch=lambda: None)
+    if interval is not None:
+        oracle._history.extend([(0.0, 100), (interval * 10, 110)])
+    oracle.age = lambda: age
+    pool = qap.NodePool(["a", "b"], probe=lambda node: True)
+    controller = qap.TickAdvanceController(oracle, pool, minimum=3, maximum=60, percentile=0.95, margin=2)
+    for node, latency in latencies:
+        controller.record_submit(node, latency)
+    return controller
+
+
+def test_tick_advance_starts_from_the_fixed_value(qap):
+    assert tick_advance(qap).advance() == qap.TICK_ADVANCE
+    assert tick_advance(qap, interval=1.0, latencies=[("a", 0.5)]).advance() != qap.TICK_ADVANCE
+    controller = tick_advance(qap, interval=1.0, latencies=[("a", 0.5)])
+    controller.adaptive = False
+    assert controller.advance() == qap.TICK_ADVANCE
+
+
+def test_tick_advance_covers_the_slowest_node_and_the_tick_age(qap):
+    # slowest node 2.5s + cached tick 0.5s old over 1s ticks -> 3 ticks, +1, +2 margin
+    controller = tick_advance(qap, interval=1.0, age=0.5, latencies=[("a", 0.2), ("b", 2.5)])
+    assert controller.advance() == 6
+    assert controller.last_advance == 6
+    controller.observe_cli("b", ['-sendtoaddressintick', "X", "1", "5"], "TxHash: abc", 8.5)
+    controller.observe_cli("b", ['-checktxontick', "5", "abc"], "TxHash: abc", 30)  # not a submission
+    assert controller.advance() == 12
+    assert tick_advance(qap, interval=0.01, latencies=[("a", 5)]).advance() == 60
+
+
+def test_tick_advance_margin_widens_on_misses_and_recovers(qap, monkeypatch):
+    monkeypatch.setattr(qap, "TICK_ADVANCE_RECOVERY", 3)
+    controller = tick_advance(qap, interval=1.0, latencies=[("a", 0.5)])
+    assert controller.advance() == 4
+    controller.record_outcome(False)
+    assert controller.advance() == 6
+    for _ in range(3):
+        controller.record_outcome(True)
+    assert controller.advance() == 5
+    for _ in range(30):
+        controller.record_outcome(True)
+    assert controller.advance() == 4  # never below the base margin
+    assert (controller.misses, controller.confirmations) == (1, 33)
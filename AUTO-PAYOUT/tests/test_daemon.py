@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+def request(url, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=10) as response:
+            return response.status, response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode()
+
+
+@pytest.fixture
+def daemon(qap, fake_network):
+    wallet, state_dir = fake_network
+    daemon = qap.PayoutDaemon(wallet, max_jobs=2)
+    daemon.start(port=0)
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    try:
+        yield daemon, f"http://127.0.0.1:{daemon.server.server_address[1]}"
+    finally:
+        daemon.stop()
+
+
+def wait_for_jobs(base, count, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        jobs = json.loads(request(base + "/jobs")[1])
+        if len(jobs) == count and all(job['state'] in ("done", "failed") for job in jobs):
+            return jobs
+        time.sleep(0.1)
+    raise AssertionError("jobs did not finish")
+
+
+def test_daemon_runs_concurrent_jobs_on_distinct_ticks(qap, identities, daemon):
+    daemon, base = daemon
+    addresses = identities(6)
+    first = {'mode': "pipelined", 'payments': [{'wallet_address': a, 'amount': 5} for a in addresses[:3]]}
+    second = {'mode': "pipelined", 'payments': [{'wallet_address': a, 'amount': 7} for a in addresses[3:]]
+              + [{'wallet_address': "NOT AN IDENTITY", 'amount': 1}]}
+    status, body = request(base + "/jobs", first)
+    assert status == 202
+    status, body = request(base + "/jobs", second)
+    assert status == 202
+    second_id = json.loads(body)['job_id']
+
+    jobs = wait_for_jobs(base, 2)
+    assert [job['state'] for job in jobs] == ["done", "done"]
+    assert sum(job['confirmed'] for job in jobs) == 6
+    details = json.loads(request(f"{base}/jobs/{second_id}")[1])
+    assert [row['line'] for row in details['rejected_rows']] == [4]
+    ticks = [tx['tick'] for job in jobs for tx in json.loads(request(f"{base}/jobs/{job['job_id']}")[1])['successful_transactions']]
+    assert len(set(ticks)) == 6
+
+
+def test_daemon_rejects_invalid_requests(daemon):
+    daemon, base = daemon
+    assert request(base + "/jobs", {'mode': "sequential", 'payments': [{}]})[0] == 400
+    assert request(base + "/jobs", {'payments': []})[0] == 400
+    assert request(base + "/jobs", {'payments': [{'wallet_address': "X", 'amount': 1}]})[0] == 400
+    assert request(base + "/jobs", {'file': "/no/such/file.csv"})[0] == 400
+    assert request(base + "/jobs", [1, 2])[0] == 400
+    assert request(base + "/jobs/unknown")[0] == 404
+    assert request(base + "/nothing")[0] == 404
+    assert daemon.jobs == {}
+
+
+def test_daemon_health_and_metrics(daemon):
+    daemon, base = daemon
+    status, body = request(base + "/health")
+    health = json.loads(body)
+    assert status == 200
+    assert health['source_address'] == daemon.source_wallet['address']
+    assert set(health['nodes']) == {"fast", "flaky"}
+    status, body = request(base + "/metrics")
+    assert status == 200 and "# TYPE qus_payouts_total counter" in body
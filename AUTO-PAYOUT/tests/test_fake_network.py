@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+import fake_qubic_cli
+import qus_benchmark
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    state = tmp_path / "state"
+    os.makedirs(state / "txs")
+    config = {
+        "seed": 3,
+        "start_time": time.time(),
+        "start_tick": 500,
+        "tick_interval": 0.2,
+        "drop_rate": 0.0,
+        "nodes": {"dead": {"median": 0.001, "sigma": 0.0, "failure_rate": 1.0}},
+        "default_node": {"median": 0.001, "sigma": 0.0, "failure_rate": 0.0}
+    }
+    with open(state / "config.json", "w") as f:
+        json.dump(config, f)
+    monkeypatch.setenv(fake_qubic_cli.STATE_ENV, str(state))
+    return state
+
+
+def cli(*args):
+    return subprocess.run([sys.executable, fake_qubic_cli.__file__, "-nodeip", *args], capture_output=True, text=True)
+
+
+def test_transfers_are_included_only_if_they_beat_their_tick(state_dir):
+    config = fake_qubic_cli.load_config(str(state_dir))
+    tick = fake_qubic_cli.current_tick(config)
+    on_time = cli("node", "-seed", "s" * 55, "-sendtoaddressintick", "DEST", "5", str(tick + 3))
+    late = cli("node", "-seed", "s" * 55, "-sendtoaddressintick", "DEST", "5", str(tick - 1))
+    assert "Transaction has been sent!" in on_time.stdout
+    on_time_hash = on_time.stdout.split("TxHash: ")[1].split()[0]
+    assert on_time_hash == fake_qubic_cli.transaction_hash("s" * 55, "DEST", "5", tick + 3)
+    late_hash = late.stdout.split("TxHash: ")[1].split()[0]
+    assert fake_qubic_cli.read_transaction(str(state_dir), on_time_hash) == {"tick": tick + 3, "included": True}
+    assert fake_qubic_cli.read_transaction(str(state_dir), late_hash)["included"] is False
+
+    assert "Please wait a bit more" in cli("node", "-checktxontick", str(tick + 3), on_time_hash).stdout
+    while fake_qubic_cli.current_tick(config) <= tick + 3:
+        time.sleep(0.05)
+    assert "Found tx" in cli("node", "-checktxontick", str(tick + 3), on_time_hash).stdout
+    assert "Can NOT find tx" in cli("node", "-checktxontick", str(tick - 1), late_hash).stdout
+
+
+def test_failing_node_and_call_log(state_dir):
+    result = cli("dead", "-getcurrenttick")
+    assert result.returncode == 1
+    assert "Failed to connect" in result.stderr
+    assert cli("node", "-getcurrenttick").stdout.startswith("Tick: ")
+    assert [(call["node"], call["cmd"], call["ok"]) for call in qus_benchmark.read_calls(str(state_dir))] == [
+        ("dead", "getcurrenttick", False), ("node", "getcurrenttick", True)]
+
+
+def test_fake_tick_rpc_serves_latest_tick_and_included_hashes(state_dir):
+    rpc = qus_benchmark.FakeTickRPC(str(state_dir))
+    rpc.start()
+    try:
+        config = fake_qubic_cli.load_config(str(state_dir))
+        tick = fake_qubic_cli.current_tick(config)
+        sent = cli("node", "-seed", "s" * 55, "-sendtoaddressintick", "DEST", "5", str(tick + 2))
+        tx_hash = sent.stdout.split("TxHash: ")[1].split()[0]
+
+        with urllib.request.urlopen(rpc.url + "/v1/latestTick") as response:
+            assert json.load(response)["latestTick"] >= tick
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(rpc.url + f"/v2/ticks/{tick + 2}/transactions")
+        assert error.value.code == 404  # not processed yet
+        while fake_qubic_cli.current_tick(config) <= tick + 2:
+            time.sleep(0.05)
+        with urllib.request.urlopen(rpc.url + f"/v2/ticks/{tick + 2}/transactions") as response:
+            assert json.load(response) == {"transactions": [{"transaction": {"txId": tx_hash}}]}
+        assert rpc.calls == {"latestTick": 1, "tickTransactions": 2}
+    finally:
+        rpc.stop()
@@ -0,0 +1,65 @@
+import pytest
+
+
+def ptn(n):
+    """Test pattern of the KangarooTwelve specification: 00 01 .. FA repeated"""
+    return bytes(i % 251 for i in range(n))
+
+
+# Reference outputs of the KangarooTwelve specification (32 bytes, empty customization)
+@pytest.mark.parametrize("message, expected", [
+    (b"", "1ac2d450fc3b4205d19da7bfca1b37513c0803577ac7167f06fe2ce1f0ef39e5"),
+    (ptn(17), "6bf75fa2239198db4772e36478f8e19b0f371205f6a9a93a273f51df37122888"),
+    (ptn(17 ** 2), "0c315ebcdedbf61426de7dcf8fb725d1e74675d7f5327a5067f367b108ecb67c"),
+    (ptn(17 ** 3), "cb552e2ec77d9910701d578b457ddf772c12e322e4ee7fe417f92c758f0d59d0"),
+    (ptn(17 ** 4), "8701045e22205345ff4dda05555cbb5c3af1a771c2b89baef37db43d9998b9fe"),  # tree hashing, over 8 KiB
+])
+def test_kangaroo_twelve_reference_vectors(qap, message, expected):
+    assert qap.kangaroo_twelve(message, 32).hex() == expected
+
+
+def test_kangaroo_twelve_output_length(qap):
+    assert qap.kangaroo_twelve(b"", 64)[:32].hex() == "1ac2d450fc3b4205d19da7bfca1b37513c0803577ac7167f06fe2ce1f0ef39e5"
+    assert len(qap.kangaroo_twelve(b"", 3)) == 3
+
+
+# Well-known Qubic identities: the zero public key, and the QX and QUTIL contracts (indices 1 and 4)
+KNOWN_IDENTITIES = [
+    (0, "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB"),
+    (1, "BAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARMID"),
+    (4, "EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAVWRF"),
+]
+
+
+@pytest.mark.parametrize("index, identity", KNOWN_IDENTITIES)
+def test_known_identities(qap, index, identity):
+    public_key = index.to_bytes(32, 'little')
+    assert qap.public_key_to_identity(public_key) == identity
+    assert qap.identity_to_public_key(identity) == public_key
+    assert qap.is_valid_identity(identity)
+
+
+def test_identity_round_trip(qap):
+    for seed in range(50):
+        public_key = bytes((seed * 37 + i * 11) % 256 for i in range(32))
+        identity = qap.public_key_to_identity(public_key)
+        assert len(identity) == 60 and identity.isupper()
+        assert qap.identity_to_public_key(identity) == public_key
+        assert qap.public_key_to_identity(public_key, lower=True) == identity.lower()
+
+
+@pytest.mark.parametrize("identity", [
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIC",  # wrong checksum
+    "BAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB",  # key changed, checksum kept
+    "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaafxib",  # lowercase
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB",  # 59 letters
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB",  # 61 letters
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1FXIB",  # not a letter
+    "ZZZZZZZZZZZZZZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB",  # fragment over 64 bits
+    "ÄAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFXIB",  # not ASCII
+    "",
+    None,
+])
+def test_invalid_identities(qap, identity):
+    assert qap.identity_to_public_key(identity) is None
+    assert not qap.is_valid_identity(identity)
@@ -0,0 +1,90 @@
+import json
+import types
+
+import pytest
+
+
+def test_csv_rows_are_validated_with_their_line_numbers(qap, identities, tmp_path):
+    good, other = identities(2)
+    path = tmp_path / "payments.csv"
+    path.write_text(
+        "wallet_address,amount,sols\n"
+        f"{good},100,12\n"
+        f"{good[:-1]}A,5,\n"  # checksum broken
+        f"{other},-3,\n"
+        f"{other},7.0,\n"
+        f"{other.lower()},8,\n"
+    )
+    rejects = []
+    payments = qap.iter_payment_file(str(path), rejects)
+    assert isinstance(payments, types.GeneratorType)
+    assert list(payments) == [
+        {'wallet_address': good, 'amount': 100, 'sols': "12"},
+    ]
+    assert [(line, reason.split()[1]) for line, reason, _, _ in rejects] == [
+        (3, "Qubic"), (4, "amount"), (5, "amount"), (6, "Qubic")]
+
+
+def test_jsonl_rows_and_unparseable_lines(qap, identities, tmp_path):
+    a, b = identities(2)
+    path = tmp_path / "payments.jsonl"
+    path.write_text("\n".join([
+        json.dumps({'wallet_address': a, 'amount': 3}),
+        "not json",
+        "",
+        json.dumps([a, 4]),
+        json.dumps({'wallet_address': b, 'amount': 9.0, 'sols': 2}),
+    ]) + "\n")
+    rejects = []
+    assert list(qap.iter_payment_file(str(path), rejects)) == [
+        {'wallet_address': a, 'amount': 3, 'sols': None},
+        {'wallet_address': b, 'amount': 9, 'sols': "2"},
+    ]
+    assert [(line, reason) for line, reason, _, _ in rejects] == [(2, "could not parse row"), (4, "could not parse row")]
+
+
+def test_pasted_format_skips_the_header(qap, identities, tmp_path):
+    a, b = identities(2)
+    path = tmp_path / "payments.txt"
+    path.write_text(f"Amount WLT ADDRESS\n36850869{a}\n\n12 {b}\n{b}\n")
+    rejects = []
+    assert [(p['amount'], p['wallet_address']) for p in qap.iter_payment_file(str(path), rejects)] == [(36850869, a), (12, b)]
+    assert [line for line, _, _, _ in rejects] == [5]
+    assert [p['amount'] for p in qap.parse_pasted_data(f"36850869{a}\n12{b}")] == [36850869, 12]
+
+
+def test_payments_are_read_as_they_are_consumed(qap, identities, tmp_path):
+    path = tmp_path / "payments.jsonl"
+    path.write_text(json.dumps({'wallet_address': identities(1)[0], 'amount': 1}) + "\n")
+    payments = qap.iter_payment_file(str(path))
+    path.unlink()  # the file is only opened by the first next()
+    with pytest.raises(FileNotFoundError):
+        next(payments)
+
+
+def test_xlsx_rows_stream_from_the_first_sheet(qap, identities, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    a, b = identities(2)
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Sols", "Wallet_Address", "Amount"])
+    sheet.append([1, a, 10])
+    sheet.append([None, None, None])
+    sheet.append([None, b, "x"])
+    sheet.append([3, b, 30])
+    path = tmp_path / "payments.xlsx"
+    workbook.save(path)
+    rejects = []
+    assert list(qap.iter_payment_file(str(path), rejects)) == [
+        {'wallet_address': a, 'amount': 10, 'sols': "1"},
+        {'wallet_address': b, 'amount': 30, 'sols': "3"},
+    ]
+    assert [line for line, _, _, _ in rejects] == [4]
+
+
+def test_streaming_packer_merges_within_the_open_batch(qap):
+    stream = ({'wallet_address': address, 'amount': 1, 'sols': None} for address in "ABACBD")
+    batches = qap.iter_send_many_batches(stream, max_recipients=2)
+    first = next(batches)  # emitted as soon as C arrives, before the rest of the stream is read
+    assert [(r['wallet_address'], r['amount']) for r in first] == [("A", 2), ("B", 1)]
+    assert [[(r['wallet_address'], r['amount']) for r in batch] for batch in batches] == [[("C", 1), ("B", 1)], [("D", 1)]]
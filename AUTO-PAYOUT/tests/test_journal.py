@@ -0,0 +1,68 @@
+import itertools
+import sqlite3
+
+
+def payment(address, amount):
+    return {'wallet_address': address, 'amount': amount, 'sols': None}
+
+
+def test_journal_resume_state_transitions(qap, tmp_path, monkeypatch):
+    journal = qap.PayoutJournal(str(tmp_path / "journal.db"))
+    addresses = [f"ADDRESS{i}" for i in range(5)]
+    planned = [payment(address, 10 + i) for i, address in enumerate(addresses)]
+    run_id = journal.start_run("SOURCE", "pipelined", planned)
+    assert [p['journal_id'] for p in planned] == [0, 1, 2, 3, 4]
+    journal.record(run_id, 0, "confirmed", "hconfirmed", 100)
+    journal.record(run_id, 1, "submitted", "hfound", 101)
+    journal.record(run_id, 2, "submitted", "hmissing", 102)
+    journal.record(run_id, 3, "submitting", None, 103)
+    journal.flush()
+    assert journal.latest_unfinished_run()[0] == run_id
+
+    sender = qap.QUSSender({'seed': "x", 'address': "SOURCE"}, [], mode="pipelined", journal=journal, journal_run_id=run_id)
+    monkeypatch.setattr(qap, "wait_for_tick_confirmation", lambda *args, **kwargs: None)
+    monkeypatch.setattr(sender, "verify_specific_transaction", lambda tx_hash, tick, **kwargs: tx_hash == "hfound")
+    pending = sender.resume_from_journal()
+
+    assert [p['wallet_address'] for p in sender.resumed_successful] == addresses[:2]
+    assert [p['wallet_address'] for p in pending] == [addresses[2], addresses[4]]
+    assert [p['wallet_address'] for p in sender.unresolved_transactions] == [addresses[3]]
+    states = {row['journal_id']: row['state'] for row in journal.load_payments(run_id)}
+    assert states == {0: "confirmed", 1: "confirmed", 2: "failed", 3: "submitting", 4: "planned"}
+    journal.finish_run(run_id)
+    assert journal.latest_unfinished_run() is None
+    journal.close()
+
+
+def test_pipeline_commits_the_submitting_intent_before_sending(qap, tmp_path, monkeypatch):
+    path = str(tmp_path / "journal.db")
+    journal = qap.PayoutJournal(path, commit_every=1000, commit_interval=1000)
+    payments = [payment(f"ADDRESS{i}", 5) for i in range(4)]
+    ticks = itertools.count(1000)
+    oracle = qap.TickOracle(fetch=lambda: next(ticks), poll_interval=0.005)
+    monkeypatch.setattr(qap, "PIPELINE_POLL_INTERVAL", 0.01)
+    sender = qap.QUSSender({'seed': "x", 'address': "SOURCE"}, payments, mode="pipelined", tick_oracle=oracle,
+                           journal=journal)
+    sender.journal_run_id = journal.start_run("SOURCE", "pipelined", payments)
+    seen_by_another_process = []
+
+    def send_transaction(target_address, amount, tick):
+        with sqlite3.connect(path) as other:
+            seen_by_another_process.append(other.execute(
+                "SELECT state, tick FROM payments WHERE wallet_address = ?", (target_address,)).fetchone())
+        return True, f"hash{target_address}"
+
+    monkeypatch.setattr(sender, "send_transaction", send_transaction)
+    monkeypatch.setattr(sender, "verify_specific_transaction", lambda tx_hash, tick: tx_hash != "hashADDRESS1")
+    try:
+        sender.process_pipelined([])
+    finally:
+        oracle.stop()
+    journal.flush()
+
+    assert [state for state, _ in seen_by_another_process] == ["submitting"] * 4
+    rows = journal.load_payments(sender.journal_run_id)
+    assert [(row['state'], row['tx_hash']) for row in rows] == [
+        ("confirmed", "hashADDRESS0"), ("failed", "hashADDRESS1"), ("confirmed", "hashADDRESS2"), ("confirmed", "hashADDRESS3")]
+    assert sorted(tick for _, tick in seen_by_another_process) == sorted(row['tick'] for row in rows)
+    journal.close()
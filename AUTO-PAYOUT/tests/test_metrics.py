@@ -0,0 +1,72 @@
+import urllib.request
+
+
+def test_registry_renders_prometheus_text(qap):
+    registry = qap.MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo counter", ("result",))
+    gauge = registry.gauge("demo_gauge", "Demo gauge", function=lambda: 2.5)
+    histogram = registry.histogram("demo_seconds", "Demo histogram", ("node",), (0.1, 1))
+    counter.inc(result="ok")
+    counter.inc(2, result="ok")
+    counter.inc(result='say "hi"')
+    histogram.observe(0.05, node="a")
+    histogram.observe(0.5, node="a")
+    histogram.observe(3, node="a")
+
+    text = registry.render()
+    assert counter.value(result="ok") == 3
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{result="ok"} 3' in text
+    assert 'demo_total{result="say \\"hi\\""} 1' in text
+    assert "demo_gauge 2.5" in text
+    assert 'demo_seconds_bucket{node="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{node="a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{node="a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{node="a"} 3' in text
+    assert text.endswith("\n")
+
+
+def test_throughput_meter_drops_events_outside_the_window(qap, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(qap.time, "time", lambda: now[0])
+    meter = qap.ThroughputMeter(window=30)
+    meter.mark()
+    meter.mark(2)
+    assert meter.per_minute() == 6.0
+    now[0] += 31
+    meter.mark()
+    assert meter.per_minute() == 2.0
+
+
+def test_serve_exposes_metrics_over_http(qap):
+    registry = qap.MetricsRegistry()
+    registry.counter("served_total", "Served counter").inc()
+    server = registry.serve(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(url + "/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert "served_total 1" in body
+        try:
+            urllib.request.urlopen(url + "/other", timeout=5)
+            raise AssertionError("expected a 404")
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_observe_cli_call_classifies_verification_answers(qap):
+    args = ['-seed', 'x', '-nodeip', 'n', '-checktxontick', '100', 'hash']
+    before = {result: qap.VERIFICATIONS.value(result=result, source="cli")
+              for result in ("confirmed", "not_found", "pending", "unexpected")}
+    qap.observe_cli_call("n", args, "Found tx ... Received end response message", 0.1, "ok")
+    qap.observe_cli_call("n", args, "Can NOT find tx", 0.1, "ok")
+    qap.observe_cli_call("n", args, "Please wait a bit more", 0.1, "ok")
+    qap.observe_cli_call("n", args, "garbage", 0.1, "ok")
+    qap.observe_cli_call("n", args, "", 0.1, "error")
+    for result in before:
+        assert qap.VERIFICATIONS.value(result=result, source="cli") == before[result] + 1
+    assert qap.cli_command(args) == "checktxontick"
+    assert qap.cli_command(['-seed', 'x']) == "unknown"
@@ -0,0 +1,120 @@
+import itertools
+import os
+import threading
+
+import fake_qubic_cli
+
+
+def test_pipelined_run_gives_every_payment_its_own_tick(qap, monkeypatch):
+    """process_pipelined against a stubbed network whose tick moves on at every poll"""
+    ticks = itertools.count(1000)
+    oracle = qap.TickOracle(fetch=lambda: next(ticks), poll_interval=0.005)
+    monkeypatch.setattr(qap, "PIPELINE_POLL_INTERVAL", 0.01)
+    payments = [{'wallet_address': f"ADDRESS{i}", 'amount': 10 + i, 'sols': None} for i in range(8)]
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, payments, mode="pipelined", tick_oracle=oracle)
+
+    lock = threading.Lock()
+    sent = {}
+    outstanding = [0, 0]  # sent and not yet verified, most at once
+
+    def send_transaction(target_address, amount, tick):
+        with lock:
+            sent[target_address] = tick
+            outstanding[0] += 1
+            outstanding[1] = max(outstanding)
+        return True, f"hash{target_address}"
+
+    def verify_specific_transaction(tx_hash, tick):
+        with lock:
+            outstanding[0] -= 1
+        return tx_hash != "hashADDRESS3"
+
+    monkeypatch.setattr(sender, "send_transaction", send_transaction)
+    monkeypatch.setattr(sender, "verify_specific_transaction", verify_specific_transaction)
+    successful = []
+    try:
+        sender.process_pipelined(successful, window=3)
+    finally:
+        oracle.stop()
+
+    assert sorted(r['wallet_address'] for r in successful) == sorted(p['wallet_address'] for p in payments if p['wallet_address'] != "ADDRESS3")
+    assert [r['wallet_address'] for r in sender.failed_transactions] == ["ADDRESS3"]
+    assert len(set(sent.values())) == len(payments)
+    assert all(r['tick'] == sent[r['wallet_address']] and r['tx_hash'] == f"hash{r['wallet_address']}" for r in successful)
+    assert outstanding == [0, 3]
+
+
+def test_batched_run_reports_every_payment_against_its_batch(qap, monkeypatch):
+    ticks = itertools.count(1000)
+    oracle = qap.TickOracle(fetch=lambda: next(ticks), poll_interval=0.005)
+    monkeypatch.setattr(qap, "PIPELINE_POLL_INTERVAL", 0.01)
+    payments = [{'wallet_address': f"ADDRESS{i % 30}", 'amount': 1, 'sols': None} for i in range(40)]
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, payments, mode="batched", tick_oracle=oracle)
+    batches = []
+
+    def send_many_transaction(recipients, tick):
+        batches.append(recipients)
+        return True, f"batch{len(batches)}", tick
+
+    monkeypatch.setattr(sender, "send_many_transaction", send_many_transaction)
+    monkeypatch.setattr(sender, "verify_specific_transaction", lambda tx_hash, tick: tx_hash != "batch2")
+    successful = []
+    try:
+        sender.process_batched(successful)
+    finally:
+        oracle.stop()
+
+    assert [len(batch) for batch in batches] == [15, 15]
+    assert sum(r['amount'] for batch in batches for r in batch) == 40
+    assert len(successful) + len(sender.failed_transactions) == len(payments)
+    assert {r['tx_hash'] for r in sender.failed_transactions} == {"batch2"}
+    batch_of = {r['wallet_address']: f"batch{n + 1}" for n, batch in enumerate(batches) for r in batch}
+    assert all(r['tx_hash'] == batch_of[r['wallet_address']] for r in successful + sender.failed_transactions)
+
+
+def test_pipelined_run_end_to_end(qap, identities, fake_network, tmp_path):
+    wallet, state_dir = fake_network
+    payments = [{'wallet_address': address, 'amount': 10 * (i + 1), 'sols': None} for i, address in enumerate(identities(6))]
+    sender = qap.QUSSender(wallet, payments, mode="pipelined")
+    sender.run()
+
+    assert sender.failed_transactions == []
+    report = (tmp_path / "transaction_report.txt").read_text()
+    assert "Total successful transactions: 6" in report
+    for payment in payments:
+        assert f"Recipient Address: {payment['wallet_address']}" in report
+
+    # Every payment was included exactly once, each on its own tick
+    included = [fake_qubic_cli.read_transaction(str(state_dir), tx_hash) for tx_hash in os.listdir(state_dir / "txs")]
+    assert len(included) == len(payments)
+    assert all(tx["included"] for tx in included)
+    assert len({tx["tick"] for tx in included}) == len(payments)
+
+
+def test_multi_wallet_run_pays_from_every_wallet(qap, identities, fake_network, tmp_path):
+    wallet, state_dir = fake_network
+    wallets = [wallet, {'seed': "b" * 55, 'address': qap.public_key_to_identity(bytes([2]) * 32)}]
+    payments = [{'wallet_address': address, 'amount': 10 * (i + 1), 'sols': None} for i, address in enumerate(identities(8))]
+    sender = qap.MultiWalletSender(wallets, payments, mode="pipelined")
+    sender.run()
+
+    assert sender.failed_transactions == []
+    assert [len(s.payment_data) for s in sender.senders] == [4, 4]
+    report = (tmp_path / "transaction_report.txt").read_text()
+    assert "Total successful transactions: 8" in report
+    included = [fake_qubic_cli.read_transaction(str(state_dir), tx_hash) for tx_hash in os.listdir(state_dir / "txs")]
+    assert len(included) == len(payments) and all(tx["included"] for tx in included)
+    for source in wallets:
+        assert report.count(f"Source Wallet: {source['address']}") == 4
+
+
+def test_pipelined_run_stops_when_the_balance_runs_out(qap, identities, fake_network):
+    wallet, state_dir = fake_network  # the wallet holds 1000 QU
+    payments = [{'wallet_address': address, 'amount': 300, 'sols': None} for address in identities(5)]
+    sender = qap.QUSSender(wallet, payments, mode="pipelined")
+    sender.run()
+
+    assert len(sender.failed_transactions) == 2
+    assert all(record['error'] == "insufficient balance" for record in sender.failed_transactions)
+    included = [fake_qubic_cli.read_transaction(str(state_dir), tx_hash) for tx_hash in os.listdir(state_dir / "txs")]
+    assert len(included) == 3 and all(tx["included"] for tx in included)
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+
+SENT = "Transaction has been sent!\nTxHash: {}\n"
+
+
+@pytest.fixture
+def multi_sender(qap):
+    """Sender over nodes a, b, c (fastest first) whose qubic-cli calls are answered by self.answers[node]"""
+    pool = qap.NodePool(["a", "b", "c"], probe=lambda node: True)
+    for node, latency in (("a", 0.01), ("b", 0.02), ("c", 0.03)):
+        pool.record_success(node, latency)
+    sender = qap.QUSSender({'seed': "seed", 'address': "SOURCE"}, [], node_pool=pool)
+    sender.cli_calls = []
+    sender.answers = {}
+
+    def run_cli(node, args, timeout=None):
+        sender.cli_calls.append(node)
+        delay, stdout, stderr = sender.answers[node]
+        time.sleep(delay)
+        return stdout, stderr
+
+    sender.run_cli = run_cli
+    try:
+        yield sender
+    finally:
+        sender.close_broadcasts()
+
+
+def test_broadcast_collapses_acknowledgements_by_hash(qap, multi_sender):
+    multi_sender.answers = {"a": (0.0, SENT.format("abc"), ""), "b": (0.1, SENT.format("abc"), ""), "c": (0.0, "", "")}
+    assert multi_sender._broadcast_executor is None
+    assert multi_sender.send_transaction_multi("TARGET", 5, 100, fanout=2) == (True, "abc")
+    assert multi_sender._broadcast_executor is not None
+    multi_sender.close_broadcasts()  # waits for the late copy on b
+    assert multi_sender._broadcast_executor is None
+    assert multi_sender.tx_acks == {"abc": {"a", "b"}}
+    assert sorted(multi_sender.cli_calls) == ["a", "b"]
+
+
+def test_hedged_adds_a_node_only_after_the_hedge_delay(qap, multi_sender):
+    multi_sender.answers = {"a": (0.3, SENT.format("abc"), ""), "b": (0.0, SENT.format("abc"), ""), "c": (0.0, SENT.format("abc"), "")}
+    started = time.time()
+    assert multi_sender.send_transaction_multi("TARGET", 5, 100, hedged=True, fanout=3) == (True, "abc")
+    assert time.time() - started < 0.3  # b answered before a did
+    assert multi_sender.cli_calls == ["a", "b"]
+
+    multi_sender.cli_calls.clear()
+    multi_sender.answers["a"] = (0.0, SENT.format("def"), "")
+    assert multi_sender.send_transaction_multi("TARGET", 5, 101, hedged=True, fanout=3) == (True, "def")
+    assert multi_sender.cli_calls == ["a"]
+
+
+def test_multi_submission_falls_back_to_a_single_send(qap, multi_sender, monkeypatch):
+    multi_sender.answers = {node: (0.0, "", "Failed to connect") for node in "abc"}
+    fallback = []
+    monkeypatch.setattr(multi_sender, "send_transaction", lambda *args: fallback.append(args) or (False, None))
+    assert multi_sender.send_transaction_multi("TARGET", 5, 100, fanout=3) == (False, None)
+    assert fallback == [("TARGET", 5, 100)]
+
+
+def test_single_submission_never_starts_the_broadcast_executor(qap, multi_sender, monkeypatch):
+    monkeypatch.setattr(multi_sender, "submission_mode", "single")
+    monkeypatch.setattr(multi_sender, "send_transaction", lambda *args: (True, "abc"))
+    assert multi_sender.submit_transaction("TARGET", 5, 100) == (True, "abc")
+    assert multi_sender._broadcast_executor is None